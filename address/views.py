@@ -22,5 +22,5 @@ class AddressDetailsView(RetrieveUpdateDestroyAPIView):
     serializer_class = AddressSerializer
 
     def get_object(self):
-        address = get_object_or_404(Address, user=self.request.user)
+        address = get_object_or_404(Address, user_id=self.request.user.id)
         return address
@@ -0,0 +1,86 @@
+from decimal import Decimal
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import DecimalField, ExpressionWrapper, F
+
+from cart.models import Cart, CartItem
+from products.cache import get_pricing_version
+
+CENTS = Decimal("0.01")
+MONEY = DecimalField(max_digits=13, decimal_places=2)
+
+
+def _money(value) -> str:
+    return str(Decimal(value).quantize(CENTS))
+
+
+def cart_lines(cart: Cart):
+    """
+    Price every item of ``cart`` in one query, with line totals computed by
+    the database from the discounted ``Product.final_price``.
+    """
+    return (
+        CartItem.objects.filter(cart_id=cart.id)
+        .annotate(
+            line_total=ExpressionWrapper(
+                F("product__final_price") * F("quantity"), output_field=MONEY
+            ),
+        )
+        .values(
+            "product_id",
+            "quantity",
+            "line_total",
+            slug=F("product__slug"),
+            name=F("product__name"),
+            unit_price=F("product__price"),
+            discount=F("product__discount"),
+            final_unit_price=F("product__final_price"),
+        )
+        .order_by("id")
+    )
+
+
+def price_cart(cart: Cart) -> dict:
+    items = []
+    subtotal = total = Decimal(0)
+    quantity = 0
+
+    for line in cart_lines(cart):
+        subtotal += line["unit_price"] * line["quantity"]
+        total += line["line_total"]
+        quantity += line["quantity"]
+        items.append(
+            {
+                "product": line["slug"],
+                "name": line["name"],
+                "quantity": line["quantity"],
+                "unit_price": _money(line["unit_price"]),
+                "discount": line["discount"],
+                "final_unit_price": _money(line["final_unit_price"]),
+                "total": _money(line["line_total"]),
+            }
+        )
+
+    return {
+        "items": items,
+        "quantity": quantity,
+        "subtotal": _money(subtotal),
+        "discount_total": _money(subtotal - total),
+        "total": _money(total),
+    }
+
+
+def cart_cache_key(cart: Cart) -> str:
+    # Item writes bump the cart's updated_at and writes to the product fields
+    # a cart shows bump the pricing version, so either lands on a fresh key.
+    return f"cart:{cart.id}:{cart.updated_at.timestamp()}:{get_pricing_version()}"
+
+
+def cached_cart(cart: Cart) -> dict:
+    key = cart_cache_key(cart)
+    priced = cache.get(key)
+    if priced is None:
+        priced = price_cart(cart)
+        cache.set(key, priced, settings.CART_CACHE_TIMEOUT)
+    return priced
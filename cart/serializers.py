@@ -0,0 +1,10 @@
+from rest_framework import serializers
+
+
+class CartItemSerializer(serializers.Serializer):
+    product = serializers.CharField()
+    quantity = serializers.IntegerField(min_value=1, default=1)
+
+
+class CartItemUpdateSerializer(serializers.Serializer):
+    quantity = serializers.IntegerField(min_value=1)
@@ -0,0 +1,9 @@
+from django.urls import path
+
+from cart.views import CartItemCreateView, CartItemDetailView, CartView
+
+urlpatterns = [
+    path("cart/", CartView.as_view(), name="cart"),
+    path("cart/items/", CartItemCreateView.as_view(), name="cart_items"),
+    path("cart/items/<str:slug>/", CartItemDetailView.as_view(), name="cart_item"),
+]
@@ -0,0 +1,103 @@
+from django.db import transaction
+from django.shortcuts import get_object_or_404
+from rest_framework import serializers
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.views import APIView, Request, Response, status
+
+from cart.models import Cart, CartItem
+from cart.pricing import cached_cart
+from cart.serializers import CartItemSerializer, CartItemUpdateSerializer
+from products.models import Product
+from products.stock import available_stock
+
+
+def get_cart(request: Request) -> Cart:
+    cart, _ = Cart.objects.get_or_create(user_id=request.user.id)
+    return cart
+
+
+def check_stock(product_id: int, quantity: int, user_id: int) -> None:
+    # Stock held by other users' reservations cannot go into this cart.
+    available = available_stock([product_id], exclude_user_id=user_id)[product_id]
+    if quantity > available:
+        raise serializers.ValidationError(
+            {"quantity": [f"Only {max(available, 0)} items in stock."]}
+        )
+
+
+class CartView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request: Request) -> Response:
+        return Response(cached_cart(get_cart(request)), status.HTTP_200_OK)
+
+    def delete(self, request: Request) -> Response:
+        cart = get_cart(request)
+        with transaction.atomic():
+            CartItem.objects.filter(cart=cart).delete()
+            cart.save(update_fields=["updated_at"])
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class CartItemCreateView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request: Request) -> Response:
+        serializer = CartItemSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        quantity = serializer.validated_data["quantity"]
+
+        product = get_object_or_404(
+            Product.objects.only("id"),
+            slug=serializer.validated_data["product"],
+        )
+        cart = get_cart(request)
+
+        with transaction.atomic():
+            item, created = CartItem.objects.select_for_update().get_or_create(
+                cart=cart, product=product, defaults={"quantity": quantity}
+            )
+            if not created:
+                item.quantity += quantity
+            check_stock(product.id, item.quantity, request.user.id)
+            if not created:
+                item.save(update_fields=["quantity"])
+            cart.save(update_fields=["updated_at"])
+
+        return Response(cached_cart(cart), status.HTTP_201_CREATED)
+
+
+class CartItemDetailView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get_item(self, cart: Cart, slug: str) -> CartItem:
+        return get_object_or_404(
+            CartItem.objects.only("id", "quantity", "cart_id", "product_id"),
+            cart=cart,
+            product__slug=slug,
+        )
+
+    def patch(self, request: Request, slug: str) -> Response:
+        serializer = CartItemUpdateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        cart = get_cart(request)
+        item = self.get_item(cart, slug)
+        item.quantity = serializer.validated_data["quantity"]
+        check_stock(item.product_id, item.quantity, request.user.id)
+
+        with transaction.atomic():
+            item.save(update_fields=["quantity"])
+            cart.save(update_fields=["updated_at"])
+
+        return Response(cached_cart(cart), status.HTTP_200_OK)
+
+    def delete(self, request: Request, slug: str) -> Response:
+        cart = get_cart(request)
+        item = self.get_item(cart, slug)
+
+        with transaction.atomic():
+            item.delete()
+            cart.save(update_fields=["updated_at"])
+
+        return Response(status=status.HTTP_204_NO_CONTENT)
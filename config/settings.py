@@ -39,11 +39,14 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     "rest_framework",
     "login",
     "users",
     "address",
     "products",
+    "cart",
+    "orders",
 ]
 
 MIDDLEWARE = [
@@ -108,6 +111,38 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Password hashing
+# https://docs.djangoproject.com/en/4.2/topics/auth/passwords/
+
+PASSWORD_HASHER_CHOICES = {
+    "argon2": "login.hashers.Argon2PasswordHasher",
+    "bcrypt": "login.hashers.BCryptSHA256PasswordHasher",
+    "pbkdf2": "login.hashers.PBKDF2PasswordHasher",
+}
+
+PASSWORD_HASHER = os.getenv("PASSWORD_HASHER", "pbkdf2")
+
+# The first hasher hashes new passwords; the others still verify existing
+# hashes, which Django rehashes with the first one on the next login.
+PASSWORD_HASHERS = [
+    PASSWORD_HASHER_CHOICES[PASSWORD_HASHER],
+    *(
+        hasher
+        for name, hasher in PASSWORD_HASHER_CHOICES.items()
+        if name != PASSWORD_HASHER
+    ),
+]
+
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", os.cpu_count() or 1))
+
+PBKDF2_ITERATIONS = int(os.getenv("PBKDF2_ITERATIONS", 600_000))
+
+ARGON2_TIME_COST = int(os.getenv("ARGON2_TIME_COST", 2))
+
+ARGON2_MEMORY_COST = int(os.getenv("ARGON2_MEMORY_COST", 102_400))
+
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", 12))
+
 # Internationalization
 # https://docs.djangoproject.com/en/4.2/topics/i18n/
 
@@ -124,6 +159,10 @@ USE_TZ = True
 
 STATIC_URL = "static/"
 
+MEDIA_URL = "/media/"
+
+MEDIA_ROOT = BASE_DIR / "media"
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/4.2/ref/settings/#default-auto-field
 
@@ -139,11 +178,33 @@ SIMPLE_JWT = {
     "AUTH_HEADER_TYPES": ("Bearer",),
     "AUTH_HEADER_NAME": "HTTP_AUTHORIZATION",
     "AUTH_TOKEN_CLASSES": ("rest_framework_simplejwt.tokens.AccessToken",),
+    "TOKEN_USER_CLASS": "login.authentication.ClaimsUser",
+}
+
+JWT_USER_CACHE_TTL = int(os.getenv("JWT_USER_CACHE_TTL", 0))
+
+JWT_REVOCATION_REFRESH_INTERVAL = float(
+    os.getenv("JWT_REVOCATION_REFRESH_INTERVAL", 5)
+)
+
+JWT_REVOCATION_BLOOM_CAPACITY = int(
+    os.getenv("JWT_REVOCATION_BLOOM_CAPACITY", 100_000)
+)
+
+LOGIN_THROTTLE_STORE = os.getenv("LOGIN_THROTTLE_STORE", "db")
+
+LOGIN_THROTTLE_RATES = {
+    "login_ip": os.getenv("LOGIN_THROTTLE_IP_RATE", "30/min"),
+    "login_username": os.getenv("LOGIN_THROTTLE_USERNAME_RATE", "5/min"),
+    "register_ip": os.getenv("REGISTER_THROTTLE_IP_RATE", "10/hour"),
 }
 
 REST_FRAMEWORK = {
+    # Reverse proxies in front of the app; client IPs are taken from
+    # X-Forwarded-For only past this many hops.
+    "NUM_PROXIES": int(os.getenv("NUM_PROXIES", 0)),
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "login.authentication.StatelessJWTAuthentication",
     ),
     "DEFAULT_PARSER_CLASSES": [
         "rest_framework.parsers.JSONParser",
@@ -152,6 +213,48 @@ REST_FRAMEWORK = {
     ],
 }
 
+CACHES = {
+    "default": {
+        "BACKEND": os.getenv(
+            "CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"
+        ),
+        "LOCATION": os.getenv("CACHE_LOCATION", ""),
+    }
+}
+
+PRODUCTS_CACHE_TIMEOUT = int(os.getenv("PRODUCTS_CACHE_TIMEOUT", 300))
+
+PRODUCTS_PAGE_SIZE = int(os.getenv("PRODUCTS_PAGE_SIZE", 20))
+
+PRODUCTS_PRICE_BUCKETS = [50, 100, 200, 500]
+
+PRODUCTS_SEARCH_CONFIG = os.getenv("PRODUCTS_SEARCH_CONFIG", "simple")
+
+USERS_PAGE_SIZE = int(os.getenv("USERS_PAGE_SIZE", 50))
+
+PROFILE_CACHE_TTL = int(os.getenv("PROFILE_CACHE_TTL", 0))
+
+CART_CACHE_TIMEOUT = int(os.getenv("CART_CACHE_TIMEOUT", 300))
+
+STOCK_RESERVATION_TTL = int(os.getenv("STOCK_RESERVATION_TTL", 900))
+
+STOCK_RESERVATION_MAX_QUANTITY = int(os.getenv("STOCK_RESERVATION_MAX_QUANTITY", 10))
+
+STOCK_RESERVATION_MAX_ACTIVE = int(os.getenv("STOCK_RESERVATION_MAX_ACTIVE", 20))
+
+BACKGROUND_TASK_WORKERS = int(os.getenv("BACKGROUND_TASK_WORKERS", 4))
+
+BACKGROUND_TASKS_EAGER = os.getenv("BACKGROUND_TASKS_EAGER", "false").lower() == "true"
+
+IMAGE_STORAGE = {
+    "BACKEND": os.getenv(
+        "IMAGE_STORAGE_BACKEND", "utils.image_storage.CloudinaryImageStorage"
+    ),
+}
+
+IMAGE_VARIANTS = {"thumbnail": 160, "card": 480, "full": 1200}
+
+IMAGE_VARIANT_QUALITY = 80
 
 CLOUDINARY = {
     "cloud_name": os.getenv("CLOUD_NAME"),
@@ -0,0 +1,75 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.functional import cached_property
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.settings import api_settings
+
+from login.revocation import revocation_list
+
+
+def user_cache_key(user_id) -> str:
+    return f"login:user:{user_id}"
+
+
+class ClaimsUser(TokenUser):
+    """
+    User built from the claims ``CustomJWTSerializer`` puts in the token.
+    """
+
+    @cached_property
+    def email(self):
+        return self.token.get("email", "")
+
+
+class StatelessJWTAuthentication(JWTAuthentication):
+    """
+    Authenticate safe requests from the token claims alone, skipping the
+    ``User`` query, and load the real user only for requests that write.
+
+    With ``JWT_USER_CACHE_TTL`` set, write requests read the user from the
+    cache for that many seconds; saving or deleting a user evicts it.
+    Revoked tokens are rejected on every request.
+    """
+
+    def authenticate(self, request):
+        header = self.get_header(request)
+        if header is None:
+            return None
+
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+
+        validated_token = self.get_validated_token(raw_token)
+
+        if request.method in SAFE_METHODS:
+            return self.get_token_user(validated_token), validated_token
+        return self.get_user(validated_token), validated_token
+
+    def get_validated_token(self, raw_token):
+        validated_token = super().get_validated_token(raw_token)
+        if revocation_list.is_revoked(validated_token):
+            raise InvalidToken("Token has been revoked.")
+        return validated_token
+
+    def get_token_user(self, validated_token):
+        if api_settings.USER_ID_CLAIM not in validated_token:
+            raise InvalidToken("Token contained no recognizable user identification")
+        return api_settings.TOKEN_USER_CLASS(validated_token)
+
+    def get_user(self, validated_token):
+        timeout = settings.JWT_USER_CACHE_TTL
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        if not timeout or user_id is None:
+            return super().get_user(validated_token)
+
+        key = user_cache_key(user_id)
+        user = cache.get(key)
+        if user is None:
+            # Inactive users are rejected here and so never cached.
+            user = super().get_user(validated_token)
+            cache.set(key, user, timeout)
+        return user
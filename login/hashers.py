@@ -0,0 +1,72 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth import hashers
+
+_executor = None
+_executor_lock = threading.Lock()
+_local = threading.local()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.PASSWORD_HASH_WORKERS,
+                thread_name_prefix="password-hash",
+            )
+    return _executor
+
+
+def _run_marked(func, args):
+    _local.in_pool = True
+    try:
+        return func(*args)
+    finally:
+        _local.in_pool = False
+
+
+def run_in_hash_pool(func, *args):
+    """
+    Run ``func`` on the bounded password hashing pool and wait for it.
+
+    However many requests log in at once, at most ``PASSWORD_HASH_WORKERS``
+    hashes run concurrently; the rest queue instead of pinning every core.
+    """
+    if getattr(_local, "in_pool", False):
+        return func(*args)
+    return _get_executor().submit(_run_marked, func, args).result()
+
+
+class BoundedHashingMixin:
+    def encode(self, password, salt, *args):
+        return run_in_hash_pool(super().encode, password, salt, *args)
+
+    def verify(self, password, encoded):
+        return run_in_hash_pool(super().verify, password, encoded)
+
+
+class PBKDF2PasswordHasher(BoundedHashingMixin, hashers.PBKDF2PasswordHasher):
+    @property
+    def iterations(self):
+        return settings.PBKDF2_ITERATIONS
+
+
+class Argon2PasswordHasher(BoundedHashingMixin, hashers.Argon2PasswordHasher):
+    @property
+    def time_cost(self):
+        return settings.ARGON2_TIME_COST
+
+    @property
+    def memory_cost(self):
+        return settings.ARGON2_MEMORY_COST
+
+
+class BCryptSHA256PasswordHasher(
+    BoundedHashingMixin, hashers.BCryptSHA256PasswordHasher
+):
+    @property
+    def rounds(self):
+        return settings.BCRYPT_ROUNDS
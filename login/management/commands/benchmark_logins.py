@@ -0,0 +1,72 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils.module_loading import import_string
+
+PASSWORD = "benchmark-password"
+SECRET_FIELDS = ("algorithm", "salt", "hash", "checksum")
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure password verifications per second, the CPU cost of a login, "
+        "for each configured hasher."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--hashers",
+            nargs="+",
+            choices=list(settings.PASSWORD_HASHER_CHOICES),
+            default=list(settings.PASSWORD_HASHER_CHOICES),
+        )
+        parser.add_argument("--logins", type=int, default=50)
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=settings.PASSWORD_HASH_WORKERS * 2,
+            help="Simultaneous logins; the hash pool still bounds the work.",
+        )
+
+    def handle(self, *args, **options):
+        cores = min(settings.PASSWORD_HASH_WORKERS, os.cpu_count() or 1)
+        self.stdout.write(
+            f"{options['logins']} logins, {options['concurrency']} at a time, "
+            f"{settings.PASSWORD_HASH_WORKERS} hash workers on {cores} cores."
+        )
+
+        for name in options["hashers"]:
+            hasher = import_string(settings.PASSWORD_HASHER_CHOICES[name])()
+            try:
+                encoded = hasher.encode(PASSWORD, hasher.salt())
+            except ValueError as error:
+                self.stdout.write(f"{name}: skipped ({error})")
+                continue
+
+            started = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=options["concurrency"]) as clients:
+                results = list(
+                    clients.map(
+                        lambda _: hasher.verify(PASSWORD, encoded),
+                        range(options["logins"]),
+                    )
+                )
+            elapsed = time.perf_counter() - started
+
+            if not all(results):
+                self.stderr.write(f"{name}: verification failed")
+                continue
+
+            rate = options["logins"] / elapsed
+            parameters = ", ".join(
+                f"{key} {value}"
+                for key, value in hasher.safe_summary(encoded).items()
+                if key not in SECRET_FIELDS
+            )
+            self.stdout.write(
+                f"{name}: {rate:.1f} logins/s, {rate / cores:.1f} logins/s per core "
+                f"({parameters})"
+            )
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from login.models import RevokedToken
+
+
+class Command(BaseCommand):
+    help = "Delete revocations of tokens that have expired anyway."
+
+    def handle(self, *args, **options):
+        deleted, _ = RevokedToken.objects.filter(
+            expires_at__lte=timezone.now()
+        ).delete()
+        self.stdout.write(f"Deleted {deleted} expired revocations.")
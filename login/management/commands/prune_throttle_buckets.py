@@ -0,0 +1,20 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from login.models import ThrottleBucket
+
+
+class Command(BaseCommand):
+    help = "Delete throttle buckets that have been idle long enough to be full."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--max-age", type=int, default=86400, help="Idle seconds before pruning."
+        )
+
+    def handle(self, *args, **options):
+        deleted, _ = ThrottleBucket.objects.filter(
+            updated_at__lt=time.time() - options["max_age"]
+        ).delete()
+        self.stdout.write(f"Deleted {deleted} idle throttle buckets.")
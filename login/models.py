@@ -1,3 +1,21 @@
 from django.db import models
 
-# Create your models here.
+from users.models import User
+
+
+class RevokedToken(models.Model):
+    """
+    A revoked token, by ``jti``, or when ``jti`` is null every token of
+    ``user`` issued before ``revoked_at``.
+    """
+
+    jti = models.CharField(max_length=255, unique=True, null=True)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, null=True)
+    revoked_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    expires_at = models.DateTimeField(db_index=True)
+
+
+class ThrottleBucket(models.Model):
+    key = models.CharField(max_length=255, unique=True)
+    tokens = models.FloatField()
+    updated_at = models.FloatField(db_index=True)
@@ -0,0 +1,140 @@
+import threading
+import time
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.conf import settings
+from django.utils import timezone
+from rest_framework_simplejwt.settings import api_settings
+
+from login.models import RevokedToken
+from utils.bloom import BloomFilter
+
+BLOOM_ERROR_RATE = 0.001
+
+# Rows can commit out of revoked_at order, so every sync re-reads this much
+# of the already seen history instead of missing late commits.
+SYNC_OVERLAP = timedelta(seconds=60)
+
+
+def _from_timestamp(timestamp: float) -> datetime:
+    return datetime.fromtimestamp(timestamp, tz=dt_timezone.utc)
+
+
+class RevocationList:
+    """
+    Per-process view of ``RevokedToken`` for the authentication hot path.
+
+    Revoked ``jti`` values live in a bloom filter and per-user revocations
+    in a dict, both synced incrementally from the table at most every
+    ``JWT_REVOCATION_REFRESH_INTERVAL`` seconds. Only a positive hit is
+    confirmed against the database, so a token that was never revoked
+    costs no query.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.clear()
+
+    def clear(self) -> None:
+        self._bloom = None
+        self._revoked_users = {}
+        self._synced_until = None
+        self._synced_at = None
+
+    def _rebuild_due(self) -> bool:
+        return self._bloom is None or self._bloom.count > self._bloom.capacity
+
+    def sync(self, force: bool = False) -> None:
+        now = time.monotonic()
+        interval = settings.JWT_REVOCATION_REFRESH_INTERVAL
+        if (
+            not force
+            and self._synced_at is not None
+            and now - self._synced_at < interval
+        ):
+            return
+
+        with self._lock:
+            rows = RevokedToken.objects.filter(expires_at__gt=timezone.now())
+            if self._rebuild_due():
+                capacity = max(settings.JWT_REVOCATION_BLOOM_CAPACITY, 2 * rows.count())
+                self._bloom = BloomFilter(capacity, BLOOM_ERROR_RATE)
+                self._revoked_users = {}
+            elif self._synced_until is not None:
+                rows = rows.filter(revoked_at__gt=self._synced_until - SYNC_OVERLAP)
+
+            for jti, user_id, revoked_at in rows.values_list(
+                "jti", "user_id", "revoked_at"
+            ):
+                self._add(jti, user_id, revoked_at)
+                if self._synced_until is None or revoked_at > self._synced_until:
+                    self._synced_until = revoked_at
+            self._synced_at = now
+
+    def _add(self, jti, user_id, revoked_at: datetime) -> None:
+        if jti is not None:
+            # Re-read rows are already in the filter; skipping them keeps
+            # the item count, and so the rebuild trigger, accurate.
+            if jti not in self._bloom:
+                self._bloom.add(jti)
+            return
+
+        # Tokens with a whole-second "iat" from the revocation's own second
+        # are revoked too; logins get a sub-second one to stay apart.
+        cutoff = revoked_at.timestamp()
+        self._revoked_users[user_id] = max(cutoff, self._revoked_users.get(user_id, 0))
+
+    def add(self, jti=None, user_id=None, revoked_at: datetime = None) -> None:
+        self.sync()
+        with self._lock:
+            if self._rebuild_due():
+                self._synced_at = None
+            else:
+                self._add(jti, user_id, revoked_at or timezone.now())
+
+    def is_revoked(self, token) -> bool:
+        self.sync()
+
+        user_id = token.get(api_settings.USER_ID_CLAIM)
+        issued_at = token.get("iat")
+        cutoff = self._revoked_users.get(user_id)
+        if cutoff is not None and issued_at is not None and issued_at < cutoff:
+            if RevokedToken.objects.filter(
+                jti__isnull=True,
+                user_id=user_id,
+                revoked_at__gt=_from_timestamp(issued_at),
+            ).exists():
+                return True
+
+        jti = token.get(api_settings.JTI_CLAIM)
+        if jti is not None and jti in self._bloom:
+            return RevokedToken.objects.filter(jti=jti).exists()
+        return False
+
+
+revocation_list = RevocationList()
+
+
+def revoke_token(token) -> None:
+    jti = token[api_settings.JTI_CLAIM]
+    RevokedToken.objects.get_or_create(
+        jti=jti,
+        defaults={
+            "user_id": token.get(api_settings.USER_ID_CLAIM),
+            "expires_at": _from_timestamp(token["exp"]),
+        },
+    )
+    revocation_list.add(jti=jti)
+
+
+def revoke_user_tokens(user_id: int) -> None:
+    """
+    Revoke every access and refresh token issued to ``user_id`` so far.
+    """
+    lifetime = max(
+        api_settings.ACCESS_TOKEN_LIFETIME, api_settings.REFRESH_TOKEN_LIFETIME
+    )
+    revoked = RevokedToken.objects.create(
+        user_id=user_id, expires_at=timezone.now() + lifetime
+    )
+    revocation_list.add(user_id=user_id, revoked_at=revoked.revoked_at)
@@ -1,4 +1,12 @@
-from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from rest_framework import serializers
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+from rest_framework_simplejwt.serializers import (
+    TokenObtainPairSerializer,
+    TokenRefreshSerializer,
+)
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+from login.revocation import revocation_list
 from users.models import User
 
 
@@ -6,9 +14,37 @@ class CustomJWTSerializer(TokenObtainPairSerializer):
     @classmethod
     def get_token(cls, user: User):
         token = super().get_token(user)
+        # A sub-second "iat", copied to the access token, keeps a login right
+        # after a revocation apart from the tokens it revoked.
+        token["iat"] = token.current_time.timestamp()
         token["is_superuser"] = user.is_superuser
+        token["is_staff"] = user.is_staff
         token["email"] = user.email
         token["username"] = user.username
         token["id"] = user.id
 
         return token
+
+
+class CustomTokenRefreshSerializer(TokenRefreshSerializer):
+    def validate(self, attrs):
+        # Access tokens minted from a refresh token get a fresh "iat", so a
+        # revoked refresh token must be refused before it can mint one.
+        if revocation_list.is_revoked(RefreshToken(attrs["refresh"])):
+            raise InvalidToken("Token has been revoked.")
+        return super().validate(attrs)
+
+
+class LogoutSerializer(serializers.Serializer):
+    refresh = serializers.CharField(required=False)
+
+    def validate_refresh(self, value: str):
+        try:
+            refresh = RefreshToken(value)
+        except TokenError as error:
+            raise serializers.ValidationError(error.args[0])
+
+        user_id = self.context["request"].user.id
+        if refresh.get(api_settings.USER_ID_CLAIM) != user_id:
+            raise serializers.ValidationError("Token belongs to another user.")
+        return refresh
@@ -0,0 +1,48 @@
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import receiver
+
+from login.authentication import user_cache_key
+from login.revocation import revoke_user_tokens
+from users.models import User
+
+# Claims that safe requests trust without loading the user.
+PRIVILEGE_FIELDS = ("is_active", "is_staff", "is_superuser")
+
+
+@receiver([post_save, post_delete], sender=User)
+def evict_cached_user(sender, instance: User, **kwargs):
+    cache.delete(user_cache_key(instance.id))
+
+
+@receiver(post_save, sender=User)
+def revoke_tokens_on_password_change(sender, instance: User, created, **kwargs):
+    # set_password() leaves the raw password on the instance until save()
+    # has sent post_save.
+    if not created and instance._password is not None:
+        revoke_user_tokens(instance.id)
+
+
+def _privileges(instance: User) -> dict:
+    # Deferred fields are left out instead of being loaded.
+    return {
+        field: instance.__dict__[field]
+        for field in PRIVILEGE_FIELDS
+        if field in instance.__dict__
+    }
+
+
+@receiver(post_init, sender=User)
+def remember_privileges(sender, instance: User, **kwargs):
+    instance._saved_privileges = _privileges(instance)
+
+
+@receiver(post_save, sender=User)
+def revoke_tokens_on_privilege_change(sender, instance: User, created, **kwargs):
+    privileges = _privileges(instance)
+    # A field loaded only after the instance was built counts as changed.
+    changed = privileges != instance._saved_privileges
+    instance._saved_privileges = privileges
+    # A password change has already revoked everything issued so far.
+    if not created and changed and instance._password is None:
+        revoke_user_tokens(instance.id)
@@ -0,0 +1,171 @@
+import threading
+import time
+from collections import OrderedDict
+from itertools import islice
+
+from django.conf import settings
+from django.db.models import F, Value
+from django.db.models.functions import Least
+from django.db.models.lookups import GreaterThanOrEqual
+from rest_framework.throttling import BaseThrottle
+
+from login.models import ThrottleBucket
+
+
+class LocalMemoryBucketStore:
+    """
+    Token buckets in a dict, shared by the threads of one process.
+
+    At most ``max_buckets`` are kept, least recently used first out.
+    """
+
+    max_buckets = 10_000
+    prune_scan = 16
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buckets = OrderedDict()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+
+    def consume(self, key: str, capacity: int, refill_rate: float) -> tuple:
+        now = time.monotonic()
+        # Each bucket keeps how long it takes to refill, since scopes with
+        # different rates share the dict.
+        full_after = capacity / refill_rate
+        with self._lock:
+            tokens, updated_at, _ = self._buckets.get(key, (capacity, now, None))
+            tokens = min(capacity, tokens + (now - updated_at) * refill_rate)
+
+            if tokens >= 1:
+                self._buckets[key] = (tokens - 1, now, full_after)
+                self._buckets.move_to_end(key)
+                self._prune(now)
+                return True, 0
+
+            self._buckets[key] = (tokens, now, full_after)
+            self._buckets.move_to_end(key)
+            return False, (1 - tokens) / refill_rate
+
+    def _prune(self, now: float) -> None:
+        overflow = len(self._buckets) - self.max_buckets
+        if overflow <= 0:
+            return
+
+        # Among the least recently used few, buckets that have had time to
+        # refill completely equal new ones and go first; the scan is bounded
+        # so a flood costs the same per request however many buckets exist.
+        oldest = list(islice(self._buckets.items(), self.prune_scan))
+        for key, (_, updated_at, full_after) in oldest:
+            if now - updated_at >= full_after:
+                del self._buckets[key]
+                overflow -= 1
+                if not overflow:
+                    return
+
+        # None of them refilled yet: the size cap wins.
+        for _ in range(overflow):
+            self._buckets.popitem(last=False)
+
+
+class DatabaseBucketStore:
+    """
+    Token buckets in the ``ThrottleBucket`` table, shared by every process.
+
+    Refill and take happen in one conditional UPDATE, so concurrent requests
+    can never spend the same token.
+    """
+
+    def clear(self) -> None:
+        ThrottleBucket.objects.all().delete()
+
+    def consume(self, key: str, capacity: int, refill_rate: float) -> tuple:
+        now = time.time()
+        ThrottleBucket.objects.bulk_create(
+            [ThrottleBucket(key=key, tokens=capacity, updated_at=now)],
+            ignore_conflicts=True,
+        )
+
+        tokens = Least(
+            Value(float(capacity)),
+            F("tokens") + (Value(now) - F("updated_at")) * Value(refill_rate),
+        )
+        taken = ThrottleBucket.objects.filter(
+            GreaterThanOrEqual(tokens, 1), key=key
+        ).update(tokens=tokens - 1, updated_at=now)
+
+        if taken:
+            return True, 0
+        return False, 1 / refill_rate
+
+
+BUCKET_STORES = {
+    "locmem": LocalMemoryBucketStore(),
+    "db": DatabaseBucketStore(),
+}
+
+
+def get_bucket_store():
+    return BUCKET_STORES[settings.LOGIN_THROTTLE_STORE]
+
+
+DURATIONS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+def parse_rate(rate: str) -> tuple:
+    requests, period = rate.split("/")
+    return int(requests), DURATIONS[period[0]]
+
+
+class TokenBucketThrottle(BaseThrottle):
+    """
+    Allow bursts of up to N requests per key, refilled at N per period, from
+    a rate like ``"5/min"`` in ``LOGIN_THROTTLE_RATES[scope]``.
+    """
+
+    scope = None
+
+    def get_key(self, request, view):
+        raise NotImplementedError(".get_key() must be overridden")
+
+    def allow_request(self, request, view):
+        rate = settings.LOGIN_THROTTLE_RATES.get(self.scope)
+        key = self.get_key(request, view)
+        if rate is None or key is None:
+            return True
+
+        capacity, duration = parse_rate(rate)
+        allowed, self.wait_seconds = get_bucket_store().consume(
+            f"{self.scope}:{key}", capacity, capacity / duration
+        )
+        return allowed
+
+    def wait(self):
+        return self.wait_seconds
+
+
+class IPThrottle(TokenBucketThrottle):
+    def get_key(self, request, view):
+        # X-Forwarded-For is only trusted for the NUM_PROXIES hops in front
+        # of the app; by default the key is REMOTE_ADDR.
+        return self.get_ident(request)
+
+
+class LoginIPThrottle(IPThrottle):
+    scope = "login_ip"
+
+
+class RegisterIPThrottle(IPThrottle):
+    scope = "register_ip"
+
+
+class LoginUsernameThrottle(TokenBucketThrottle):
+    scope = "login_username"
+
+    def get_key(self, request, view):
+        username = request.data.get("username")
+        if not isinstance(username, str) or not username.strip():
+            return None
+        return username.strip().lower()[:150]
@@ -1,8 +1,8 @@
 from django.urls import path
-from login.views import LoginJWTView
-from rest_framework_simplejwt import views
+from login.views import LoginJWTView, LogoutView, RefreshJWTView
 
 urlpatterns = [
     path("auth/", LoginJWTView.as_view(), name="auth"),
-    path("auth/refresh/", views.TokenRefreshView.as_view(), name="auth_refresh"),
+    path("auth/refresh/", RefreshJWTView.as_view(), name="auth_refresh"),
+    path("auth/logout/", LogoutView.as_view(), name="auth_logout"),
 ]
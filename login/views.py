@@ -1,6 +1,34 @@
-from login.serializers import CustomJWTSerializer
-from rest_framework_simplejwt.views import TokenObtainPairView
+from login.revocation import revoke_token
+from login.serializers import (
+    CustomJWTSerializer,
+    CustomTokenRefreshSerializer,
+    LogoutSerializer,
+)
+from login.throttling import LoginIPThrottle, LoginUsernameThrottle
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.views import APIView, Request, Response, status
+from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 
 
 class LoginJWTView(TokenObtainPairView):
     serializer_class = CustomJWTSerializer
+    # Throttles run before the serializer, so rejected attempts never hash.
+    throttle_classes = [LoginIPThrottle, LoginUsernameThrottle]
+
+
+class RefreshJWTView(TokenRefreshView):
+    serializer_class = CustomTokenRefreshSerializer
+
+
+class LogoutView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request: Request) -> Response:
+        serializer = LogoutSerializer(data=request.data, context={"request": request})
+        serializer.is_valid(raise_exception=True)
+
+        revoke_token(request.auth)
+        refresh = serializer.validated_data.get("refresh")
+        if refresh is not None:
+            revoke_token(refresh)
+        return Response(status=status.HTTP_204_NO_CONTENT)
@@ -0,0 +1,95 @@
+from decimal import Decimal
+
+from django.db import transaction
+from rest_framework import serializers
+
+from address.models import Address
+from cart.models import Cart, CartItem
+from cart.pricing import cart_lines
+from orders.models import Order, OrderItem
+from products.stock import decrement_stock
+
+ADDRESS_FIELDS = [
+    "state",
+    "city",
+    "street",
+    "zip_code",
+    "complement",
+    "neighbourhood",
+    "number",
+]
+
+
+def place_order(user_id: int, idempotency_key: str = None) -> tuple:
+    """
+    Turn the user's cart into an order in a single transaction.
+
+    Returns ``(order, created)``; a request repeating an ``idempotency_key``
+    gets the order the first request created instead of a new one.
+    """
+    with transaction.atomic():
+        # Locking the cart serializes checkouts of the same user, so a retry
+        # waits for the original request and then finds the order it made.
+        cart = Cart.objects.select_for_update().filter(user_id=user_id).first()
+
+        if idempotency_key:
+            order = Order.objects.filter(
+                user_id=user_id, idempotency_key=idempotency_key
+            ).first()
+            if order is not None:
+                return order, False
+
+        quantities = dict(
+            CartItem.objects.filter(cart=cart).values_list("product_id", "quantity")
+        )
+        if cart is None or not quantities:
+            raise serializers.ValidationError({"cart": ["Cart is empty."]})
+
+        address = (
+            Address.objects.filter(user_id=user_id).values(*ADDRESS_FIELDS).first()
+        )
+        if address is None:
+            raise serializers.ValidationError(
+                {"address": ["Add an address before checking out."]}
+            )
+
+        # Takes the stock row locks in id order, so concurrent checkouts over
+        # the same products cannot deadlock, and holds them until commit, so
+        # the prices read below are the ones the stock was sold at. The
+        # user's own reservations are spent here.
+        decrement_stock(quantities, user_id=user_id)
+        lines = list(cart_lines(cart))
+
+        subtotal = sum(
+            (line["unit_price"] * line["quantity"] for line in lines), Decimal(0)
+        )
+        total = sum((line["line_total"] for line in lines), Decimal(0))
+        order = Order.objects.create(
+            user_id=user_id,
+            idempotency_key=idempotency_key or None,
+            subtotal=subtotal,
+            discount_total=subtotal - total,
+            total=total,
+            **address,
+        )
+        OrderItem.objects.bulk_create(
+            [
+                OrderItem(
+                    order=order,
+                    product_id=line["product_id"],
+                    name=line["name"],
+                    slug=line["slug"],
+                    unit_price=line["unit_price"],
+                    discount=line["discount"],
+                    final_unit_price=line["final_unit_price"],
+                    quantity=line["quantity"],
+                    total=line["line_total"],
+                )
+                for line in lines
+            ]
+        )
+
+        CartItem.objects.filter(cart=cart).delete()
+        cart.save(update_fields=["updated_at"])
+
+    return order, True
@@ -0,0 +1,50 @@
+from django.db import models
+
+from address.models import StateChoice
+from products.models import Product
+from users.models import User
+
+
+class Order(models.Model):
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="orders")
+    idempotency_key = models.CharField(max_length=255, null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    subtotal = models.DecimalField(max_digits=13, decimal_places=2)
+    discount_total = models.DecimalField(max_digits=13, decimal_places=2)
+    total = models.DecimalField(max_digits=13, decimal_places=2)
+
+    # Snapshot of the user's address when the order was placed.
+    state = models.CharField(max_length=2, choices=StateChoice.choices)
+    city = models.CharField(max_length=100)
+    street = models.CharField(max_length=170)
+    zip_code = models.CharField(max_length=8)
+    complement = models.CharField(max_length=170)
+    neighbourhood = models.CharField(max_length=180)
+    number = models.IntegerField()
+
+    class Meta:
+        ordering = ["-id"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "idempotency_key"],
+                name="order_unique_idempotency_key",
+            ),
+        ]
+
+
+class OrderItem(models.Model):
+    order = models.ForeignKey(Order, on_delete=models.CASCADE, related_name="items")
+    product = models.ForeignKey(Product, on_delete=models.SET_NULL, null=True)
+
+    # Snapshot of the product when the order was placed.
+    name = models.CharField(max_length=190)
+    slug = models.CharField(max_length=250)
+    unit_price = models.DecimalField(max_digits=11, decimal_places=2)
+    discount = models.PositiveIntegerField(default=0)
+    final_unit_price = models.DecimalField(max_digits=11, decimal_places=2)
+    quantity = models.PositiveIntegerField()
+    total = models.DecimalField(max_digits=13, decimal_places=2)
+
+    class Meta:
+        ordering = ["id"]
@@ -0,0 +1,38 @@
+from rest_framework import serializers
+from orders.models import Order, OrderItem
+
+
+class OrderItemSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = OrderItem
+        fields = [
+            "name",
+            "slug",
+            "unit_price",
+            "discount",
+            "final_unit_price",
+            "quantity",
+            "total",
+        ]
+
+
+class OrderSerializer(serializers.ModelSerializer):
+    items = OrderItemSerializer(many=True, read_only=True)
+
+    class Meta:
+        model = Order
+        fields = [
+            "id",
+            "created_at",
+            "subtotal",
+            "discount_total",
+            "total",
+            "state",
+            "city",
+            "neighbourhood",
+            "street",
+            "zip_code",
+            "number",
+            "complement",
+            "items",
+        ]
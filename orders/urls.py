@@ -0,0 +1,9 @@
+from django.urls import path
+
+from orders.views import OrderCheckoutView, OrderDetailView, OrderListView
+
+urlpatterns = [
+    path("orders/", OrderListView.as_view(), name="orders"),
+    path("orders/checkout/", OrderCheckoutView.as_view(), name="orders_checkout"),
+    path("orders/<int:pk>/", OrderDetailView.as_view(), name="order_details"),
+]
@@ -0,0 +1,51 @@
+from django.shortcuts import get_object_or_404
+from rest_framework import serializers
+from rest_framework.generics import ListAPIView, RetrieveAPIView
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.views import APIView, Request, Response, status
+
+from orders.checkout import place_order
+from orders.models import Order
+from orders.serializers import OrderSerializer
+
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+
+
+class OrderCheckoutView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request: Request) -> Response:
+        idempotency_key = request.headers.get(IDEMPOTENCY_KEY_HEADER)
+        if idempotency_key is not None and not 0 < len(idempotency_key) <= 255:
+            raise serializers.ValidationError(
+                {IDEMPOTENCY_KEY_HEADER: ["Must have between 1 and 255 characters."]}
+            )
+
+        order, created = place_order(request.user.id, idempotency_key)
+        order = Order.objects.prefetch_related("items").get(pk=order.pk)
+        return Response(
+            OrderSerializer(instance=order).data,
+            status.HTTP_201_CREATED if created else status.HTTP_200_OK,
+        )
+
+
+class OrderListView(ListAPIView):
+    permission_classes = [IsAuthenticated]
+    serializer_class = OrderSerializer
+
+    def get_queryset(self):
+        return Order.objects.filter(user_id=self.request.user.id).prefetch_related(
+            "items"
+        )
+
+
+class OrderDetailView(RetrieveAPIView):
+    permission_classes = [IsAuthenticated]
+    serializer_class = OrderSerializer
+
+    def get_object(self):
+        return get_object_or_404(
+            Order.objects.prefetch_related("items"),
+            pk=self.kwargs["pk"],
+            user_id=self.request.user.id,
+        )
@@ -0,0 +1,89 @@
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.http import HttpResponse
+from rest_framework.renderers import JSONRenderer
+
+CATALOG_VERSION_KEY = "products:catalog_version"
+PRICING_VERSION_KEY = "products:pricing_version"
+
+
+def _get_version(key: str) -> int:
+    version = cache.get(key)
+    if version is None:
+        # Seeding with the clock keeps a lost or evicted counter from ever
+        # reusing a version number that older responses were stored under.
+        cache.add(key, time.time_ns(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def _increment_version(key: str) -> None:
+    try:
+        cache.incr(key)
+    except ValueError:
+        _get_version(key)
+
+
+def _bump_version(key: str) -> None:
+    # The version is bumped right away and again once the surrounding
+    # transaction commits, so a read that raced the write and cached
+    # uncommitted-away data under the intermediate version is never served.
+    _increment_version(key)
+    transaction.on_commit(lambda: _increment_version(key))
+
+
+def get_catalog_version() -> int:
+    return _get_version(CATALOG_VERSION_KEY)
+
+
+def bump_catalog_version() -> None:
+    """
+    Invalidate every cached catalog response in O(1).
+    """
+    _bump_version(CATALOG_VERSION_KEY)
+
+
+def get_pricing_version() -> int:
+    return _get_version(PRICING_VERSION_KEY)
+
+
+def bump_pricing_version() -> None:
+    """
+    Invalidate every cached cart in O(1).
+
+    Only writes to the product fields a priced cart shows need this, so
+    stock movements leave cached carts alone.
+    """
+    _bump_version(PRICING_VERSION_KEY)
+
+
+def catalog_cache_key(request) -> str:
+    url = hashlib.md5(request.build_absolute_uri().encode()).hexdigest()
+    return f"products:response:{get_catalog_version()}:{url}"
+
+
+def cached_response(request, build):
+    """
+    Serve ``build()`` from the pre-rendered JSON stored for the current
+    catalog version, rendering and storing it on a miss.
+    """
+    if request.accepted_renderer.format != "json":
+        return build()
+
+    key = catalog_cache_key(request)
+    content = cache.get(key)
+    if content is not None:
+        return HttpResponse(content, content_type="application/json")
+
+    response = build()
+    if response.status_code == 200:
+        cache.set(
+            key,
+            JSONRenderer().render(response.data),
+            settings.PRODUCTS_CACHE_TIMEOUT,
+        )
+    return response
@@ -0,0 +1,42 @@
+from django.db.models.functions import Lower
+
+from products.cache import bump_catalog_version
+from products.models import Category
+from products.search import update_search_vectors
+from products.signals import touch_products
+
+
+def assign_categories(product_ids, names) -> None:
+    """
+    Link products to the categories named in ``names``, ignoring case.
+
+    Categories are resolved in one query and the M2M rows are inserted in one
+    statement; names that match no category are ignored.
+    """
+    product_ids = list(product_ids)
+    names = {name.strip().lower() for name in names if name and name.strip()}
+    if not product_ids or not names:
+        return
+
+    category_ids = list(
+        Category.objects.annotate(lower_name=Lower("name"))
+        .filter(lower_name__in=names)
+        .values_list("id", flat=True)
+    )
+    if not category_ids:
+        return
+
+    through = Category.products.through
+    through.objects.bulk_create(
+        [
+            through(category_id=category_id, product_id=product_id)
+            for category_id in category_ids
+            for product_id in product_ids
+        ],
+        ignore_conflicts=True,
+    )
+
+    # bulk_create skips m2m_changed, so refresh what those signals maintain.
+    touch_products(product_ids)
+    update_search_vectors(product_ids)
+    bump_catalog_version()
@@ -0,0 +1,63 @@
+import hashlib
+
+from django.db.models import Count, Max
+
+from products.models import Product
+
+
+def _memoize_on_request(request, name: str, fetch):
+    # The ETag and Last-Modified callbacks of a single request share the
+    # same revision lookup, so each conditional GET costs one query.
+    revisions = request.__dict__.setdefault("_product_revisions", {})
+    if name not in revisions:
+        revisions[name] = fetch()
+    return revisions[name]
+
+
+def _hash(*parts) -> str:
+    return hashlib.sha1(":".join(str(part) for part in parts).encode()).hexdigest()
+
+
+def catalog_revision(request) -> dict:
+    return _memoize_on_request(
+        request,
+        "catalog",
+        lambda: Product.objects.aggregate(
+            last_modified=Max("updated_at"), count=Count("id")
+        ),
+    )
+
+
+def catalog_etag(request, *args, **kwargs):
+    revision = catalog_revision(request)
+    return _hash(
+        revision["last_modified"], revision["count"], request.get_full_path()
+    )
+
+
+def catalog_last_modified(request, *args, **kwargs):
+    return catalog_revision(request)["last_modified"]
+
+
+def product_revision(request, slug: str):
+    return _memoize_on_request(
+        request,
+        f"product:{slug}",
+        lambda: Product.objects.filter(slug=slug)
+        .values_list("id", "updated_at")
+        .first(),
+    )
+
+
+def product_etag(request, slug: str):
+    revision = product_revision(request, slug)
+    if revision is None:
+        return None
+    return _hash(*revision)
+
+
+def product_last_modified(request, slug: str):
+    revision = product_revision(request, slug)
+    if revision is None:
+        return None
+    return revision[1]
@@ -0,0 +1,81 @@
+import csv
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Prefetch
+
+from products.models import Category, ImageProduct, Product
+
+EXPORT_FORMATS = ("csv", "ndjson")
+EXPORT_FIELDS = [
+    "id",
+    "name",
+    "description",
+    "price",
+    "stock",
+    "discount",
+    "slug",
+    "image_url",
+    "categories",
+]
+CONTENT_TYPES = {"csv": "text/csv", "ndjson": "application/x-ndjson"}
+
+
+def export_rows(chunk_size: int = 1000):
+    """
+    Yield one dict per product without loading the catalog into memory.
+
+    Products are fetched ``chunk_size`` at a time, and the images and
+    categories of each chunk are loaded with one query each.
+    """
+    products = (
+        Product.objects.order_by("id")
+        .only("id", "name", "description", "price", "stock", "discount", "slug")
+        .prefetch_related(
+            Prefetch(
+                "image_product",
+                queryset=ImageProduct.objects.only("product_id", "image_url"),
+            ),
+            Prefetch("products", queryset=Category.objects.only("name")),
+        )
+    )
+    for product in products.iterator(chunk_size=chunk_size):
+        images = product.image_product.all()
+        yield {
+            "id": product.id,
+            "name": product.name,
+            "description": product.description,
+            "price": product.price,
+            "stock": product.stock,
+            "discount": product.discount,
+            "slug": product.slug,
+            "image_url": images[0].image_url if images else "",
+            # Same separator the importer reads, so exports can be re-imported.
+            "categories": "|".join(
+                category.name for category in product.products.all()
+            ),
+        }
+
+
+class _Echo:
+    def write(self, value):
+        return value
+
+
+def render_csv(rows):
+    writer = csv.DictWriter(_Echo(), fieldnames=EXPORT_FIELDS)
+    yield writer.writeheader()
+    for row in rows:
+        yield writer.writerow(row)
+
+
+def render_ndjson(rows):
+    for row in rows:
+        yield json.dumps(row, cls=DjangoJSONEncoder) + "\n"
+
+
+def render_export(file_format: str, chunk_size: int = 1000):
+    rows = export_rows(chunk_size=chunk_size)
+    if file_format == "csv":
+        return render_csv(rows)
+    return render_ndjson(rows)
@@ -0,0 +1,141 @@
+from decimal import Decimal, InvalidOperation
+
+from django.conf import settings
+from django.db.models import Count, Q
+from django.db.models.functions import Lower
+from rest_framework import serializers
+
+from products.models import Category
+
+TRUE_VALUES = ("true", "1", "yes")
+FALSE_VALUES = ("false", "0", "no")
+
+
+def _decimal_param(params, name: str):
+    value = params.get(name)
+    if value in (None, ""):
+        return None
+    try:
+        number = Decimal(value)
+    except InvalidOperation:
+        number = None
+    if number is None or not number.is_finite():
+        raise serializers.ValidationError({name: ["A valid number is required."]})
+    return number
+
+
+def _integer_param(params, name: str):
+    value = params.get(name)
+    if value in (None, ""):
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        raise serializers.ValidationError({name: ["A valid integer is required."]})
+
+
+def _boolean_param(params, name: str):
+    value = params.get(name)
+    if value in (None, ""):
+        return None
+    if value.lower() in TRUE_VALUES:
+        return True
+    if value.lower() in FALSE_VALUES:
+        return False
+    raise serializers.ValidationError({name: ["Must be a valid boolean."]})
+
+
+def filter_catalog(queryset, params):
+    """
+    Narrow the catalog by the ``category``, ``min_price``, ``max_price``,
+    ``min_final_price``, ``max_final_price``, ``min_discount`` and
+    ``in_stock`` query parameters.
+    """
+    categories = [
+        name.strip()
+        for value in params.getlist("category")
+        for name in value.split(",")
+        if name.strip()
+    ]
+    if categories:
+        matching_categories = Category.objects.annotate(
+            lower_name=Lower("name")
+        ).filter(lower_name__in=[name.lower() for name in categories])
+        # Filtering through the M2M table as a subquery avoids the duplicate
+        # rows (and the DISTINCT) a join on the relation would produce.
+        queryset = queryset.filter(
+            id__in=Category.products.through.objects.filter(
+                category__in=matching_categories
+            ).values("product_id")
+        )
+
+    min_price = _decimal_param(params, "min_price")
+    if min_price is not None:
+        queryset = queryset.filter(price__gte=min_price)
+
+    max_price = _decimal_param(params, "max_price")
+    if max_price is not None:
+        queryset = queryset.filter(price__lte=max_price)
+
+    min_final_price = _decimal_param(params, "min_final_price")
+    if min_final_price is not None:
+        queryset = queryset.filter(final_price__gte=min_final_price)
+
+    max_final_price = _decimal_param(params, "max_final_price")
+    if max_final_price is not None:
+        queryset = queryset.filter(final_price__lte=max_final_price)
+
+    min_discount = _integer_param(params, "min_discount")
+    if min_discount is not None:
+        queryset = queryset.filter(discount__gte=min_discount)
+
+    in_stock = _boolean_param(params, "in_stock")
+    if in_stock is True:
+        queryset = queryset.filter(stock__gt=0)
+    elif in_stock is False:
+        queryset = queryset.filter(stock=0)
+
+    return queryset
+
+
+def price_buckets() -> list:
+    bounds = [None, *settings.PRODUCTS_PRICE_BUCKETS, None]
+    return list(zip(bounds, bounds[1:]))
+
+
+def catalog_facets(queryset) -> dict:
+    """
+    Count the filtered products per category and per price bucket.
+
+    Each facet is one aggregate query over the filtered catalog.
+    """
+    product_ids = queryset.order_by().values("id")
+
+    categories = (
+        Category.products.through.objects.filter(product_id__in=product_ids)
+        .values("category__name")
+        .annotate(count=Count("product_id"))
+        .order_by("category__name")
+    )
+
+    buckets = price_buckets()
+    bucket_filters = {}
+    for index, (low, high) in enumerate(buckets):
+        bucket = Q()
+        if low is not None:
+            bucket &= Q(price__gte=low)
+        if high is not None:
+            bucket &= Q(price__lt=high)
+        bucket_filters[f"bucket_{index}"] = Count("id", filter=bucket)
+    counts = queryset.order_by().aggregate(**bucket_filters)
+
+    return {
+        "categories": [
+            {"name": category["category__name"], "count": category["count"]}
+            for category in categories
+        ],
+        "price": [
+            {"min": low, "max": high, "count": counts[f"bucket_{index}"]}
+            for index, (low, high) in enumerate(buckets)
+        ],
+    }
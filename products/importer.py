@@ -0,0 +1,186 @@
+import codecs
+import csv
+import json
+from collections import defaultdict
+
+from django.db import DataError, IntegrityError, transaction
+
+from products.cache import bump_catalog_version, bump_pricing_version
+from products.categories import assign_categories
+from products.models import ImageProduct, Product
+from products.search import update_search_vectors
+from products.serializers import ProductSerializer
+
+IMPORT_FORMATS = ("csv", "jsonl")
+UPSERT_FIELDS = [
+    "name",
+    "description",
+    "price",
+    "stock",
+    "discount",
+    "final_price",
+    "updated_at",
+]
+
+
+class ProductImportSerializer(ProductSerializer):
+    class Meta(ProductSerializer.Meta):
+        # Existing slugs are updated instead of rejected.
+        extra_kwargs = {"slug": {"validators": []}}
+
+
+def check_encoding(file) -> None:
+    """
+    Raise ``UnicodeDecodeError`` unless ``file`` is valid UTF-8.
+
+    The file is decoded chunk by chunk and rewound, so an import never
+    writes part of a file it cannot read to the end.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    for chunk in iter(lambda: file.read(64 * 1024), b""):
+        decoder.decode(chunk)
+    decoder.decode(b"", final=True)
+    file.seek(0)
+
+
+def _decoded_lines(file):
+    for line in file:
+        yield line.decode("utf-8-sig") if isinstance(line, bytes) else line
+
+
+def read_rows(file, file_format: str):
+    """
+    Yield ``(line_number, row)`` pairs from a CSV or JSON Lines file.
+
+    Rows that cannot be parsed are yielded as ``(line_number, None)``.
+    """
+    lines = _decoded_lines(file)
+
+    if file_format == "csv":
+        reader = csv.DictReader(lines)
+        for row in reader:
+            yield reader.line_num, row
+        return
+
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError:
+            row = None
+        yield line_number, row if isinstance(row, dict) else None
+
+
+def _split_categories(value) -> list:
+    if isinstance(value, list):
+        return value
+    return [name for name in (value or "").split("|") if name.strip()]
+
+
+def _save_batch(batch: dict) -> tuple:
+    slugs = list(batch)
+    with transaction.atomic():
+        existing = set(
+            Product.objects.filter(slug__in=slugs).values_list("slug", flat=True)
+        )
+        Product.objects.bulk_create(
+            [product for _, product, _ in batch.values()],
+            update_conflicts=True,
+            unique_fields=["slug"],
+            update_fields=UPSERT_FIELDS,
+        )
+        product_ids = dict(
+            Product.objects.filter(slug__in=slugs).values_list("slug", "id")
+        )
+
+        ImageProduct.objects.bulk_create(
+            [
+                ImageProduct(product_id=product_ids[slug], is_primary=True)
+                for slug in slugs
+                if slug not in existing
+            ]
+        )
+
+        products_by_categories = defaultdict(list)
+        for slug, (_, _, categories) in batch.items():
+            if categories:
+                key = tuple(sorted({name.strip().lower() for name in categories}))
+                products_by_categories[key].append(product_ids[slug])
+        for categories, category_product_ids in products_by_categories.items():
+            assign_categories(category_product_ids, categories)
+
+        # bulk_create skips the model signals that keep these up to date.
+        update_search_vectors(product_ids.values())
+        bump_catalog_version()
+        bump_pricing_version()
+
+    created = len(slugs) - len(existing)
+    return created, len(existing)
+
+
+def _save_rows(batch: dict, result: dict) -> None:
+    try:
+        created, updated = _save_batch(batch)
+    except (DataError, IntegrityError) as error:
+        if len(batch) == 1:
+            line_number = next(iter(batch.values()))[0]
+            result["errors"].append(
+                {"line": line_number, "errors": {"detail": [str(error).strip()]}}
+            )
+            return
+        # Retry row by row so a row the database rejects does not take the
+        # rest of its batch down with it.
+        for slug, entry in batch.items():
+            _save_rows({slug: entry}, result)
+        return
+
+    result["created"] += created
+    result["updated"] += updated
+
+
+def import_products(rows, batch_size: int = 500) -> dict:
+    """
+    Validate rows with the product serializer rules and upsert them by slug.
+
+    Valid rows are written in batches of ``batch_size``; invalid rows, and
+    rows the database rejects, are reported with their line number and never
+    abort the import.
+    """
+    result = {"created": 0, "updated": 0, "errors": []}
+    batch = {}
+
+    def flush():
+        _save_rows(batch, result)
+        batch.clear()
+
+    for line_number, row in rows:
+        if row is None:
+            result["errors"].append(
+                {"line": line_number, "errors": {"detail": ["Malformed row."]}}
+            )
+            continue
+
+        serializer = ProductImportSerializer(data=row)
+        if not serializer.is_valid():
+            result["errors"].append({"line": line_number, "errors": serializer.errors})
+            continue
+
+        # A repeated slug within a batch keeps its last row, since one upsert
+        # statement cannot touch the same row twice.
+        slug = serializer.validated_data["slug"]
+        batch.pop(slug, None)
+        product = Product(**serializer.validated_data)
+        product.final_price = product.compute_final_price()
+        batch[slug] = (
+            line_number,
+            product,
+            _split_categories(row.get("categories")),
+        )
+        if len(batch) >= batch_size:
+            flush()
+
+    if batch:
+        flush()
+
+    return result
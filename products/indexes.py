@@ -0,0 +1,18 @@
+from django.contrib.postgres.indexes import GinIndex
+
+
+class PostgresGinIndex(GinIndex):
+    """
+    GIN index that databases without GIN support skip, so the schema still
+    migrates on SQLite, where search falls back to substring matching.
+    """
+
+    def create_sql(self, model, schema_editor, using="", **kwargs):
+        if schema_editor.connection.vendor != "postgresql":
+            return ""
+        return super().create_sql(model, schema_editor, using=using, **kwargs)
+
+    def remove_sql(self, model, schema_editor, **kwargs):
+        if schema_editor.connection.vendor != "postgresql":
+            return ""
+        return super().remove_sql(model, schema_editor, **kwargs)
@@ -0,0 +1,27 @@
+import sys
+
+from django.core.management.base import BaseCommand
+
+from products.exporter import EXPORT_FORMATS, render_export
+
+
+class Command(BaseCommand):
+    help = "Stream the product catalog as CSV or NDJSON."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--format", choices=EXPORT_FORMATS, default="ndjson")
+        parser.add_argument(
+            "--output", help="File to write to; defaults to standard output."
+        )
+        parser.add_argument("--chunk-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        chunks = render_export(options["format"], chunk_size=options["chunk_size"])
+
+        if options["output"] is None:
+            for chunk in chunks:
+                self.stdout.write(chunk, ending="")
+            return
+
+        with open(options["output"], "w", newline="") as file:
+            file.writelines(chunks)
@@ -0,0 +1,50 @@
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+from products.importer import (
+    IMPORT_FORMATS,
+    check_encoding,
+    import_products,
+    read_rows,
+)
+
+
+class Command(BaseCommand):
+    help = "Import products from a CSV or JSON Lines file, upserting by slug."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path")
+        parser.add_argument(
+            "--format",
+            choices=IMPORT_FORMATS,
+            help="File format; inferred from the file extension when omitted.",
+        )
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        file_format = options["format"] or os.path.splitext(path)[1].lstrip(".")
+        if file_format not in IMPORT_FORMATS:
+            raise CommandError(f"Unsupported file format: {file_format!r}.")
+
+        try:
+            with open(path, "rb") as file:
+                check_encoding(file)
+                result = import_products(
+                    read_rows(file, file_format), batch_size=options["batch_size"]
+                )
+        except UnicodeDecodeError:
+            raise CommandError(f"{path} is not encoded as UTF-8.")
+        except OSError as error:
+            raise CommandError(error)
+
+        for error in result["errors"]:
+            self.stderr.write(f"Line {error['line']}: {error['errors']}")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{result['created']} created, {result['updated']} updated, "
+                f"{len(result['errors'])} rejected."
+            )
+        )
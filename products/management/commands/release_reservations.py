@@ -0,0 +1,26 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from products.stock import release_expired_reservations
+
+
+class Command(BaseCommand):
+    help = "Delete expired stock reservations in batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--loop", action="store_true", help="Keep sweeping until interrupted."
+        )
+        parser.add_argument(
+            "--interval", type=float, default=60, help="Seconds between sweeps."
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            released = release_expired_reservations(options["batch_size"])
+            self.stdout.write(f"Released {released} expired reservations.")
+            if not options["loop"]:
+                return
+            time.sleep(options["interval"])
@@ -0,0 +1,32 @@
+# Generated by Django 4.2.3 on 2026-10-18 07:05
+
+import os
+
+from django.db import migrations, models
+
+
+def backfill_storage_keys(apps, schema_editor):
+    # Images uploaded before keys were stored used the file name as the
+    # Cloudinary public id; the shared placeholder has no key to release.
+    ImageProduct = apps.get_model("products", "ImageProduct")
+    for image_product in ImageProduct.objects.exclude(
+        image_url__endswith="/no-photo.png"
+    ):
+        filename = os.path.basename(image_product.image_url)
+        image_product.storage_key = os.path.splitext(filename)[0]
+        image_product.save(update_fields=["storage_key"])
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("products", "0008_product_updated_at"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="imageproduct",
+            name="storage_key",
+            field=models.CharField(blank=True, default="", max_length=255),
+        ),
+        migrations.RunPython(backfill_storage_keys, migrations.RunPython.noop),
+    ]
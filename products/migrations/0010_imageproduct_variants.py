@@ -0,0 +1,17 @@
+# Generated by Django 4.2.3 on 2026-10-18 07:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("products", "0009_imageproduct_storage_key"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="imageproduct",
+            name="variants",
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 4.2.3 on 2026-10-18 07:07
+
+from django.db import migrations, models
+
+
+def mark_primary_images(apps, schema_editor):
+    # Until now products only showed their oldest image, keep it as primary.
+    ImageProduct = apps.get_model("products", "ImageProduct")
+    first_images = (
+        ImageProduct.objects.order_by()
+        .values("product")
+        .annotate(first_id=models.Min("id"))
+        .values("first_id")
+    )
+    ImageProduct.objects.filter(id__in=first_images).update(is_primary=True)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("products", "0010_imageproduct_variants"),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="imageproduct",
+            options={"ordering": ["-is_primary", "position", "id"]},
+        ),
+        migrations.AddField(
+            model_name="imageproduct",
+            name="is_primary",
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name="imageproduct",
+            name="position",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(mark_primary_images, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="imageproduct",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("is_primary", True)),
+                fields=("product",),
+                name="image_product_single_primary",
+            ),
+        ),
+    ]
@@ -0,0 +1,63 @@
+# Generated by Django 4.2.3 on 2026-10-18 07:08
+
+import django.contrib.postgres.search
+from django.conf import settings
+from django.contrib.postgres.aggregates import StringAgg
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+from django.db.models import OuterRef, Subquery, TextField, Value
+from django.db.models.functions import Coalesce
+
+import products.indexes
+
+
+def populate_search_vectors(apps, schema_editor):
+    # Other databases use the substring fallback and leave the column empty.
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    Product = apps.get_model("products", "Product")
+    Category = apps.get_model("products", "Category")
+    config = settings.PRODUCTS_SEARCH_CONFIG
+
+    category_names = (
+        Category.objects.filter(products=OuterRef("pk"))
+        .order_by()
+        .values("products")
+        .annotate(names=StringAgg("name", delimiter=" "))
+        .values("names")
+    )
+    Product.objects.update(
+        search_vector=(
+            SearchVector("name", weight="A", config=config)
+            + SearchVector("description", weight="B", config=config)
+            + SearchVector(
+                Coalesce(Subquery(category_names), Value("", output_field=TextField())),
+                weight="C",
+                config=config,
+            )
+        )
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("products", "0011_image_product_gallery"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="product",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.RunPython(populate_search_vectors, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="product",
+            index=products.indexes.PostgresGinIndex(
+                fields=["search_vector"], name="product_search_vector_idx"
+            ),
+        ),
+    ]
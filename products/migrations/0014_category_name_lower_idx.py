@@ -0,0 +1,20 @@
+# Generated by Django 4.2.3 on 2026-10-18 07:11
+
+from django.db import migrations, models
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("products", "0013_catalog_filter_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="category",
+            index=models.Index(
+                django.db.models.functions.text.Lower("name"),
+                name="category_name_lower_idx",
+            ),
+        ),
+    ]
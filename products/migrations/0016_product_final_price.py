@@ -0,0 +1,36 @@
+# Generated by Django 4.2.3 on 2026-10-18 07:40
+
+from django.db import migrations, models
+from django.db.models import F
+from django.db.models.functions import Round
+
+
+def populate_final_prices(apps, schema_editor):
+    Product = apps.get_model("products", "Product")
+    Product.objects.update(
+        final_price=Round(F("price") * (100 - F("discount")) / 100, 2)
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("products", "0015_stock_reservation"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="product",
+            name="final_price",
+            field=models.DecimalField(
+                decimal_places=2, default=0, editable=False, max_digits=11
+            ),
+            preserve_default=False,
+        ),
+        migrations.RunPython(populate_final_prices, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="product",
+            index=models.Index(
+                fields=["final_price", "id"], name="product_final_price_id_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 4.2.3 on 2026-10-18 07:55
+
+import django.core.validators
+from django.db import migrations, models
+
+
+def clamp_discounts(apps, schema_editor):
+    Product = apps.get_model("products", "Product")
+    Product.objects.filter(discount__gt=100).update(discount=100, final_price=0)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("products", "0016_product_final_price"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="product",
+            name="discount",
+            field=models.PositiveIntegerField(
+                default=0, validators=[django.core.validators.MaxValueValidator(100)]
+            ),
+        ),
+        migrations.RunPython(clamp_discounts, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="product",
+            constraint=models.CheckConstraint(
+                check=models.Q(("discount__lte", 100)), name="product_discount_lte_100"
+            ),
+        ),
+    ]
@@ -1,4 +1,18 @@
+from decimal import ROUND_HALF_UP, Decimal
+
+from django.contrib.postgres.search import SearchVectorField
+from django.core.validators import MaxValueValidator
 from django.db import models
+from django.db.models.functions import Lower
+
+from products.indexes import PostgresGinIndex
+
+
+class ProductQuerySet(models.QuerySet):
+    def with_images(self):
+        return self.prefetch_related(
+            models.Prefetch("image_product", queryset=ImageProduct.objects.all())
+        )
 
 
 # Create your models here.
@@ -7,22 +21,103 @@ class Product(models.Model):
     price = models.DecimalField(max_digits=11, decimal_places=2)
     description = models.CharField(max_length=255)
     stock = models.PositiveIntegerField()
-    discount = models.PositiveIntegerField(default=0)
+    discount = models.PositiveIntegerField(
+        default=0, validators=[MaxValueValidator(100)]
+    )
+    final_price = models.DecimalField(max_digits=11, decimal_places=2, editable=False)
     slug = models.CharField(max_length=250, unique=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    objects = ProductQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["price", "id"], name="product_price_id_idx"),
+            models.Index(
+                fields=["price", "id"],
+                condition=models.Q(stock__gt=0),
+                name="product_in_stock_price_id_idx",
+            ),
+            models.Index(fields=["discount"], name="product_discount_idx"),
+            models.Index(
+                fields=["final_price", "id"], name="product_final_price_id_idx"
+            ),
+            PostgresGinIndex(
+                fields=["search_vector"], name="product_search_vector_idx"
+            ),
+        ]
+        constraints = [
+            # A discount above 100% would make final_price negative.
+            models.CheckConstraint(
+                check=models.Q(discount__lte=100), name="product_discount_lte_100"
+            ),
+        ]
+
+    def compute_final_price(self) -> Decimal:
+        price = Decimal(str(self.price))
+        return (price * (100 - self.discount) / 100).quantize(
+            Decimal("0.01"), rounding=ROUND_HALF_UP
+        )
+
+    def save(self, *args, **kwargs):
+        # final_price is stored so the catalog can filter and order by it on
+        # an index; bulk writes must call compute_final_price themselves.
+        self.final_price = self.compute_final_price()
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and {"price", "discount"} & set(update_fields):
+            kwargs["update_fields"] = {*update_fields, "final_price"}
+        super().save(*args, **kwargs)
 
 
 class ImageProduct(models.Model):
     image_url = models.CharField(
         default="https://res.cloudinary.com/dnkw0zu2x/image/upload/v1688328201/django_commerce/no-photo.png",
     )
+    storage_key = models.CharField(max_length=255, blank=True, default="")
+    variants = models.JSONField(default=dict, blank=True)
+    position = models.PositiveIntegerField(default=0)
+    is_primary = models.BooleanField(default=False)
     product = models.ForeignKey(
         "products.Product", on_delete=models.CASCADE, related_name="image_product"
     )
 
     class Meta:
         db_table = "image_product"
+        ordering = ["-is_primary", "position", "id"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["product"],
+                condition=models.Q(is_primary=True),
+                name="image_product_single_primary",
+            ),
+        ]
 
 
 class Category(models.Model):
     name = models.CharField(max_length=100)
     products = models.ManyToManyField("products.Product", related_name="products")
+
+    class Meta:
+        indexes = [
+            models.Index(Lower("name"), name="category_name_lower_idx"),
+        ]
+
+
+class StockReservation(models.Model):
+    product = models.ForeignKey(
+        "products.Product", on_delete=models.CASCADE, related_name="reservations"
+    )
+    user = models.ForeignKey(
+        "users.User", on_delete=models.CASCADE, related_name="stock_reservations"
+    )
+    quantity = models.PositiveIntegerField()
+    expires_at = models.DateTimeField()
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["product", "expires_at"], name="reservation_product_exp_idx"
+            ),
+            models.Index(fields=["expires_at"], name="reservation_expires_at_idx"),
+        ]
@@ -0,0 +1,158 @@
+from base64 import b64decode, b64encode
+from decimal import Decimal, InvalidOperation
+from urllib import parse
+
+from django.conf import settings
+from django.db.models import Q
+from rest_framework import serializers
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import (
+    BasePagination,
+    PageNumberPagination,
+    _positive_int,
+)
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class ProductCursorPagination(BasePagination):
+    """
+    Keyset pagination over ``(ordering_field, id)``.
+
+    The ``ordering`` query parameter picks one of ``ordering_fields``,
+    prefixed with ``-`` for descending order.
+
+    The cursor carries the values of the boundary row instead of an offset, so
+    every page is a single indexed range scan and rows inserted while a client
+    is paging never shift the following pages.
+    """
+
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    ordering_query_param = "ordering"
+    ordering_field = "price"
+    ordering_fields = ("price", "final_price")
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.cursor = self.decode_cursor(request)
+        field, descending = self.get_ordering(request)
+        self.field = field
+
+        if self.cursor is None:
+            value, pk, reverse = None, None, False
+        else:
+            value, pk, reverse = self.cursor
+
+        # Paging backwards walks the index in the opposite direction.
+        if descending != reverse:
+            queryset = queryset.order_by(f"-{field}", "-id")
+            if value is not None:
+                queryset = queryset.filter(
+                    Q(**{f"{field}__lt": value}) | Q(**{field: value, "id__lt": pk})
+                )
+        else:
+            queryset = queryset.order_by(field, "id")
+            if value is not None:
+                queryset = queryset.filter(
+                    Q(**{f"{field}__gt": value}) | Q(**{field: value, "id__gt": pk})
+                )
+
+        results = list(queryset[: self.page_size + 1])
+        has_more = len(results) > self.page_size
+        self.page = results[: self.page_size]
+
+        if reverse:
+            self.page.reverse()
+            self.has_next = True
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = self.cursor is not None
+
+        return self.page
+
+    def get_ordering(self, request) -> tuple:
+        ordering = request.query_params.get(
+            self.ordering_query_param, self.ordering_field
+        )
+        field = ordering.removeprefix("-")
+        if field not in self.ordering_fields:
+            raise serializers.ValidationError(
+                {
+                    self.ordering_query_param: [
+                        f"Must be one of: {', '.join(self.ordering_fields)}."
+                    ]
+                }
+            )
+        return field, ordering.startswith("-")
+
+    def get_page_size(self, request):
+        try:
+            return _positive_int(
+                request.query_params[self.page_size_query_param],
+                strict=True,
+                cutoff=self.max_page_size,
+            )
+        except (KeyError, ValueError):
+            return settings.PRODUCTS_PAGE_SIZE
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def get_paginated_response(self, data):
+        return Response(
+            {
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            }
+        )
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None
+
+        try:
+            querystring = b64decode(encoded.encode("ascii")).decode("ascii")
+            tokens = parse.parse_qs(querystring, keep_blank_values=True)
+            value = Decimal(tokens["v"][0])
+            pk = int(tokens["i"][0])
+            reverse = bool(int(tokens.get("r", ["0"])[0]))
+        except (TypeError, ValueError, KeyError, UnicodeError, InvalidOperation):
+            raise NotFound(self.invalid_cursor_message)
+
+        if not value.is_finite():
+            raise NotFound(self.invalid_cursor_message)
+
+        return value, pk, reverse
+
+    def encode_cursor(self, obj, reverse: bool) -> str:
+        tokens = {"v": str(getattr(obj, self.field)), "i": obj.pk}
+        if reverse:
+            tokens["r"] = "1"
+        querystring = parse.urlencode(tokens, doseq=True)
+        encoded = b64encode(querystring.encode("ascii")).decode("ascii")
+        return replace_query_param(
+            self.request.build_absolute_uri(), self.cursor_query_param, encoded
+        )
+
+
+class ProductSearchPagination(PageNumberPagination):
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+    @property
+    def page_size(self):
+        return settings.PRODUCTS_PAGE_SIZE
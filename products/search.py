@@ -0,0 +1,105 @@
+import re
+
+from django.conf import settings
+from django.contrib.postgres.aggregates import StringAgg
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db import connection
+from django.db.models import (
+    Case,
+    F,
+    IntegerField,
+    OuterRef,
+    Q,
+    Subquery,
+    TextField,
+    Value,
+    When,
+)
+from django.db.models.functions import Coalesce
+
+from products.models import Category, Product
+
+
+def _uses_full_text_search() -> bool:
+    return connection.vendor == "postgresql"
+
+
+def search_terms(query: str) -> list:
+    return re.findall(r"\w+", query.lower())
+
+
+def update_search_vectors(product_ids) -> None:
+    """
+    Rebuild ``search_vector`` for the given products in a single UPDATE.
+
+    Names weigh more than descriptions, which weigh more than category names.
+    """
+    if not _uses_full_text_search():
+        return
+
+    config = settings.PRODUCTS_SEARCH_CONFIG
+    category_names = (
+        Category.objects.filter(products=OuterRef("pk"))
+        .order_by()
+        .values("products")
+        .annotate(names=StringAgg("name", delimiter=" "))
+        .values("names")
+    )
+    Product.objects.filter(pk__in=product_ids).update(
+        search_vector=(
+            SearchVector("name", weight="A", config=config)
+            + SearchVector("description", weight="B", config=config)
+            + SearchVector(
+                Coalesce(Subquery(category_names), Value("", output_field=TextField())),
+                weight="C",
+                config=config,
+            )
+        )
+    )
+
+
+def full_text_search(queryset, terms: list):
+    # Every term must match and each one is matched as a prefix, so
+    # partially typed words already find products.
+    search_query = SearchQuery(
+        " & ".join(f"{term}:*" for term in terms),
+        search_type="raw",
+        config=settings.PRODUCTS_SEARCH_CONFIG,
+    )
+    return (
+        queryset.filter(search_vector=search_query)
+        .annotate(rank=SearchRank(F("search_vector"), search_query))
+        .order_by("-rank", "id")
+    )
+
+
+def fallback_search(queryset, terms: list):
+    """
+    Substring search for databases without full-text support (SQLite).
+
+    Ranks matches in the name above matches in the description or categories.
+    """
+    rank = Value(0)
+    for term in terms:
+        queryset = queryset.filter(
+            Q(name__icontains=term)
+            | Q(description__icontains=term)
+            | Q(products__name__icontains=term)
+        )
+        rank = rank + Case(
+            When(name__icontains=term, then=Value(3)),
+            When(description__icontains=term, then=Value(2)),
+            default=Value(1),
+            output_field=IntegerField(),
+        )
+    return queryset.distinct().annotate(rank=rank).order_by("-rank", "id")
+
+
+def search_products(queryset, query: str):
+    terms = search_terms(query)
+    if not terms:
+        return queryset.none()
+
+    if _uses_full_text_search():
+        return full_text_search(queryset, terms)
+    return fallback_search(queryset, terms)
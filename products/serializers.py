@@ -1,16 +1,32 @@
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Max, prefetch_related_objects
 from rest_framework import serializers
-from products.models import Category, ImageProduct, Product
-from utils.upload_images import upload_cloud_image, destroy_cloud_image
+from products.categories import assign_categories
+from products.models import ImageProduct, Product, StockReservation
+from products.tasks import schedule_image_upload
 
 
 class ImageProductSerializer(serializers.ModelSerializer):
+    image_variants = serializers.SerializerMethodField()
+
     class Meta:
         model = ImageProduct
-        fields = ["image_url"]
+        fields = ["id", "image_url", "image_variants", "position", "is_primary"]
+
+    def get_image_variants(self, obj: ImageProduct):
+        # Images without generated variants (the placeholder, or an upload
+        # still in flight) fall back to the original for every size.
+        return {
+            name: obj.variants.get(name, {}).get("url", obj.image_url)
+            for name in settings.IMAGE_VARIANTS
+        }
 
 
 class ProductSerializer(serializers.ModelSerializer):
     image_url = serializers.SerializerMethodField(method_name="get_images")
+    image_variants = serializers.SerializerMethodField()
+    images = ImageProductSerializer(source="image_product", many=True, read_only=True)
 
     class Meta:
         model = Product
@@ -21,58 +37,113 @@ class ProductSerializer(serializers.ModelSerializer):
             "price",
             "stock",
             "discount",
+            "final_price",
             "slug",
             "image_url",
+            "image_variants",
+            "images",
         ]
         depth = 1
 
     def create(self, validated_data: dict):
         image = validated_data.pop("image", None)
+        images = list(validated_data.pop("images", None) or [])
         categories = validated_data.pop("categories", None)
 
-        if categories is not None:
-            for category in categories:
-                category = Category.objects.filter(name__iexact=category["name"])
-                category.products.add(product)
-
-        if image is None:
-            product = Product.objects.create(**validated_data)
-            ImageProduct.objects.create(product=product)
-            return product
+        if image is None and images:
+            image = images.pop(0)
 
-        else:
+        with transaction.atomic():
             product = Product.objects.create(**validated_data)
-            cloudinary_response = upload_cloud_image(image)
-
-            if cloudinary_response is not None:
-                ImageProduct.objects.create(
-                    image_url=cloudinary_response, product=product
-                )
-            return product
+            image_product = ImageProduct.objects.create(
+                product=product, is_primary=True
+            )
+            assign_categories([product.id], categories or [])
+
+            if image is not None:
+                schedule_image_upload(image_product, image)
+            self.add_gallery_images(product, images)
+
+        prefetch_related_objects([product], "image_product")
+        return product
+
+    def add_gallery_images(self, product: Product, images: list):
+        if not images:
+            return
+
+        last_position = product.image_product.aggregate(last=Max("position"))["last"]
+        image_products = ImageProduct.objects.bulk_create(
+            [
+                ImageProduct(product=product, position=(last_position or 0) + index)
+                for index in range(1, len(images) + 1)
+            ]
+        )
+        # Each image is its own background task, so a gallery uploads in
+        # parallel across the worker pool.
+        for image_product, image in zip(image_products, images):
+            schedule_image_upload(image_product, image)
+
+    def primary_image(self, obj: Product):
+        # Reads through the related manager so a prefetch_related("image_product")
+        # on the queryset is reused instead of issuing one query per product.
+        # Images are ordered primary first.
+        return next(iter(obj.image_product.all()), None)
 
     def get_images(self, obj: Product):
-        image_product = ImageProduct.objects.filter(product=obj).first()
-        image = ImageProductSerializer(instance=image_product)
+        image = ImageProductSerializer(instance=self.primary_image(obj))
         return image.data["image_url"]
 
+    def get_image_variants(self, obj: Product):
+        image_product = self.primary_image(obj)
+        if image_product is None:
+            return {name: self.get_images(obj) for name in settings.IMAGE_VARIANTS}
+        return ImageProductSerializer(instance=image_product).data["image_variants"]
+
     def update(self, instance: Product, validated_data: dict):
         image = validated_data.pop("image", None)
+        images = validated_data.pop("images", None)
+        categories = validated_data.pop("categories", None)
 
         for key, value in validated_data.items():
             setattr(instance, key, value)
 
-        if image is not None:
-            image_product_db = ImageProduct.objects.get(product=instance)
-            if destroy_cloud_image(image_product_db.image_url):
-                image_product_db.delete()
+        with transaction.atomic():
+            assign_categories([instance.id], categories or [])
 
-            cloudinary_response = upload_cloud_image(image)
+            if image is not None:
+                # Images are ordered primary first, so this is the image shown
+                # as the product's image_url.
+                image_product = ImageProduct.objects.filter(product=instance).first()
+                if image_product is None:
+                    image_product = ImageProduct.objects.create(
+                        product=instance, is_primary=True
+                    )
 
-            if cloudinary_response is not None:
-                ImageProduct.objects.create(
-                    image_url=cloudinary_response, product=instance
-                )
+                schedule_image_upload(image_product, image)
+            self.add_gallery_images(instance, images)
 
-        instance.save()
+            # Only the submitted fields are written, so a PATCH that leaves
+            # stock alone cannot overwrite a concurrent decrement_stock().
+            # post_save bumps the catalog version whatever the fields are,
+            # and assign_categories() does for category-only changes.
+            instance.save(update_fields=[*validated_data, "updated_at"])
 
+        prefetch_related_objects([instance], "image_product")
         return instance
+
+
+class StockItemSerializer(serializers.Serializer):
+    slug = serializers.CharField()
+    quantity = serializers.IntegerField(min_value=1)
+
+
+class StockDecrementSerializer(serializers.Serializer):
+    items = StockItemSerializer(many=True, allow_empty=False)
+
+
+class StockReservationSerializer(serializers.ModelSerializer):
+    slug = serializers.CharField(source="product.slug", read_only=True)
+
+    class Meta:
+        model = StockReservation
+        fields = ["id", "slug", "quantity", "expires_at"]
@@ -0,0 +1,94 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+from django.utils import timezone
+
+from products.cache import bump_catalog_version, bump_pricing_version
+from products.models import Category, ImageProduct, Product
+from products.search import update_search_vectors
+
+
+# Fields shown in a priced cart.
+PRICED_FIELDS = {"name", "slug", "price", "discount", "final_price"}
+
+
+def touch_products(product_ids) -> None:
+    Product.objects.filter(pk__in=product_ids).update(updated_at=timezone.now())
+
+
+@receiver(post_save, sender=ImageProduct)
+@receiver(post_delete, sender=ImageProduct)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(m2m_changed, sender=Category.products.through)
+def invalidate_catalog_cache(sender, action: str = "post", **kwargs):
+    if action.startswith("post"):
+        bump_catalog_version()
+
+
+@receiver(post_save, sender=Product)
+def invalidate_product_caches(sender, update_fields, **kwargs):
+    # Every write changes what the catalog shows; carts only depend on the
+    # priced fields, so sales and restocks leave them cached.
+    bump_catalog_version()
+    if update_fields is None or PRICED_FIELDS & set(update_fields):
+        bump_pricing_version()
+
+
+@receiver(post_delete, sender=Product)
+def invalidate_deleted_product_caches(sender, **kwargs):
+    bump_catalog_version()
+    bump_pricing_version()
+
+
+@receiver(post_save, sender=ImageProduct)
+@receiver(post_delete, sender=ImageProduct)
+def touch_image_product(sender, instance: ImageProduct, **kwargs):
+    touch_products([instance.product_id])
+
+
+@receiver(m2m_changed, sender=Category.products.through)
+def refresh_category_products(
+    sender, instance, action: str, reverse: bool, pk_set, **kwargs
+):
+    if reverse:
+        product_ids = [instance.pk]
+    elif action == "pre_clear":
+        # The affected products are gone from the relation after the clear.
+        instance._cleared_product_ids = list(
+            instance.products.values_list("pk", flat=True)
+        )
+        return
+    elif action == "post_clear":
+        product_ids = instance.__dict__.pop("_cleared_product_ids", [])
+    else:
+        product_ids = pk_set
+
+    if action in ("post_add", "post_remove", "post_clear") and product_ids:
+        touch_products(product_ids)
+        update_search_vectors(product_ids)
+
+
+@receiver(post_save, sender=Product)
+def refresh_product_search_vector(sender, instance: Product, update_fields, **kwargs):
+    if update_fields is None or {"name", "description"} & set(update_fields):
+        update_search_vectors([instance.pk])
+
+
+@receiver(pre_delete, sender=Category)
+def remember_category_products(sender, instance: Category, **kwargs):
+    instance._deleted_product_ids = list(instance.products.values_list("pk", flat=True))
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def refresh_category_search_vectors(sender, instance: Category, **kwargs):
+    if "_deleted_product_ids" in instance.__dict__:
+        product_ids = instance._deleted_product_ids
+    else:
+        product_ids = list(instance.products.values_list("pk", flat=True))
+
+    if product_ids:
+        # The catalog ETag and Last-Modified follow product updated_at, and
+        # the category name shows up in those products' facets.
+        touch_products(product_ids)
+        update_search_vectors(product_ids)
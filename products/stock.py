@@ -0,0 +1,219 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce, Now
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.exceptions import APIException, NotFound
+
+from products.cache import bump_catalog_version
+from products.models import Product, StockReservation
+from users.models import User
+
+
+class InsufficientStock(APIException):
+    status_code = status.HTTP_409_CONFLICT
+    default_detail = "Insufficient stock."
+    default_code = "insufficient_stock"
+
+
+class ReservationLimitExceeded(APIException):
+    status_code = status.HTTP_409_CONFLICT
+    default_detail = "Reservation limit exceeded."
+    default_code = "reservation_limit_exceeded"
+
+
+def resolve_quantities(items) -> dict:
+    """
+    Map ``[{"slug": ..., "quantity": ...}]`` to ``{product_id: quantity}``,
+    summing repeated slugs, with a single lookup query.
+    """
+    quantities_by_slug = {}
+    for item in items:
+        slug = item["slug"]
+        quantities_by_slug[slug] = quantities_by_slug.get(slug, 0) + item["quantity"]
+
+    product_ids = dict(
+        Product.objects.filter(slug__in=quantities_by_slug).values_list("slug", "id")
+    )
+    missing = sorted(set(quantities_by_slug) - set(product_ids))
+    if missing:
+        raise NotFound(f"Products not found: {', '.join(missing)}.")
+
+    return {
+        product_ids[slug]: quantity for slug, quantity in quantities_by_slug.items()
+    }
+
+
+def available_stock(product_ids, exclude_user_id: int = None, lock: bool = False):
+    """
+    Return ``{product_id: stock - active reservations}`` in one query.
+
+    Reservations of ``exclude_user_id`` are not subtracted, and with ``lock``
+    the product rows are locked, in id order, until the transaction ends.
+    """
+    reservations = StockReservation.objects.filter(
+        product=OuterRef("pk"), expires_at__gt=Now()
+    )
+    if exclude_user_id is not None:
+        reservations = reservations.exclude(user_id=exclude_user_id)
+    reserved = (
+        reservations.order_by()
+        .values("product")
+        .annotate(total=Sum("quantity"))
+        .values("total")
+    )
+
+    products = Product.objects.filter(pk__in=product_ids).order_by("id")
+    if lock:
+        # Locked in a statement of its own: the aggregate below must read
+        # the reservations committed while we waited for the locks, which a
+        # query that waited inside FOR UPDATE would not see.
+        list(products.select_for_update().values_list("id", flat=True))
+
+    return dict(
+        products.annotate(
+            available=F("stock") - Coalesce(Subquery(reserved), 0)
+        ).values_list("id", "available")
+    )
+
+
+def _check_available(quantities: dict, available: dict) -> None:
+    for product_id in sorted(quantities):
+        if available[product_id] < quantities[product_id]:
+            slug = Product.objects.values_list("slug", flat=True).get(pk=product_id)
+            raise InsufficientStock(f"Insufficient stock for product {slug}.")
+
+
+def _check_reservation_limits(user_id: int, quantities: dict) -> None:
+    held = dict(
+        StockReservation.objects.filter(user_id=user_id, expires_at__gt=Now())
+        .order_by()
+        .values("product")
+        .annotate(total=Sum("quantity"))
+        .values_list("product", "total")
+    )
+
+    if len(held.keys() | quantities.keys()) > settings.STOCK_RESERVATION_MAX_ACTIVE:
+        raise ReservationLimitExceeded(
+            "Cannot hold more than "
+            f"{settings.STOCK_RESERVATION_MAX_ACTIVE} products at once."
+        )
+
+    max_quantity = settings.STOCK_RESERVATION_MAX_QUANTITY
+    for product_id in sorted(quantities):
+        if held.get(product_id, 0) + quantities[product_id] > max_quantity:
+            raise ReservationLimitExceeded(
+                f"Cannot hold more than {max_quantity} units of a product."
+            )
+
+
+def reserve_stock(user_id: int, quantities: dict, ttl: int = None) -> list:
+    """
+    Hold ``quantities`` for ``user_id`` for ``ttl`` seconds without touching
+    ``Product.stock``; expired holds simply stop counting.
+
+    A user holds at most ``STOCK_RESERVATION_MAX_QUANTITY`` units of a
+    product and ``STOCK_RESERVATION_MAX_ACTIVE`` products at once, so a
+    single account cannot lock up the inventory.
+    """
+    ttl = settings.STOCK_RESERVATION_TTL if ttl is None else ttl
+    with transaction.atomic():
+        # Serializes the reservations of one user, so concurrent requests
+        # cannot each pass the limits on their own.
+        list(
+            User.objects.select_for_update(no_key=True).filter(pk=user_id).values("pk")
+        )
+        _check_reservation_limits(user_id, quantities)
+        _check_available(quantities, available_stock(quantities, lock=True))
+
+        expires_at = timezone.now() + timedelta(seconds=ttl)
+        return StockReservation.objects.bulk_create(
+            [
+                StockReservation(
+                    product_id=product_id,
+                    user_id=user_id,
+                    quantity=quantities[product_id],
+                    expires_at=expires_at,
+                )
+                for product_id in sorted(quantities)
+            ]
+        )
+
+
+def release_expired_reservations(batch_size: int = 1000) -> int:
+    """
+    Delete expired reservations in batches of ``batch_size``, oldest first.
+
+    Returns how many were deleted. Expired rows are already ignored by
+    ``available_stock``, so this only keeps the table small.
+    """
+    released = 0
+    while True:
+        expired = (
+            StockReservation.objects.filter(expires_at__lte=Now())
+            .order_by("expires_at")
+            .values("id")[:batch_size]
+        )
+        deleted, _ = StockReservation.objects.filter(id__in=expired).delete()
+        released += deleted
+        if deleted < batch_size:
+            return released
+
+
+def consume_reservations(user_id: int, quantities: dict) -> None:
+    """
+    Release ``quantities`` from the active holds of ``user_id``, soonest to
+    expire first; whatever the user held beyond that stays reserved.
+    """
+    remaining = dict(quantities)
+    consumed, reduced = [], []
+    reservations = StockReservation.objects.filter(
+        user_id=user_id, product_id__in=quantities, expires_at__gt=Now()
+    ).order_by("product_id", "expires_at", "id")
+    for reservation in reservations:
+        quantity = remaining[reservation.product_id]
+        if not quantity:
+            continue
+        if reservation.quantity <= quantity:
+            consumed.append(reservation.pk)
+            remaining[reservation.product_id] -= reservation.quantity
+        else:
+            reservation.quantity -= quantity
+            reduced.append(reservation)
+            remaining[reservation.product_id] = 0
+
+    StockReservation.objects.filter(pk__in=consumed).delete()
+    StockReservation.objects.bulk_update(reduced, ["quantity"])
+
+
+def decrement_stock(quantities: dict, user_id: int = None) -> None:
+    """
+    Take ``quantities`` (``{product_id: quantity}``) out of stock atomically.
+
+    Product rows are locked in id order, so overlapping multi-product calls
+    cannot deadlock, and stock held by other users' reservations is not
+    sold. The ``UPDATE ... SET stock = stock - n WHERE stock >= n`` keeps
+    stock from ever going negative. Either every product is decremented or
+    none is; the quantities sold are released from ``user_id``'s own holds.
+    """
+    with transaction.atomic():
+        _check_available(
+            quantities,
+            available_stock(quantities, exclude_user_id=user_id, lock=True),
+        )
+
+        for product_id in sorted(quantities):
+            quantity = quantities[product_id]
+            Product.objects.filter(pk=product_id, stock__gte=quantity).update(
+                stock=F("stock") - quantity, updated_at=Now()
+            )
+
+        if user_id is not None:
+            consume_reservations(user_id, quantities)
+
+        # QuerySet.update() bypasses the signals that invalidate the catalog;
+        # cached carts stay valid since no price changed.
+        bump_catalog_version()
@@ -0,0 +1,113 @@
+import io
+
+from django.core.files.base import File
+from django.db import connection, transaction
+
+from products.models import ImageProduct
+from utils.background import enqueue
+from utils.image_variants import generate_variants
+from utils.upload_images import destroy_image, upload_image
+
+# Advisory lock taken shared by uploads and exclusively by releases.
+IMAGE_RELEASE_LOCK = 0x1A6E5
+
+
+def _lock_image_release(shared: bool) -> None:
+    # Storage keys nobody references have no row to lock, so uploads hold
+    # this lock from storing an image until the row pointing at it commits,
+    # and a release can't destroy a file that is about to be referenced.
+    if connection.vendor != "postgresql":
+        return
+
+    function = "pg_advisory_xact_lock_shared" if shared else "pg_advisory_xact_lock"
+    with connection.cursor() as cursor:
+        cursor.execute(f"SELECT {function}(%s)", [IMAGE_RELEASE_LOCK])
+
+
+def detach_upload(image) -> File:
+    """
+    Take over the content of an uploaded file so it outlives the request.
+
+    Django closes uploaded files when the response is sent, deleting the
+    temporary file of large uploads. Reopening that file keeps its data
+    readable after the name is unlinked, and in-memory uploads hand over
+    their buffer, so nothing is copied and storage streams ``chunks()``.
+    """
+    if hasattr(image, "temporary_file_path"):
+        return File(open(image.temporary_file_path(), "rb"), name=image.name)
+
+    content = File(image.file, name=image.name)
+    image.file = io.BytesIO()
+    return content
+
+
+def schedule_image_upload(image_product: ImageProduct, image) -> None:
+    # Enqueueing on commit guarantees the row the worker swaps is visible
+    # to its connection.
+    content = detach_upload(image)
+    transaction.on_commit(
+        lambda: enqueue(upload_product_image, image_product.pk, content)
+    )
+
+
+def schedule_image_release(images) -> None:
+    images = [
+        (storage_key, variants) for storage_key, variants in images if storage_key
+    ]
+    if images:
+        transaction.on_commit(lambda: enqueue(release_images, images))
+
+
+def release_images(images) -> None:
+    """
+    Destroy stored images given as ``(storage_key, variants)`` pairs.
+
+    Stored images are content-addressed, so another product may share the
+    same key; only keys no image row references anymore are destroyed, along
+    with the variants generated from them.
+    """
+    images = dict(images)
+    with transaction.atomic():
+        _lock_image_release(shared=False)
+        referenced = set(
+            ImageProduct.objects.filter(storage_key__in=images).values_list(
+                "storage_key", flat=True
+            )
+        )
+        for storage_key, variants in images.items():
+            if storage_key in referenced:
+                continue
+
+            destroy_image(storage_key)
+            for variant in variants.values():
+                destroy_image(variant["key"])
+
+
+def upload_product_image(image_product_id: int, image) -> None:
+    try:
+        with transaction.atomic():
+            _lock_image_release(shared=True)
+            stored_image = upload_image(image)
+            variants = {}
+            for name, variant_file in generate_variants(image).items():
+                stored_variant = upload_image(variant_file)
+                variants[name] = {"key": stored_variant.key, "url": stored_variant.url}
+
+            image_product = ImageProduct.objects.filter(pk=image_product_id).first()
+            if image_product is None:
+                # The product was deleted while the upload was in flight.
+                schedule_image_release([(stored_image.key, variants)])
+                return
+
+            previous_image = (image_product.storage_key, image_product.variants)
+            image_product.image_url = stored_image.url
+            image_product.storage_key = stored_image.key
+            image_product.variants = variants
+            image_product.save(update_fields=["image_url", "storage_key", "variants"])
+
+            if previous_image[0] != stored_image.key:
+                # Released once the lock is gone, as waiting for it here could
+                # deadlock with other uploads.
+                schedule_image_release([previous_image])
+    finally:
+        image.close()
@@ -1,8 +1,35 @@
 from django.urls import path
-from products.views import ProductCreateListView, ProductDetailView
+from products.views import (
+    ProductCreateListView,
+    ProductDetailView,
+    ProductExportView,
+    ProductImportView,
+    ProductSearchView,
+    StockDecrementView,
+    StockReservationCreateView,
+    StockReservationDetailView,
+)
 
 urlpatterns = [
+    path("products/export/", ProductExportView.as_view(), name="products_export"),
+    path("products/import/", ProductImportView.as_view(), name="products_import"),
+    path(
+        "products/stock/decrement/",
+        StockDecrementView.as_view(),
+        name="products_stock_decrement",
+    ),
+    path(
+        "products/stock/reservations/",
+        StockReservationCreateView.as_view(),
+        name="products_stock_reservations",
+    ),
+    path(
+        "products/stock/reservations/<int:pk>/",
+        StockReservationDetailView.as_view(),
+        name="products_stock_reservation",
+    ),
     path("product/create/", ProductCreateListView.as_view(), name="product_create"),
     path("product/<str:slug>/", ProductDetailView.as_view(), name="product_details"),
     path("products/catalog/", ProductCreateListView.as_view(), name="products_catalog"),
+    path("products/search/", ProductSearchView.as_view(), name="products_search"),
 ]
@@ -1,24 +1,61 @@
+import os
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
 from rest_framework.generics import ListCreateAPIView, RetrieveUpdateDestroyAPIView
-from products.models import ImageProduct, Product
-from products.serializers import ProductSerializer
-from users.permissions import IsAdmin
+from products.cache import cached_response
+from products.conditional import (
+    catalog_etag,
+    catalog_last_modified,
+    product_etag,
+    product_last_modified,
+)
+from products.exporter import CONTENT_TYPES, EXPORT_FORMATS, render_export
+from products.filters import catalog_facets, filter_catalog
+from products.importer import (
+    IMPORT_FORMATS,
+    check_encoding,
+    import_products,
+    read_rows,
+)
+from products.models import ImageProduct, Product, StockReservation
+from products.pagination import ProductCursorPagination, ProductSearchPagination
+from products.search import search_products, search_terms
+from products.serializers import (
+    ProductSerializer,
+    StockDecrementSerializer,
+    StockReservationSerializer,
+)
+from products.stock import decrement_stock, reserve_stock, resolve_quantities
+from products.tasks import schedule_image_release
+from users.permissions import IsAdmin, IsAdminForAllMethods
+from rest_framework.permissions import IsAuthenticated
 from rest_framework.views import APIView, Request, Response, status
 from rest_framework import serializers
 from rest_framework.parsers import MultiPartParser, FormParser
 from django.db.models import Q
 
-from utils.upload_images import destroy_cloud_image
-
 
 class ProductCreateListView(APIView):
     permission_classes = [IsAdmin]
     parser_classes = [MultiPartParser, FormParser]
 
+    @method_decorator(
+        condition(etag_func=catalog_etag, last_modified_func=catalog_last_modified)
+    )
     def get(self, request: Request) -> Response:
-        products = Product.objects.all().order_by("price")
-        serializer = ProductSerializer(instance=products, many=True)
-        return Response(serializer.data, status.HTTP_200_OK)
+        return cached_response(request, lambda: self.list_catalog(request))
+
+    def list_catalog(self, request: Request) -> Response:
+        products = filter_catalog(Product.objects.with_images(), request.query_params)
+
+        paginator = ProductCursorPagination()
+        page = paginator.paginate_queryset(products, request, view=self)
+        serializer = ProductSerializer(instance=page, many=True)
+        response = paginator.get_paginated_response(serializer.data)
+        response.data["facets"] = catalog_facets(products)
+        return response
 
     def post(self, request: Request) -> Response:
         data_request = self.request.data
@@ -35,7 +72,11 @@ class ProductCreateListView(APIView):
         ]
         serializer = ProductSerializer(data=data_request)
         serializer.is_valid(raise_exception=True)
-        serializer.save(categories=categories, image=request.FILES.get("image"))
+        serializer.save(
+            categories=categories,
+            image=request.FILES.get("image"),
+            images=request.FILES.getlist("images"),
+        )
         return Response(serializer.data, status.HTTP_201_CREATED)
 
 
@@ -43,8 +84,14 @@ class ProductDetailView(APIView):
     permission_classes = [IsAdmin]
     parser_classes = [MultiPartParser, FormParser]
 
+    @method_decorator(
+        condition(etag_func=product_etag, last_modified_func=product_last_modified)
+    )
     def get(self, request: Request, slug: str):
-        product = get_object_or_404(Product, slug=slug)
+        return cached_response(request, lambda: self.retrieve_product(slug))
+
+    def retrieve_product(self, slug: str) -> Response:
+        product = get_object_or_404(Product.objects.with_images(), slug=slug)
         serializer = ProductSerializer(instance=product)
         return Response(serializer.data, status.HTTP_200_OK)
 
@@ -56,18 +103,124 @@ class ProductDetailView(APIView):
         categories = [
             value for key, value in data_request.items() if key.startswith("category_")
         ]
-        serializer.save(categories=categories, image=request.FILES.get("image", None))
+        serializer.save(
+            categories=categories,
+            image=request.FILES.get("image", None),
+            images=request.FILES.getlist("images"),
+        )
         return Response(serializer.data, status.HTTP_200_OK)
 
     def delete(self, request: Request, slug: str):
         product = get_object_or_404(Product, slug=slug)
-        image_product = get_object_or_404(ImageProduct, product=product)
+        images = list(product.image_product.values_list("storage_key", "variants"))
 
-        if destroy_cloud_image(image_product.image_url):
-            product.delete()
-            return Response(status=status.HTTP_204_NO_CONTENT)
-        else:
-            return Response(
-                {"Error": "Internal Server Error"},
-                status.HTTP_500_INTERNAL_SERVER_ERROR,
+        product.delete()
+        schedule_image_release(images)
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class ProductSearchView(APIView):
+    def get(self, request: Request) -> Response:
+        return cached_response(request, lambda: self.search(request))
+
+    def search(self, request: Request) -> Response:
+        query = request.query_params.get("q", "")
+        if not search_terms(query):
+            raise serializers.ValidationError({"q": ["This field is required."]})
+
+        paginator = ProductSearchPagination()
+        products = paginator.paginate_queryset(
+            search_products(Product.objects.with_images(), query), request, view=self
+        )
+        serializer = ProductSerializer(instance=products, many=True)
+        return paginator.get_paginated_response(serializer.data)
+
+
+class ProductImportView(APIView):
+    permission_classes = [IsAdmin]
+    parser_classes = [MultiPartParser, FormParser]
+
+    def post(self, request: Request) -> Response:
+        file = request.FILES.get("file")
+        if file is None:
+            raise serializers.ValidationError({"file": ["No file was submitted."]})
+
+        extension = os.path.splitext(file.name)[1].lstrip(".")
+        file_format = request.data.get("file_format") or extension
+        if file_format not in IMPORT_FORMATS:
+            raise serializers.ValidationError(
+                {"file_format": [f"Must be one of: {', '.join(IMPORT_FORMATS)}."]}
             )
+
+        try:
+            check_encoding(file)
+        except UnicodeDecodeError:
+            raise serializers.ValidationError(
+                {"file": ["The file must be encoded as UTF-8."]}
+            )
+
+        result = import_products(read_rows(file, file_format))
+        return Response(result, status.HTTP_200_OK)
+
+
+class ProductExportView(APIView):
+    permission_classes = [IsAdminForAllMethods]
+
+    def get(self, request: Request):
+        file_format = request.query_params.get("output", "ndjson")
+        if file_format not in EXPORT_FORMATS:
+            raise serializers.ValidationError(
+                {"output": [f"Must be one of: {', '.join(EXPORT_FORMATS)}."]}
+            )
+
+        response = StreamingHttpResponse(
+            render_export(file_format), content_type=CONTENT_TYPES[file_format]
+        )
+        response["Content-Disposition"] = (
+            f'attachment; filename="products.{file_format}"'
+        )
+        return response
+
+
+class StockDecrementView(APIView):
+    permission_classes = [IsAdmin]
+
+    def post(self, request: Request) -> Response:
+        serializer = StockDecrementSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        quantities = resolve_quantities(serializer.validated_data["items"])
+        decrement_stock(quantities)
+
+        stock = Product.objects.filter(pk__in=quantities).values("slug", "stock")
+        return Response({"items": list(stock.order_by("id"))}, status.HTTP_200_OK)
+
+
+class StockReservationCreateView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request: Request) -> Response:
+        serializer = StockDecrementSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        quantities = resolve_quantities(serializer.validated_data["items"])
+        reservations = reserve_stock(request.user.id, quantities)
+
+        reservations = StockReservation.objects.select_related("product").filter(
+            pk__in=[reservation.pk for reservation in reservations]
+        )
+        serializer = StockReservationSerializer(
+            instance=reservations.order_by("id"), many=True
+        )
+        return Response({"reservations": serializer.data}, status.HTTP_201_CREATED)
+
+
+class StockReservationDetailView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def delete(self, request: Request, pk: int) -> Response:
+        reservation = get_object_or_404(
+            StockReservation, pk=pk, user_id=request.user.id
+        )
+        reservation.delete()
+        return Response(status=status.HTTP_204_NO_CONTENT)
@@ -0,0 +1,226 @@
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from cart.models import Cart, CartItem
+from login.revocation import revocation_list
+from products.models import Product
+from products.stock import decrement_stock, reserve_stock
+from users.models import User
+
+
+class TestCartViews(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.cart_url = reverse("cart")
+        cls.cart_items_url = reverse("cart_items")
+
+        cls.user = User.objects.create_user(
+            username="user", email="user@example.com", password="12345"
+        )
+        User.objects.create_user(
+            username="other", email="other@example.com", password="12345"
+        )
+        cls.token = (
+            cls.client_class()
+            .post(path=reverse("auth"), data={"username": "user", "password": "12345"})
+            .data["access"]
+        )
+        cls.other_token = (
+            cls.client_class()
+            .post(path=reverse("auth"), data={"username": "other", "password": "12345"})
+            .data["access"]
+        )
+
+        cls.ball = Product.objects.create(
+            name="Bola",
+            description="Bola oficial",
+            price=100,
+            slug="bola",
+            stock=5,
+            discount=10,
+        )
+        cls.shirt = Product.objects.create(
+            name="Camisa",
+            description="Camisa azul",
+            price=59.90,
+            slug="camisa",
+            stock=3,
+        )
+
+    def setUp(self) -> None:
+        cache.clear()
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + self.token)
+
+    def add(self, slug: str, quantity: int = 1):
+        return self.client.post(
+            path=self.cart_items_url,
+            data={"product": slug, "quantity": quantity},
+            format="json",
+        )
+
+    def test_empty_cart(self):
+        response = self.client.get(path=self.cart_url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.data,
+            {
+                "items": [],
+                "quantity": 0,
+                "subtotal": "0.00",
+                "discount_total": "0.00",
+                "total": "0.00",
+            },
+        )
+
+    def test_can_add_items_with_discount_applied(self):
+        self.add("bola", 2)
+        response = self.add("camisa")
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(
+            response.data["items"],
+            [
+                {
+                    "product": "bola",
+                    "name": "Bola",
+                    "quantity": 2,
+                    "unit_price": "100.00",
+                    "discount": 10,
+                    "final_unit_price": "90.00",
+                    "total": "180.00",
+                },
+                {
+                    "product": "camisa",
+                    "name": "Camisa",
+                    "quantity": 1,
+                    "unit_price": "59.90",
+                    "discount": 0,
+                    "final_unit_price": "59.90",
+                    "total": "59.90",
+                },
+            ],
+        )
+        self.assertEqual(response.data["quantity"], 3)
+        self.assertEqual(response.data["subtotal"], "259.90")
+        self.assertEqual(response.data["discount_total"], "20.00")
+        self.assertEqual(response.data["total"], "239.90")
+
+    def test_adding_the_same_product_sums_quantities(self):
+        self.add("bola", 2)
+        response = self.add("bola", 1)
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(CartItem.objects.get().quantity, 3)
+
+    def test_cannot_add_more_than_in_stock(self):
+        self.add("camisa", 2)
+        response = self.add("camisa", 2)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data["quantity"], ["Only 3 items in stock."])
+        self.assertEqual(CartItem.objects.get().quantity, 2)
+
+    def test_cannot_add_stock_held_by_other_users(self):
+        other = User.objects.get(username="other")
+        reserve_stock(other.id, {self.shirt.id: 2})
+        reserve_stock(self.user.id, {self.shirt.id: 1})
+
+        self.assertEqual(self.add("camisa", 1).status_code, 201)
+        response = self.add("camisa", 1)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data["quantity"], ["Only 1 items in stock."])
+
+    def test_cannot_add_unknown_product(self):
+        response = self.add("raquete")
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_can_update_and_remove_items(self):
+        self.add("bola")
+        item_url = reverse("cart_item", kwargs={"slug": "bola"})
+
+        response = self.client.patch(path=item_url, data={"quantity": 4}, format="json")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["total"], "360.00")
+
+        response = self.client.delete(path=item_url)
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(self.client.get(path=self.cart_url).data["items"], [])
+
+    def test_can_clear_cart(self):
+        self.add("bola")
+        self.add("camisa")
+
+        response = self.client.delete(path=self.cart_url)
+
+        self.assertEqual(response.status_code, 204)
+        self.assertFalse(CartItem.objects.exists())
+
+    def test_items_of_other_users_are_not_visible(self):
+        self.add("bola")
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + self.other_token)
+
+        response = self.client.get(path=self.cart_url)
+        self.assertEqual(response.data["items"], [])
+
+        response = self.client.delete(reverse("cart_item", kwargs={"slug": "bola"}))
+        self.assertEqual(response.status_code, 404)
+
+    def test_cart_is_priced_in_one_query_and_then_cached(self):
+        cart = Cart.objects.create(user=self.user)
+        products = [
+            Product.objects.create(
+                name=f"Produto {i}",
+                description="Produto",
+                price=10 + i,
+                slug=f"produto-{i}",
+                stock=10,
+                discount=i,
+            )
+            for i in range(20)
+        ]
+        CartItem.objects.bulk_create(
+            [CartItem(cart=cart, product=product) for product in products]
+        )
+
+        # Keeps the periodic revocation sync out of the counted requests.
+        revocation_list.sync(force=True)
+
+        # Cart lookup and one pricing query; the user comes from the token.
+        with self.assertNumQueries(2):
+            response = self.client.get(path=self.cart_url)
+        self.assertEqual(len(response.data["items"]), 20)
+
+        with self.assertNumQueries(1):
+            cached = self.client.get(path=self.cart_url)
+        self.assertEqual(cached.data, response.data)
+
+    def test_price_change_refreshes_cached_totals(self):
+        self.add("bola")
+        self.assertEqual(self.client.get(path=self.cart_url).data["total"], "90.00")
+
+        self.ball.price = 200
+        self.ball.save()
+
+        self.assertEqual(self.client.get(path=self.cart_url).data["total"], "180.00")
+
+    def test_sales_keep_carts_cached(self):
+        self.add("bola")
+        revocation_list.sync(force=True)
+        self.client.get(path=self.cart_url)
+
+        decrement_stock({self.ball.pk: 1})
+        self.ball.stock = 3
+        self.ball.save(update_fields=["stock"])
+
+        with self.assertNumQueries(1):
+            self.client.get(path=self.cart_url)
+
+    def test_anonymous_user_has_no_cart(self):
+        self.client.credentials()
+
+        response = self.client.get(path=self.cart_url)
+
+        self.assertEqual(response.status_code, 401)
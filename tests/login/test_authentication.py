@@ -0,0 +1,92 @@
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+from login.revocation import revocation_list
+from users.models import User
+
+
+class TestStatelessJWTAuthentication(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.profile_url = reverse("profile")
+        cls.users_url = reverse("users")
+
+        cls.user = User.objects.create_user(
+            username="user", email="user@example.com", password="12345"
+        )
+        User.objects.create_user(
+            username="staff", email="staff@example.com", password="12345", is_staff=True
+        )
+        cls.token = (
+            cls.client_class()
+            .post(path=reverse("auth"), data={"username": "user", "password": "12345"})
+            .data["access"]
+        )
+        cls.staff_token = (
+            cls.client_class()
+            .post(path=reverse("auth"), data={"username": "staff", "password": "12345"})
+            .data["access"]
+        )
+
+    def setUp(self) -> None:
+        cache.clear()
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + self.token)
+        # Drops revocations of rolled back tests and keeps the periodic
+        # revocation sync out of the counted requests.
+        revocation_list.clear()
+        revocation_list.sync(force=True)
+
+    def test_token_carries_user_claims(self):
+        token = AccessToken(self.staff_token)
+
+        self.assertEqual(token["username"], "staff")
+        self.assertEqual(token["email"], "staff@example.com")
+        self.assertTrue(token["is_staff"])
+        self.assertFalse(token["is_superuser"])
+
+    def test_safe_requests_do_not_load_the_user(self):
+        # Only the profile itself is queried.
+        with self.assertNumQueries(1):
+            response = self.client.get(path=self.profile_url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["username"], "user")
+
+    def test_staff_claim_is_used_for_admin_checks(self):
+        self.assertEqual(self.client.get(path=self.users_url).status_code, 403)
+
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + self.staff_token)
+        self.assertEqual(self.client.get(path=self.users_url).status_code, 200)
+
+    def test_writes_reject_inactive_users(self):
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+
+        response = self.client.patch(
+            path=self.profile_url, data={"first_name": "Novo"}, format="json"
+        )
+
+        self.assertEqual(response.status_code, 401)
+
+    @override_settings(JWT_USER_CACHE_TTL=60)
+    def test_writes_use_the_cached_user(self):
+        cart_url = reverse("cart")
+        self.client.delete(path=cart_url)
+
+        # Cart lookup plus the delete and touch in their savepoint; the user
+        # itself comes from the cache.
+        with self.assertNumQueries(5):
+            response = self.client.delete(path=cart_url)
+        self.assertEqual(response.status_code, 204)
+
+    @override_settings(JWT_USER_CACHE_TTL=60)
+    def test_saving_the_user_evicts_the_cached_user(self):
+        self.client.patch(path=self.profile_url, data={"first_name": "A"})
+
+        self.user.refresh_from_db()
+        self.user.is_active = False
+        self.user.save()
+
+        response = self.client.patch(path=self.profile_url, data={"first_name": "B"})
+        self.assertEqual(response.status_code, 401)
@@ -0,0 +1,87 @@
+import threading
+from io import StringIO
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from login.hashers import run_in_hash_pool
+from users.models import User
+
+ARGON2_FIRST = [
+    "login.hashers.Argon2PasswordHasher",
+    "login.hashers.PBKDF2PasswordHasher",
+]
+
+
+class TestPasswordHashing(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = User.objects.create_user(
+            username="user", email="user@example.com", password="12345"
+        )
+
+    def login(self):
+        return self.client.post(
+            path=reverse("auth"), data={"username": "user", "password": "12345"}
+        )
+
+    @override_settings(PASSWORD_HASHERS=ARGON2_FIRST)
+    def test_login_rehashes_with_the_preferred_hasher(self):
+        access = self.login().data["access"]
+        self.user.refresh_from_db()
+
+        self.assertTrue(self.user.password.startswith("argon2$"))
+        self.assertEqual(self.login().status_code, 200)
+
+        # A rehash is not a password change, so earlier tokens stay valid.
+        response = self.client.get(
+            path=reverse("profile"), headers={"Authorization": "Bearer " + access}
+        )
+        self.assertEqual(response.status_code, 200)
+
+    @override_settings(PBKDF2_ITERATIONS=1000)
+    def test_login_rehashes_when_the_cost_changes(self):
+        self.assertEqual(self.login().status_code, 200)
+
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.password.startswith("pbkdf2_sha256$1000$"))
+
+    def test_registration_hashes_with_the_preferred_hasher(self):
+        with self.settings(PASSWORD_HASHERS=ARGON2_FIRST):
+            self.client.post(
+                path=reverse("register"),
+                data={
+                    "username": "new",
+                    "email": "new@example.com",
+                    "password": "12345",
+                    "first_name": "New",
+                    "last_name": "User",
+                },
+            )
+
+        user = User.objects.get(username="new")
+        self.assertTrue(user.password.startswith("argon2$"))
+        self.assertTrue(user.check_password("12345"))
+
+    def test_hashes_run_on_the_bounded_pool(self):
+        def thread_name():
+            return threading.current_thread().name
+
+        self.assertTrue(run_in_hash_pool(thread_name).startswith("password-hash"))
+        # Hashers calling each other from inside the pool must not deadlock.
+        self.assertTrue(
+            run_in_hash_pool(run_in_hash_pool, thread_name).startswith("password-hash")
+        )
+
+    @override_settings(PBKDF2_ITERATIONS=1000)
+    def test_benchmark_logins_command(self):
+        output = StringIO()
+
+        call_command(
+            "benchmark_logins", "--hashers", "pbkdf2", "--logins", "4", stdout=output
+        )
+
+        self.assertRegex(
+            output.getvalue(),
+            r"pbkdf2: [\d.]+ logins/s, [\d.]+ logins/s per core \(iterations 1000\)",
+        )
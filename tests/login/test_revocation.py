@@ -0,0 +1,177 @@
+from datetime import timedelta
+from io import StringIO
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+from login.models import RevokedToken
+from login.revocation import revocation_list
+from users.models import User
+
+
+class TestTokenRevocation(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.profile_url = reverse("profile")
+        cls.logout_url = reverse("auth_logout")
+        cls.refresh_url = reverse("auth_refresh")
+
+        cls.user = User.objects.create_user(
+            username="user", email="user@example.com", password="12345"
+        )
+        User.objects.create_user(
+            username="other", email="other@example.com", password="12345"
+        )
+
+    def setUp(self) -> None:
+        revocation_list.clear()
+        self.tokens = self.login("user")
+
+    def login(self, username: str) -> dict:
+        return self.client.post(
+            path=reverse("auth"), data={"username": username, "password": "12345"}
+        ).data
+
+    def get_profile(self, access: str):
+        return self.client.get(
+            path=self.profile_url, headers={"Authorization": "Bearer " + access}
+        )
+
+    def logout(self, data: dict = None):
+        return self.client.post(
+            path=self.logout_url,
+            data=data or {},
+            headers={"Authorization": "Bearer " + self.tokens["access"]},
+        )
+
+    def test_logout_revokes_access_token(self):
+        response = self.logout()
+
+        self.assertEqual(response.status_code, 204)
+        response = self.get_profile(self.tokens["access"])
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.data["detail"], "Token has been revoked.")
+
+    def test_logout_revokes_refresh_token(self):
+        self.logout({"refresh": self.tokens["refresh"]})
+
+        response = self.client.post(
+            path=self.refresh_url, data={"refresh": self.tokens["refresh"]}
+        )
+
+        self.assertEqual(response.status_code, 401)
+
+    def test_cant_logout_refresh_token_of_other_user(self):
+        other_tokens = self.login("other")
+
+        response = self.logout({"refresh": other_tokens["refresh"]})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data["refresh"], ["Token belongs to another user."])
+        self.assertFalse(RevokedToken.objects.exists())
+
+    def test_other_tokens_stay_valid_after_logout(self):
+        other_session = self.login("user")
+
+        self.logout()
+
+        self.assertEqual(self.get_profile(other_session["access"]).status_code, 200)
+
+    def test_password_change_revokes_earlier_tokens(self):
+        self.user.set_password("54321")
+        self.user.save()
+
+        self.assertEqual(self.get_profile(self.tokens["access"]).status_code, 401)
+        response = self.client.post(
+            path=self.refresh_url, data={"refresh": self.tokens["refresh"]}
+        )
+        self.assertEqual(response.status_code, 401)
+
+    def test_login_right_after_password_change_is_not_revoked(self):
+        self.user.set_password("54321")
+        self.user.save()
+
+        tokens = self.client.post(
+            path=reverse("auth"), data={"username": "user", "password": "54321"}
+        ).data
+
+        self.assertEqual(self.get_profile(tokens["access"]).status_code, 200)
+
+    def test_tokens_issued_in_the_revocation_second_are_revoked(self):
+        self.user.set_password("54321")
+        self.user.save()
+        revoked_at = RevokedToken.objects.get(jti__isnull=True).revoked_at
+        # Tokens minted without a sub-second "iat" only carry whole seconds.
+        token = AccessToken.for_user(self.user)
+        token["iat"] = int(revoked_at.timestamp())
+
+        self.assertTrue(revocation_list.is_revoked(token))
+        tokens = self.client.post(
+            path=reverse("auth"), data={"username": "user", "password": "54321"}
+        ).data
+        self.assertFalse(revocation_list.is_revoked(AccessToken(tokens["access"])))
+
+    def test_revocations_from_other_processes_are_synced(self):
+        token = AccessToken(self.tokens["access"])
+        revocation_list.sync(force=True)
+        RevokedToken.objects.create(
+            jti=token["jti"], user=self.user, expires_at=timezone.now() + timedelta(1)
+        )
+
+        self.assertEqual(self.get_profile(self.tokens["access"]).status_code, 200)
+
+        revocation_list.sync(force=True)
+        self.assertEqual(self.get_profile(self.tokens["access"]).status_code, 401)
+
+    def test_unrevoked_tokens_are_checked_without_queries(self):
+        self.logout()
+        token = AccessToken(self.login("user")["access"])
+        revocation_list.sync(force=True)
+
+        with self.assertNumQueries(0):
+            self.assertFalse(revocation_list.is_revoked(token))
+
+    def test_prune_revoked_tokens_command(self):
+        RevokedToken.objects.create(
+            jti="expired", expires_at=timezone.now() - timedelta(seconds=1)
+        )
+        RevokedToken.objects.create(
+            jti="active", expires_at=timezone.now() + timedelta(minutes=1)
+        )
+        output = StringIO()
+
+        call_command("prune_revoked_tokens", stdout=output)
+
+        self.assertIn("Deleted 1 expired revocations.", output.getvalue())
+        self.assertEqual(
+            list(RevokedToken.objects.values_list("jti", flat=True)), ["active"]
+        )
+
+    def test_demoting_admin_revokes_earlier_tokens(self):
+        admin = User.objects.create_superuser(
+            username="admin", email="admin@example.com", password="12345"
+        )
+        access = self.login("admin")["access"]
+
+        admin.is_staff = admin.is_superuser = False
+        admin.save()
+
+        response = self.client.get(
+            path=reverse("users"), headers={"Authorization": "Bearer " + access}
+        )
+        self.assertEqual(response.status_code, 401)
+
+    def test_deactivating_user_revokes_earlier_tokens(self):
+        user = User.objects.get(pk=self.user.pk)
+        user.is_active = False
+        user.save(update_fields=["is_active"])
+
+        self.assertEqual(self.get_profile(self.tokens["access"]).status_code, 401)
+
+    def test_saves_that_keep_privileges_do_not_revoke(self):
+        user = User.objects.only("id", "first_name").get(pk=self.user.pk)
+        user.first_name = "Maria"
+        user.save()
+
+        self.assertFalse(RevokedToken.objects.exists())
@@ -0,0 +1,198 @@
+import threading
+from io import StringIO
+from unittest.mock import patch
+from django.core.management import call_command
+from django.db import connection
+from django.test import TransactionTestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from login.throttling import (
+    DatabaseBucketStore,
+    LocalMemoryBucketStore,
+    get_bucket_store,
+)
+from users.models import User
+
+RATES = {"login_ip": "10/min", "login_username": "3/min", "register_ip": "2/hour"}
+
+
+@override_settings(LOGIN_THROTTLE_RATES=RATES)
+class TestLoginThrottling(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.login_url = reverse("auth")
+        User.objects.create_user(
+            username="user", email="user@example.com", password="12345"
+        )
+
+    def setUp(self) -> None:
+        get_bucket_store().clear()
+
+    def login(self, username: str = "user", password: str = "wrong", ip="10.0.0.1"):
+        return self.client.post(
+            path=self.login_url,
+            data={"username": username, "password": password},
+            REMOTE_ADDR=ip,
+        )
+
+    def test_username_is_throttled_before_the_password_is_hashed(self):
+        with patch(
+            "django.contrib.auth.backends.ModelBackend.authenticate",
+            return_value=None,
+        ) as authenticate:
+            responses = [self.login() for _ in range(4)]
+
+        self.assertEqual(
+            [response.status_code for response in responses], [401, 401, 401, 429]
+        )
+        self.assertEqual(authenticate.call_count, 3)
+        self.assertIn("Retry-After", responses[-1].headers)
+
+    def test_username_throttle_ignores_case_and_ip(self):
+        for index in range(3):
+            self.login(ip=f"10.0.0.{index}")
+
+        response = self.login(username=" USER ", ip="10.0.0.9")
+
+        self.assertEqual(response.status_code, 429)
+
+    def test_other_usernames_are_not_throttled(self):
+        for _ in range(3):
+            self.login()
+
+        response = self.login(username="user", password="12345", ip="10.0.0.2")
+        self.assertEqual(response.status_code, 429)
+        response = self.login(username="other", ip="10.0.0.2")
+        self.assertEqual(response.status_code, 401)
+
+    def test_ip_is_throttled_across_usernames(self):
+        responses = [self.login(username=f"user{i}") for i in range(11)]
+
+        self.assertEqual(responses[9].status_code, 401)
+        self.assertEqual(responses[10].status_code, 429)
+
+    def test_spoofed_forwarded_for_does_not_escape_the_ip_throttle(self):
+        responses = [
+            self.client.post(
+                path=self.login_url,
+                data={"username": f"user{i}", "password": "wrong"},
+                REMOTE_ADDR="10.0.0.1",
+                HTTP_X_FORWARDED_FOR=f"1.1.1.{i}",
+            )
+            for i in range(11)
+        ]
+
+        self.assertEqual(responses[10].status_code, 429)
+
+    def test_registration_is_throttled_per_ip(self):
+        responses = [
+            self.client.post(
+                path=reverse("register"),
+                data={
+                    "username": f"new{i}",
+                    "email": f"new{i}@example.com",
+                    "password": "12345",
+                    "first_name": "New",
+                    "last_name": "User",
+                },
+                REMOTE_ADDR="10.0.0.1",
+            )
+            for i in range(3)
+        ]
+
+        self.assertEqual(
+            [response.status_code for response in responses], [201, 201, 429]
+        )
+        self.assertFalse(User.objects.filter(username="new2").exists())
+
+    @override_settings(LOGIN_THROTTLE_STORE="locmem")
+    def test_local_memory_store(self):
+        get_bucket_store().clear()
+
+        statuses = [self.login().status_code for _ in range(4)]
+
+        self.assertEqual(statuses, [401, 401, 401, 429])
+
+
+class TestBucketStores(APITestCase):
+    def test_buckets_refill_over_time(self):
+        for store in (LocalMemoryBucketStore(), DatabaseBucketStore()):
+            with self.subTest(store=type(store).__name__):
+                with patch("time.monotonic", return_value=100.0), patch(
+                    "time.time", return_value=100.0
+                ):
+                    self.assertEqual(store.consume("key", 2, 1)[0], True)
+                    self.assertEqual(store.consume("key", 2, 1)[0], True)
+                    allowed, wait = store.consume("key", 2, 1)
+                    self.assertFalse(allowed)
+                    self.assertEqual(wait, 1)
+
+                with patch("time.monotonic", return_value=101.0), patch(
+                    "time.time", return_value=101.0
+                ):
+                    self.assertEqual(store.consume("key", 2, 1)[0], True)
+                    self.assertEqual(store.consume("key", 2, 1)[0], False)
+
+
+    def test_pruning_keeps_buckets_of_slower_scopes(self):
+        store = LocalMemoryBucketStore()
+        store.max_buckets = 2
+
+        with patch("time.monotonic", return_value=100.0):
+            store.consume("register_ip:10.0.0.1", 10, 10 / 3600)
+            store.consume("login_username:a", 5, 5 / 60)
+        with patch("time.monotonic", return_value=200.0):
+            store.consume("login_username:b", 5, 5 / 60)
+
+        self.assertEqual(
+            set(store._buckets), {"register_ip:10.0.0.1", "login_username:b"}
+        )
+
+    def test_store_never_grows_past_its_cap(self):
+        store = LocalMemoryBucketStore()
+        store.max_buckets = 3
+
+        with patch("time.monotonic", return_value=100.0):
+            for index in range(10):
+                store.consume(f"login_username:{index}", 5, 5 / 60)
+            # Recently used buckets are kept over older ones.
+            store.consume("login_username:7", 5, 5 / 60)
+            store.consume("login_username:10", 5, 5 / 60)
+
+        self.assertEqual(
+            list(store._buckets),
+            ["login_username:9", "login_username:7", "login_username:10"],
+        )
+
+
+class TestConcurrentDatabaseBuckets(TransactionTestCase):
+    def test_concurrent_requests_never_share_a_token(self):
+        store = DatabaseBucketStore()
+        results = []
+        barrier = threading.Barrier(20)
+
+        def attempt():
+            barrier.wait()
+            try:
+                results.append(store.consume("login_username:user", 5, 0.001)[0])
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=attempt) for _ in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results.count(True), 5)
+
+    def test_prune_throttle_buckets_command(self):
+        store = DatabaseBucketStore()
+        with patch("time.time", return_value=0.0):
+            store.consume("idle", 5, 1)
+        store.consume("active", 5, 1)
+        output = StringIO()
+
+        call_command("prune_throttle_buckets", stdout=output)
+
+        self.assertIn("Deleted 1 idle throttle buckets.", output.getvalue())
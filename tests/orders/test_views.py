@@ -0,0 +1,207 @@
+import threading
+from django.core.cache import cache
+from django.db import connection
+from django.test import TransactionTestCase
+from django.urls import reverse
+from rest_framework.test import APIClient, APITestCase
+from address.models import Address
+from cart.models import Cart, CartItem
+from orders.models import Order
+from products.models import Product
+from users.models import User
+
+ADDRESS_DATA = {
+    "state": "SC",
+    "city": "Florianópolis",
+    "neighbourhood": "Jardim Atlantico",
+    "street": "Luis Carlos Prestes",
+    "zip_code": "88090250",
+    "number": 172,
+    "complement": "Casa",
+}
+
+
+class TestOrderCheckout(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.checkout_url = reverse("orders_checkout")
+        cls.orders_url = reverse("orders")
+
+        cls.user = User.objects.create_user(
+            username="user", email="user@example.com", password="12345"
+        )
+        cls.other = User.objects.create_user(
+            username="other", email="other@example.com", password="12345"
+        )
+        cls.token = (
+            cls.client_class()
+            .post(path=reverse("auth"), data={"username": "user", "password": "12345"})
+            .data["access"]
+        )
+        cls.other_token = (
+            cls.client_class()
+            .post(path=reverse("auth"), data={"username": "other", "password": "12345"})
+            .data["access"]
+        )
+        cls.address = Address.objects.create(**ADDRESS_DATA, user=cls.user)
+
+        cls.ball = Product.objects.create(
+            name="Bola",
+            description="Bola oficial",
+            price=100,
+            slug="bola",
+            stock=5,
+            discount=10,
+        )
+        cls.shirt = Product.objects.create(
+            name="Camisa",
+            description="Camisa azul",
+            price=59.90,
+            slug="camisa",
+            stock=3,
+        )
+
+    def setUp(self) -> None:
+        cache.clear()
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + self.token)
+        self.cart = Cart.objects.create(user=self.user)
+        CartItem.objects.create(cart=self.cart, product=self.ball, quantity=2)
+        CartItem.objects.create(cart=self.cart, product=self.shirt, quantity=1)
+
+    def checkout(self, key: str = None):
+        headers = {"Idempotency-Key": key} if key is not None else {}
+        return self.client.post(path=self.checkout_url, headers=headers)
+
+    def test_checkout_creates_order_from_cart(self):
+        response = self.checkout()
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data["subtotal"], "259.90")
+        self.assertEqual(response.data["discount_total"], "20.00")
+        self.assertEqual(response.data["total"], "239.90")
+        self.assertEqual(response.data["city"], "Florianópolis")
+        self.assertEqual(
+            [(item["slug"], item["quantity"]) for item in response.data["items"]],
+            [("bola", 2), ("camisa", 1)],
+        )
+        self.assertEqual(response.data["items"][0]["final_unit_price"], "90.00")
+
+        self.ball.refresh_from_db()
+        self.shirt.refresh_from_db()
+        self.assertEqual((self.ball.stock, self.shirt.stock), (3, 2))
+        self.assertFalse(CartItem.objects.filter(cart=self.cart).exists())
+
+    def test_order_keeps_snapshot_after_changes(self):
+        order_id = self.checkout().data["id"]
+
+        self.ball.price = 500
+        self.ball.save()
+        self.address.city = "Curitiba"
+        self.address.save()
+
+        response = self.client.get(reverse("order_details", kwargs={"pk": order_id}))
+        self.assertEqual(response.data["total"], "239.90")
+        self.assertEqual(response.data["items"][0]["unit_price"], "100.00")
+        self.assertEqual(response.data["city"], "Florianópolis")
+
+    def test_repeated_idempotency_key_returns_the_same_order(self):
+        first = self.checkout("checkout-1")
+        CartItem.objects.create(cart=self.cart, product=self.ball, quantity=1)
+        retry = self.checkout("checkout-1")
+
+        self.assertEqual(first.status_code, 201)
+        self.assertEqual(retry.status_code, 200)
+        self.assertEqual(retry.data, first.data)
+        self.assertEqual(Order.objects.count(), 1)
+        self.ball.refresh_from_db()
+        self.assertEqual(self.ball.stock, 3)
+
+    def test_idempotency_keys_are_scoped_per_user(self):
+        self.checkout("checkout-1")
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + self.other_token)
+
+        response = self.checkout("checkout-1")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data["cart"], ["Cart is empty."])
+
+    def test_too_long_idempotency_key_returns_400(self):
+        response = self.checkout("k" * 256)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(Order.objects.exists())
+
+    def test_insufficient_stock_rolls_back_checkout(self):
+        CartItem.objects.filter(product=self.shirt).update(quantity=4)
+
+        response = self.checkout()
+
+        self.assertEqual(response.status_code, 409)
+        self.assertFalse(Order.objects.exists())
+        self.ball.refresh_from_db()
+        self.assertEqual(self.ball.stock, 5)
+        self.assertEqual(CartItem.objects.filter(cart=self.cart).count(), 2)
+
+    def test_checkout_requires_address(self):
+        self.address.delete()
+
+        response = self.checkout()
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("address", response.data)
+        self.assertFalse(Order.objects.exists())
+
+    def test_users_only_see_their_orders(self):
+        order_id = self.checkout().data["id"]
+
+        self.assertEqual(len(self.client.get(self.orders_url).data), 1)
+
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + self.other_token)
+        self.assertEqual(self.client.get(self.orders_url).data, [])
+        response = self.client.get(reverse("order_details", kwargs={"pk": order_id}))
+        self.assertEqual(response.status_code, 404)
+
+
+class TestConcurrentCheckout(TransactionTestCase):
+    def test_concurrent_retries_create_one_order(self):
+        user = User.objects.create_user(
+            username="user", email="user@example.com", password="12345"
+        )
+        Address.objects.create(**ADDRESS_DATA, user=user)
+        product = Product.objects.create(
+            name="Bola", description="Bola oficial", price=100, slug="bola", stock=5
+        )
+        cart = Cart.objects.create(user=user)
+        CartItem.objects.create(cart=cart, product=product, quantity=1)
+
+        token = (
+            APIClient()
+            .post(path=reverse("auth"), data={"username": "user", "password": "12345"})
+            .data["access"]
+        )
+        statuses = []
+        barrier = threading.Barrier(8)
+
+        def retry():
+            client = APIClient()
+            client.credentials(HTTP_AUTHORIZATION="Bearer " + token)
+            barrier.wait()
+            try:
+                response = client.post(
+                    path=reverse("orders_checkout"),
+                    headers={"Idempotency-Key": "checkout-1"},
+                )
+                statuses.append(response.status_code)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=retry) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(sorted(statuses), [200] * 7 + [201])
+        self.assertEqual(Order.objects.count(), 1)
+        product.refresh_from_db()
+        self.assertEqual(product.stock, 4)
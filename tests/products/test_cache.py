@@ -0,0 +1,103 @@
+import tempfile
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from products.cache import get_catalog_version, get_pricing_version
+from products.stock import decrement_stock
+from products.models import Category, ImageProduct, Product
+
+
+class TestProductCache(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.catalog_products_url = reverse("products_catalog")
+
+        cls.product = Product.objects.create(
+            name="Product Cached",
+            description="This is a cached product",
+            price=199.90,
+            slug="product_cached",
+            stock=99,
+            discount=0,
+        )
+        ImageProduct.objects.create(product=cls.product)
+
+        cls.product_details_url = reverse(
+            "product_details", kwargs={"slug": cls.product.slug}
+        )
+
+    def setUp(self) -> None:
+        cache.clear()
+
+    def test_catalog_is_served_from_cache(self):
+        first_response = self.client.get(path=self.catalog_products_url)
+
+        with self.assertNumQueries(1):
+            second_response = self.client.get(path=self.catalog_products_url)
+
+        self.assertEqual(second_response.status_code, 200)
+        self.assertEqual(first_response.content, second_response.content)
+
+    def test_product_detail_is_served_from_cache(self):
+        self.client.get(path=self.product_details_url)
+
+        with self.assertNumQueries(1):
+            response = self.client.get(path=self.product_details_url)
+
+        self.assertEqual(response.json()["slug"], self.product.slug)
+
+    def test_product_write_invalidates_cached_responses(self):
+        self.client.get(path=self.product_details_url)
+
+        self.product.name = "Product renamed"
+        self.product.save()
+
+        response = self.client.get(path=self.product_details_url)
+
+        self.assertEqual(response.json()["name"], "Product renamed")
+
+    def test_category_write_bumps_catalog_version(self):
+        version = get_catalog_version()
+
+        category = Category.objects.create(name="Calçados")
+        category.products.add(self.product)
+
+        self.assertGreater(get_catalog_version(), version)
+
+    def test_product_detail_reflects_stock_changes(self):
+        self.client.get(path=self.product_details_url)
+
+        decrement_stock({self.product.pk: 1})
+        self.assertEqual(
+            self.client.get(path=self.product_details_url).json()["stock"], 98
+        )
+
+        self.product.stock = 0
+        self.product.save(update_fields=["stock"])
+        self.assertEqual(
+            self.client.get(path=self.product_details_url).json()["stock"], 0
+        )
+
+    def test_sales_keep_pricing_version(self):
+        version = get_pricing_version()
+
+        decrement_stock({self.product.pk: 1})
+
+        self.assertEqual(get_pricing_version(), version)
+
+    def test_catalog_is_cached_with_file_backend(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            file_cache = {
+                "default": {
+                    "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+                    "LOCATION": cache_dir,
+                }
+            }
+            with override_settings(CACHES=file_cache):
+                first_response = self.client.get(path=self.catalog_products_url)
+
+                with self.assertNumQueries(1):
+                    second_response = self.client.get(path=self.catalog_products_url)
+
+        self.assertEqual(first_response.content, second_response.content)
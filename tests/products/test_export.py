@@ -0,0 +1,118 @@
+import csv
+import json
+from io import StringIO
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from products.exporter import export_rows
+from products.models import Category, ImageProduct, Product
+from users.models import User
+
+
+class TestProductExport(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.export_url = reverse("products_export")
+
+        User.objects.create_user(
+            username="admin",
+            email="admin@example.com",
+            password="12345",
+            is_staff=True,
+            is_superuser=True,
+        )
+        User.objects.create_user(
+            username="user", email="user@example.com", password="12345"
+        )
+        cls.admin_token = (
+            cls.client_class()
+            .post(path=reverse("auth"), data={"username": "admin", "password": "12345"})
+            .data["access"]
+        )
+        cls.user_token = (
+            cls.client_class()
+            .post(path=reverse("auth"), data={"username": "user", "password": "12345"})
+            .data["access"]
+        )
+
+        category = Category.objects.create(name="Futebol")
+        cls.products = []
+        for index in range(5):
+            product = Product.objects.create(
+                name=f"Produto {index}",
+                description=f"Descrição, do produto {index}",
+                price="10.50",
+                slug=f"produto-{index}",
+                stock=index,
+            )
+            ImageProduct.objects.create(product=product, is_primary=True)
+            category.products.add(product)
+            cls.products.append(product)
+
+    def export(self, output: str, token: str = None):
+        return self.client.get(
+            path=self.export_url,
+            data={"output": output},
+            headers={"Authorization": "Bearer " + (token or self.admin_token)},
+        )
+
+    def test_can_export_products_as_csv(self):
+        response = self.export("csv")
+        content = b"".join(response.streaming_content).decode()
+        rows = list(csv.DictReader(StringIO(content)))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "text/csv")
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(rows[0]["description"], "Descrição, do produto 0")
+        self.assertEqual(rows[0]["categories"], "Futebol")
+
+    def test_can_export_products_as_ndjson(self):
+        response = self.export("ndjson")
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        first = json.loads(lines[0])
+
+        self.assertEqual(len(lines), 5)
+        self.assertEqual(first["slug"], "produto-0")
+        self.assertEqual(first["price"], "10.50")
+
+    def test_cant_export_products_if_common_user(self):
+        response = self.export("csv", token=self.user_token)
+
+        self.assertEqual(response.status_code, 403)
+
+    def test_cant_export_products_if_staff_but_not_superuser(self):
+        User.objects.create_user(
+            username="staff", email="staff@example.com", password="12345", is_staff=True
+        )
+        token = self.client.post(
+            path=reverse("auth"), data={"username": "staff", "password": "12345"}
+        ).data["access"]
+
+        response = self.export("csv", token=token)
+
+        self.assertEqual(response.status_code, 403)
+
+    def test_cant_export_products_if_not_authenticated(self):
+        response = self.client.get(path=self.export_url, data={"output": "csv"})
+
+        self.assertEqual(response.status_code, 401)
+
+    def test_cant_export_unsupported_format(self):
+        response = self.export("xml")
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_export_loads_images_and_categories_per_chunk(self):
+        # Products stream from a single server-side cursor; each chunk of two
+        # adds one query for its images and one for its categories.
+        with self.assertNumQueries(7):
+            rows = list(export_rows(chunk_size=2))
+
+        self.assertEqual([row["slug"] for row in rows], [p.slug for p in self.products])
+
+    def test_can_export_products_with_management_command(self):
+        stdout = StringIO()
+        call_command("export_products", format="csv", stdout=stdout)
+
+        self.assertEqual(len(stdout.getvalue().splitlines()), 6)
@@ -0,0 +1,143 @@
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from products.models import Category, ImageProduct, Product
+
+
+@override_settings(PRODUCTS_PRICE_BUCKETS=[50, 100])
+class TestCatalogFilters(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.catalog_products_url = reverse("products_catalog")
+
+        products_data = [
+            ("bola-futebol", 39.90, 10, 0),
+            ("chuteira", 89.90, 0, 15),
+            ("camisa-time", 149.90, 3, 30),
+            ("meia-esportiva", 19.90, 50, 5),
+        ]
+        cls.products = {}
+        for slug, price, stock, discount in products_data:
+            cls.products[slug] = Product.objects.create(
+                name=slug.replace("-", " ").title(),
+                description=f"Produto {slug}",
+                price=price,
+                slug=slug,
+                stock=stock,
+                discount=discount,
+            )
+            ImageProduct.objects.create(product=cls.products[slug], is_primary=True)
+
+        futebol = Category.objects.create(name="Futebol")
+        futebol.products.add(
+            cls.products["bola-futebol"],
+            cls.products["chuteira"],
+            cls.products["camisa-time"],
+        )
+        vestuario = Category.objects.create(name="Vestuario")
+        vestuario.products.add(
+            cls.products["camisa-time"], cls.products["meia-esportiva"]
+        )
+
+    def setUp(self) -> None:
+        cache.clear()
+
+    def slugs(self, response) -> list:
+        return [product["slug"] for product in response.data["results"]]
+
+    def test_can_filter_catalog_by_category(self):
+        response = self.client.get(
+            path=self.catalog_products_url, data={"category": "futebol"}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            self.slugs(response), ["bola-futebol", "chuteira", "camisa-time"]
+        )
+
+    def test_can_filter_catalog_by_price_discount_and_stock(self):
+        response = self.client.get(
+            path=self.catalog_products_url,
+            data={"min_price": "30", "max_price": "150", "in_stock": "true"},
+        )
+        self.assertEqual(self.slugs(response), ["bola-futebol", "camisa-time"])
+
+        response = self.client.get(
+            path=self.catalog_products_url, data={"min_discount": 10}
+        )
+        self.assertEqual(self.slugs(response), ["chuteira", "camisa-time"])
+
+    def test_catalog_returns_facets_for_filtered_products(self):
+        response = self.client.get(
+            path=self.catalog_products_url, data={"in_stock": "true"}
+        )
+
+        self.assertEqual(
+            response.data["facets"],
+            {
+                "categories": [
+                    {"name": "Futebol", "count": 2},
+                    {"name": "Vestuario", "count": 2},
+                ],
+                "price": [
+                    {"min": None, "max": 50, "count": 2},
+                    {"min": 50, "max": 100, "count": 0},
+                    {"min": 100, "max": None, "count": 1},
+                ],
+            },
+        )
+
+    def test_filters_are_kept_in_cursor_links(self):
+        response = self.client.get(
+            path=self.catalog_products_url, data={"category": "futebol", "page_size": 2}
+        )
+        response = self.client.get(path=response.data["next"])
+
+        self.assertEqual(self.slugs(response), ["camisa-time"])
+
+    def test_cant_filter_catalog_with_invalid_values(self):
+        response = self.client.get(
+            path=self.catalog_products_url,
+            data={"min_price": "cheap", "in_stock": "maybe"},
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data, {"min_price": ["A valid number is required."]})
+
+    def test_can_filter_catalog_by_final_price(self):
+        response = self.client.get(
+            path=self.catalog_products_url,
+            data={"min_final_price": "50", "max_final_price": "110"},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.slugs(response), ["chuteira", "camisa-time"])
+        self.assertEqual(
+            [product["final_price"] for product in response.data["results"]],
+            ["76.42", "104.93"],
+        )
+
+    def test_can_order_catalog_by_final_price_descending(self):
+        response = self.client.get(
+            path=self.catalog_products_url,
+            data={"ordering": "-final_price", "page_size": 2},
+        )
+        self.assertEqual(self.slugs(response), ["camisa-time", "chuteira"])
+
+        response = self.client.get(path=response.data["next"])
+        self.assertEqual(self.slugs(response), ["bola-futebol", "meia-esportiva"])
+        self.assertIsNone(response.data["next"])
+
+        response = self.client.get(path=response.data["previous"])
+        self.assertEqual(self.slugs(response), ["camisa-time", "chuteira"])
+
+    def test_cant_order_catalog_by_unknown_field(self):
+        response = self.client.get(
+            path=self.catalog_products_url, data={"ordering": "stock"}
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.data, {"ordering": ["Must be one of: price, final_price."]}
+        )
@@ -0,0 +1,186 @@
+import json
+import os
+import tempfile
+from io import StringIO
+from unittest.mock import patch
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import DataError
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from products.models import Category, ImageProduct, Product
+from users.models import User
+
+
+class TestProductImport(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.import_url = reverse("products_import")
+
+        User.objects.create_user(
+            username="admin",
+            email="admin@example.com",
+            password="12345",
+            is_staff=True,
+            is_superuser=True,
+        )
+        User.objects.create_user(
+            username="user", email="user@example.com", password="12345"
+        )
+        cls.admin_token = (
+            cls.client_class()
+            .post(path=reverse("auth"), data={"username": "admin", "password": "12345"})
+            .data["access"]
+        )
+        cls.user_token = (
+            cls.client_class()
+            .post(path=reverse("auth"), data={"username": "user", "password": "12345"})
+            .data["access"]
+        )
+
+        cls.existing = Product.objects.create(
+            name="Bola de Futebol",
+            description="Bola oficial",
+            price=99.90,
+            slug="bola-futebol",
+            stock=5,
+        )
+        ImageProduct.objects.create(product=cls.existing, is_primary=True)
+        Category.objects.create(name="Futebol")
+
+    def post_file(self, name: str, content: str, token: str = None):
+        return self.client.post(
+            path=self.import_url,
+            data={"file": SimpleUploadedFile(name, content.encode(), "text/csv")},
+            format="multipart",
+            headers={"Authorization": "Bearer " + (token or self.admin_token)},
+        )
+
+    def test_can_import_products_from_csv(self):
+        content = (
+            "name,description,price,stock,discount,slug,categories\n"
+            "Bola de Futebol,Bola oficial da liga,89.90,12,10,bola-futebol,futebol\n"
+            'Chuteira,"Chuteira de campo, cano baixo",249.90,3,0,chuteira,Futebol\n'
+            "Meia,Meia esportiva,invalid,7,0,meia,\n"
+        )
+        response = self.post_file("products.csv", content)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["created"], 1)
+        self.assertEqual(response.data["updated"], 1)
+        self.assertEqual(response.data["errors"][0]["line"], 4)
+        self.assertIn("price", response.data["errors"][0]["errors"])
+
+        self.existing.refresh_from_db()
+        self.assertEqual(self.existing.stock, 12)
+        self.assertEqual(str(self.existing.price), "89.90")
+        self.assertEqual(str(self.existing.final_price), "80.91")
+
+        chuteira = Product.objects.get(slug="chuteira")
+        self.assertEqual(chuteira.description, "Chuteira de campo, cano baixo")
+        self.assertTrue(ImageProduct.objects.filter(product=chuteira).exists())
+        self.assertEqual(
+            list(chuteira.products.values_list("name", flat=True)), ["Futebol"]
+        )
+        self.assertEqual(ImageProduct.objects.filter(product=self.existing).count(), 1)
+
+    def test_cant_import_products_if_common_user(self):
+        response = self.post_file("products.csv", "name\n", token=self.user_token)
+
+        self.assertEqual(response.status_code, 403)
+
+    def test_cant_import_unsupported_file_format(self):
+        response = self.post_file("products.xml", "<products/>")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("file_format", response.data)
+
+    def test_rows_with_discount_above_100_are_rejected(self):
+        content = (
+            "name,description,price,stock,discount,slug\n"
+            "Chuteira,Chuteira de campo,100.00,3,150,chuteira\n"
+        )
+
+        response = self.post_file("products.csv", content)
+
+        self.assertEqual(response.data["created"], 0)
+        self.assertEqual(response.data["errors"][0]["line"], 2)
+        self.assertIn("discount", response.data["errors"][0]["errors"])
+
+    def test_cant_import_file_not_encoded_as_utf8(self):
+        response = self.client.post(
+            path=self.import_url,
+            data={
+                "file": SimpleUploadedFile(
+                    "products.csv",
+                    "name,slug\nCal\u00e7ado,calcado\n".encode("latin-1"),
+                    "text/csv",
+                )
+            },
+            format="multipart",
+            headers={"Authorization": "Bearer " + self.admin_token},
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("file", response.data)
+
+    def test_rows_rejected_by_the_database_do_not_abort_their_batch(self):
+        rows = [
+            {
+                "name": f"Produto {index}",
+                "description": "Importado",
+                "price": "10.00",
+                "stock": 1,
+                "slug": f"produto-{index}",
+            }
+            for index in range(3)
+        ]
+        content = "\n".join(json.dumps(row) for row in rows) + "\n"
+
+        def update_search_vectors(product_ids):
+            if Product.objects.filter(pk__in=product_ids, slug="produto-1").exists():
+                raise DataError("value rejected")
+
+        with patch(
+            "products.importer.update_search_vectors",
+            side_effect=update_search_vectors,
+        ):
+            response = self.post_file("products.jsonl", content)
+
+        self.assertEqual(response.data["created"], 2)
+        self.assertEqual(
+            response.data["errors"],
+            [{"line": 2, "errors": {"detail": ["value rejected"]}}],
+        )
+        self.assertQuerySetEqual(
+            Product.objects.filter(slug__startswith="produto-").order_by("slug"),
+            ["produto-0", "produto-2"],
+            transform=lambda product: product.slug,
+        )
+
+    def test_can_import_products_with_management_command(self):
+        rows = [
+            {
+                "name": f"Produto {index}",
+                "description": "Importado",
+                "price": "10.00",
+                "stock": index,
+                "slug": f"produto-{index}",
+            }
+            for index in range(5)
+        ]
+        content = "\n".join(json.dumps(row) for row in rows) + "\nnot json\n"
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "products.jsonl")
+            with open(path, "w") as file:
+                file.write(content)
+
+            stdout, stderr = StringIO(), StringIO()
+            call_command(
+                "import_products", path, batch_size=2, stdout=stdout, stderr=stderr
+            )
+
+        self.assertIn("5 created, 0 updated, 1 rejected.", stdout.getvalue())
+        self.assertIn("Line 6", stderr.getvalue())
+        self.assertEqual(Product.objects.filter(slug__startswith="produto-").count(), 5)
@@ -1,3 +1,5 @@
+from decimal import Decimal
+from django.db import IntegrityError, transaction
 from django.test import TestCase
 from products.models import Product, Category, ImageProduct
 
@@ -48,3 +50,16 @@ class TestProduct(TestCase):
             image_default,
             "https://res.cloudinary.com/dnkw0zu2x/image/upload/v1688328201/django_commerce/no-photo.png",
         )
+
+    def test_final_price_applies_discount_on_save(self):
+        self.assertEqual(self.product_mock.final_price, Decimal("199.90"))
+
+        self.product_mock.discount = 15
+        self.product_mock.save(update_fields=["discount"])
+        self.product_mock.refresh_from_db()
+
+        self.assertEqual(self.product_mock.final_price, Decimal("169.92"))
+
+    def test_database_rejects_discount_above_100(self):
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            Product.objects.filter(pk=self.product_mock.pk).update(discount=150)
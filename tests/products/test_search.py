@@ -0,0 +1,109 @@
+from types import SimpleNamespace
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from products.models import Category, ImageProduct, Product
+from products.search import fallback_search
+
+
+class TestProductSearch(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.search_url = reverse("products_search")
+
+        cls.running_shoe = Product.objects.create(
+            name="Tenis Nike Race",
+            description="Tenis confortavel para voce correr",
+            price=199.90,
+            slug="tenis-nike-race",
+            stock=10,
+        )
+        cls.backpack = Product.objects.create(
+            name="Mochila Esportiva",
+            description="Cabe o seu tenis de corrida",
+            price=149.90,
+            slug="mochila-esportiva",
+            stock=5,
+        )
+        cls.bottle = Product.objects.create(
+            name="Garrafa Termica",
+            description="Mantem a agua gelada",
+            price=59.90,
+            slug="garrafa-termica",
+            stock=20,
+        )
+        for product in (cls.running_shoe, cls.backpack, cls.bottle):
+            ImageProduct.objects.create(product=product, is_primary=True)
+
+        cls.category = Category.objects.create(name="Hidratacao")
+        cls.category.products.add(cls.bottle)
+
+    def setUp(self) -> None:
+        cache.clear()
+
+    def search(self, query: str, **params):
+        return self.client.get(path=self.search_url, data={"q": query, **params})
+
+    def test_can_search_products_by_name_prefix(self):
+        response = self.search("nik")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [product["slug"] for product in response.data["results"]],
+            [self.running_shoe.slug],
+        )
+
+    def test_name_matches_rank_above_description_matches(self):
+        response = self.search("tenis")
+
+        self.assertEqual(
+            [product["slug"] for product in response.data["results"]],
+            [self.running_shoe.slug, self.backpack.slug],
+        )
+
+    def test_can_search_products_by_category_name(self):
+        response = self.search("hidrat")
+
+        self.assertEqual(response.data["count"], 1)
+        self.assertEqual(response.data["results"][0]["slug"], self.bottle.slug)
+
+    def test_search_reflects_renamed_products(self):
+        self.bottle.name = "Squeeze Termico"
+        self.bottle.save()
+
+        response = self.search("squeeze")
+
+        self.assertEqual(response.data["count"], 1)
+
+    def test_can_paginate_search_results(self):
+        response = self.search("tenis", page_size=1)
+
+        self.assertEqual(response.data["count"], 2)
+        self.assertEqual(len(response.data["results"]), 1)
+        self.assertIsNotNone(response.data["next"])
+
+    def test_cant_search_without_query(self):
+        response = self.search("   ")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data, {"q": ["This field is required."]})
+
+    def test_fallback_search_matches_and_ranks_substrings(self):
+        products = fallback_search(Product.objects.all(), ["tenis"])
+
+        self.assertEqual(list(products), [self.running_shoe, self.backpack])
+        self.assertEqual(
+            list(fallback_search(Product.objects.all(), ["hidratacao"])),
+            [self.bottle],
+        )
+
+    def test_search_index_is_skipped_on_other_databases(self):
+        index = next(
+            index
+            for index in Product._meta.indexes
+            if index.name == "product_search_vector_idx"
+        )
+        schema_editor = SimpleNamespace(connection=SimpleNamespace(vendor="sqlite"))
+
+        self.assertEqual(index.create_sql(Product, schema_editor), "")
+        self.assertEqual(index.remove_sql(Product, schema_editor), "")
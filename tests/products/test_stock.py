@@ -0,0 +1,379 @@
+import threading
+from datetime import timedelta
+from io import StringIO
+from django.core.management import call_command
+from django.db import connection
+from django.test import TransactionTestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from products.models import Product, StockReservation
+from products.serializers import ProductSerializer
+from products.stock import (
+    InsufficientStock,
+    available_stock,
+    decrement_stock,
+    release_expired_reservations,
+    reserve_stock,
+)
+from users.models import User
+
+
+class TestStockDecrement(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.decrement_url = reverse("products_stock_decrement")
+
+        User.objects.create_user(
+            username="admin",
+            email="admin@example.com",
+            password="12345",
+            is_staff=True,
+            is_superuser=True,
+        )
+        User.objects.create_user(
+            username="user", email="user@example.com", password="12345"
+        )
+        cls.admin_token = (
+            cls.client_class()
+            .post(path=reverse("auth"), data={"username": "admin", "password": "12345"})
+            .data["access"]
+        )
+        cls.user_token = (
+            cls.client_class()
+            .post(path=reverse("auth"), data={"username": "user", "password": "12345"})
+            .data["access"]
+        )
+
+        cls.ball = Product.objects.create(
+            name="Bola", description="Bola oficial", price=99.90, slug="bola", stock=5
+        )
+        cls.shirt = Product.objects.create(
+            name="Camisa",
+            description="Camisa azul",
+            price=59.90,
+            slug="camisa",
+            stock=2,
+        )
+
+    def decrement(self, items: list, token: str = None):
+        return self.client.post(
+            path=self.decrement_url,
+            data={"items": items},
+            format="json",
+            headers={"Authorization": "Bearer " + (token or self.admin_token)},
+        )
+
+    def test_can_decrement_several_products(self):
+        response = self.decrement(
+            [{"slug": "bola", "quantity": 2}, {"slug": "camisa", "quantity": 2}]
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.data["items"],
+            [{"slug": "bola", "stock": 3}, {"slug": "camisa", "stock": 0}],
+        )
+
+    def test_repeated_slugs_are_summed(self):
+        response = self.decrement(
+            [{"slug": "bola", "quantity": 2}, {"slug": "bola", "quantity": 3}]
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["items"], [{"slug": "bola", "stock": 0}])
+
+    def test_insufficient_stock_decrements_nothing(self):
+        response = self.decrement(
+            [{"slug": "bola", "quantity": 1}, {"slug": "camisa", "quantity": 3}]
+        )
+
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(
+            response.data["detail"], "Insufficient stock for product camisa."
+        )
+        self.ball.refresh_from_db()
+        self.shirt.refresh_from_db()
+        self.assertEqual((self.ball.stock, self.shirt.stock), (5, 2))
+
+    def test_product_update_keeps_concurrent_decrement(self):
+        # The admin loaded the product before the sale committed.
+        stale_ball = Product.objects.get(pk=self.ball.pk)
+        decrement_stock({self.ball.pk: 3})
+
+        serializer = ProductSerializer(stale_ball, {"name": "Bola Nova"}, partial=True)
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+
+        self.ball.refresh_from_db()
+        self.assertEqual(self.ball.name, "Bola Nova")
+        self.assertEqual(self.ball.stock, 2)
+
+    def test_unknown_product_returns_404(self):
+        response = self.decrement([{"slug": "raquete", "quantity": 1}])
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_invalid_quantity_returns_400(self):
+        response = self.decrement([{"slug": "bola", "quantity": 0}])
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("items", response.data)
+
+    def test_common_user_cannot_decrement_stock(self):
+        response = self.decrement(
+            [{"slug": "bola", "quantity": 1}], token=self.user_token
+        )
+
+        self.assertEqual(response.status_code, 403)
+
+
+class TestStockReservation(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.reservations_url = reverse("products_stock_reservations")
+
+        cls.user = User.objects.create_user(
+            username="user", email="user@example.com", password="12345"
+        )
+        cls.other = User.objects.create_user(
+            username="other", email="other@example.com", password="12345"
+        )
+        cls.token = (
+            cls.client_class()
+            .post(path=reverse("auth"), data={"username": "user", "password": "12345"})
+            .data["access"]
+        )
+
+        cls.ball = Product.objects.create(
+            name="Bola", description="Bola oficial", price=99.90, slug="bola", stock=5
+        )
+
+    def setUp(self) -> None:
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + self.token)
+
+    def reserve(self, quantity: int):
+        return self.client.post(
+            path=self.reservations_url,
+            data={"items": [{"slug": "bola", "quantity": quantity}]},
+            format="json",
+        )
+
+    def test_can_reserve_stock(self):
+        response = self.reserve(3)
+
+        self.assertEqual(response.status_code, 201)
+        reservation = response.data["reservations"][0]
+        self.assertEqual(reservation["slug"], "bola")
+        self.assertEqual(reservation["quantity"], 3)
+        self.ball.refresh_from_db()
+        self.assertEqual(self.ball.stock, 5)
+        self.assertEqual(available_stock([self.ball.id]), {self.ball.id: 2})
+
+    def test_cannot_reserve_more_than_available(self):
+        reserve_stock(self.other.id, {self.ball.id: 4})
+
+        response = self.reserve(2)
+
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(StockReservation.objects.count(), 1)
+
+    def test_expired_reservations_do_not_hold_stock(self):
+        reserve_stock(self.other.id, {self.ball.id: 5}, ttl=-1)
+
+        self.assertEqual(available_stock([self.ball.id]), {self.ball.id: 5})
+        self.assertEqual(self.reserve(5).status_code, 201)
+
+    def test_available_stock_is_one_query(self):
+        reserve_stock(self.other.id, {self.ball.id: 2})
+        shirt = Product.objects.create(
+            name="Camisa",
+            description="Camisa azul",
+            price=59.90,
+            slug="camisa",
+            stock=3,
+        )
+
+        with self.assertNumQueries(1):
+            available = available_stock([self.ball.id, shirt.id])
+
+        self.assertEqual(available, {self.ball.id: 3, shirt.id: 3})
+
+    def test_decrement_respects_reservations_of_other_users(self):
+        reserve_stock(self.other.id, {self.ball.id: 4})
+
+        with self.assertRaises(InsufficientStock):
+            decrement_stock({self.ball.id: 2}, user_id=self.user.id)
+        decrement_stock({self.ball.id: 1}, user_id=self.user.id)
+
+        self.ball.refresh_from_db()
+        self.assertEqual(self.ball.stock, 4)
+
+    def test_decrement_consumes_own_reservations(self):
+        reserve_stock(self.user.id, {self.ball.id: 4})
+
+        decrement_stock({self.ball.id: 4}, user_id=self.user.id)
+
+        self.ball.refresh_from_db()
+        self.assertEqual(self.ball.stock, 1)
+        self.assertFalse(StockReservation.objects.exists())
+
+    def test_decrement_releases_only_the_quantity_bought(self):
+        reserve_stock(self.user.id, {self.ball.id: 4})
+
+        decrement_stock({self.ball.id: 1}, user_id=self.user.id)
+
+        self.assertEqual(StockReservation.objects.get().quantity, 3)
+        self.assertEqual(available_stock([self.ball.id]), {self.ball.id: 1})
+
+    @override_settings(STOCK_RESERVATION_MAX_QUANTITY=3)
+    def test_cannot_hold_more_than_the_quantity_cap(self):
+        self.assertEqual(self.reserve(2).status_code, 201)
+
+        response = self.reserve(2)
+
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(StockReservation.objects.count(), 1)
+
+    @override_settings(STOCK_RESERVATION_MAX_ACTIVE=1)
+    def test_cannot_hold_more_than_the_product_cap(self):
+        Product.objects.create(
+            name="Camisa",
+            description="Camisa azul",
+            price=59.90,
+            slug="camisa",
+            stock=3,
+        )
+        self.assertEqual(self.reserve(1).status_code, 201)
+
+        response = self.client.post(
+            path=self.reservations_url,
+            data={"items": [{"slug": "camisa", "quantity": 1}]},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(StockReservation.objects.count(), 1)
+
+    def test_can_release_own_reservation(self):
+        reservation_id = self.reserve(2).data["reservations"][0]["id"]
+        url = reverse("products_stock_reservation", kwargs={"pk": reservation_id})
+
+        self.assertEqual(self.client.delete(url).status_code, 204)
+        self.assertFalse(StockReservation.objects.exists())
+
+    def test_cannot_release_reservation_of_other_user(self):
+        (reservation,) = reserve_stock(self.other.id, {self.ball.id: 1})
+        url = reverse("products_stock_reservation", kwargs={"pk": reservation.id})
+
+        self.assertEqual(self.client.delete(url).status_code, 404)
+
+    def test_anonymous_user_cannot_reserve(self):
+        self.client.credentials()
+
+        self.assertEqual(self.reserve(1).status_code, 401)
+
+    def test_sweeper_releases_expired_reservations_in_batches(self):
+        now = timezone.now()
+        StockReservation.objects.bulk_create(
+            [
+                StockReservation(
+                    product=self.ball,
+                    user=self.user,
+                    quantity=1,
+                    expires_at=now - timedelta(minutes=i + 1),
+                )
+                for i in range(5)
+            ]
+        )
+        (active,) = reserve_stock(self.other.id, {self.ball.id: 1})
+
+        self.assertEqual(release_expired_reservations(batch_size=2), 5)
+        self.assertEqual(list(StockReservation.objects.all()), [active])
+
+    def test_release_reservations_command(self):
+        reserve_stock(self.user.id, {self.ball.id: 1}, ttl=-1)
+        output = StringIO()
+
+        call_command("release_reservations", stdout=output)
+
+        self.assertIn("Released 1 expired reservations.", output.getvalue())
+        self.assertFalse(StockReservation.objects.exists())
+
+
+class TestConcurrentStockDecrement(TransactionTestCase):
+    def test_concurrent_decrements_never_oversell(self):
+        product = Product.objects.create(
+            name="Bola", description="Bola oficial", price=99.90, slug="bola", stock=10
+        )
+        other = Product.objects.create(
+            name="Camisa",
+            description="Camisa azul",
+            price=59.90,
+            slug="camisa",
+            stock=30,
+        )
+        sold, rejected = [], []
+        barrier = threading.Barrier(25)
+
+        def buy(index: int):
+            # Alternate the order the products are listed in, so overlapping
+            # transactions would deadlock if rows were not locked in id order.
+            if index % 2:
+                quantities = {product.id: 1, other.id: 1}
+            else:
+                quantities = {other.id: 1, product.id: 1}
+            barrier.wait()
+            try:
+                decrement_stock(quantities)
+                sold.append(index)
+            except InsufficientStock:
+                rejected.append(index)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=buy, args=(i,)) for i in range(25)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        product.refresh_from_db()
+        other.refresh_from_db()
+        self.assertEqual(len(sold), 10)
+        self.assertEqual(len(rejected), 15)
+        self.assertEqual(product.stock, 0)
+        self.assertEqual(other.stock, 20)
+
+    def test_concurrent_reservations_never_over_reserve(self):
+        product = Product.objects.create(
+            name="Bola", description="Bola oficial", price=99.90, slug="bola", stock=10
+        )
+        users = [
+            User.objects.create_user(
+                username=f"user{i}", email=f"user{i}@example.com", password="12345"
+            )
+            for i in range(20)
+        ]
+        reserved, rejected = [], []
+        barrier = threading.Barrier(len(users))
+
+        def hold(user: User):
+            barrier.wait()
+            try:
+                reserve_stock(user.id, {product.id: 1})
+                reserved.append(user.id)
+            except InsufficientStock:
+                rejected.append(user.id)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=hold, args=(user,)) for user in users]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(reserved), 10)
+        self.assertEqual(len(rejected), 10)
+        self.assertEqual(available_stock([product.id]), {product.id: 0})
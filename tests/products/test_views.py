@@ -1,9 +1,20 @@
+import threading
+from base64 import b64encode
+from unittest.mock import patch
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.db import connection
+from django.test import TransactionTestCase, override_settings
 from rest_framework.test import APITestCase, APIClient
 from django.urls import reverse
-from products.models import ImageProduct, Product
+from login.revocation import revocation_list
+from products.models import Category, ImageProduct, Product
+from products.tasks import release_images, upload_product_image
 from django.core.files.uploadedfile import SimpleUploadedFile
 import os
+import tempfile
 from users.models import User
+from utils.image_storage import StoredImage
 
 
 class TestProductViews(APITestCase):
@@ -115,6 +126,9 @@ class TestProductViews(APITestCase):
                 # "image": cls.image_file,
             }
 
+    def setUp(self) -> None:
+        cache.clear()
+
             
 
         
@@ -222,6 +236,20 @@ class TestProductViews(APITestCase):
         self.assertEqual(response.data, expected_response)
         
 
+    def test_cant_create_product_with_discount_above_100(self):
+        response = self.client.post(
+            path=self.product_create_url,
+            data={**self.product_data_static, "discount": 150},
+            format="multipart",
+            headers={"Authorization": "Bearer " + self.admin_token},
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.data["discount"],
+            ["Ensure this value is less than or equal to 100."],
+        )
+
     def test_cant_create_product_if_already_existing(self):
         
         product = {
@@ -269,12 +297,353 @@ class TestProductViews(APITestCase):
         
         
 
+    @override_settings(BACKGROUND_TASKS_EAGER=True)
+    def test_can_create_product_with_image_uploaded_in_background(self):
+        stored_image = StoredImage(
+            "uploaded", "https://res.cloudinary.com/test/image/upload/uploaded.png"
+        )
+        placeholder_url = ImageProduct._meta.get_field("image_url").default
+
+        with open(self.image_path, "rb") as f:
+            image = SimpleUploadedFile("test_image.png", f.read(), "image/png")
+
+        with patch(
+            "products.tasks.upload_image", return_value=stored_image
+        ) as upload_image:
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.client.post(
+                    path=self.product_create_url,
+                    data={**self.product_data_static, "image": image},
+                    format="multipart",
+                    headers={"Authorization": "Bearer " + self.admin_token},
+                )
+
+                self.assertEqual(response.status_code, 201)
+                self.assertEqual(response.data["image_url"], placeholder_url)
+                upload_image.assert_not_called()
+
+        image_product = ImageProduct.objects.get(product__id=response.data["id"])
+        self.assertEqual(image_product.image_url, stored_image.url)
+        self.assertEqual(image_product.storage_key, stored_image.key)
+
+    @override_settings(BACKGROUND_TASKS_EAGER=True)
+    def test_can_see_image_variants_after_upload(self):
+        with open(self.image_path, "rb") as f:
+            image = SimpleUploadedFile("test_image.png", f.read(), "image/png")
+
+        with tempfile.TemporaryDirectory() as media_root, override_settings(
+            MEDIA_ROOT=media_root,
+            IMAGE_STORAGE={"BACKEND": "utils.image_storage.LocalImageStorage"},
+        ):
+            with self.captureOnCommitCallbacks(execute=True):
+                self.client.patch(
+                    path=self.product_has_been_created_url,
+                    data={"image": image},
+                    format="multipart",
+                    headers={"Authorization": "Bearer " + self.admin_token},
+                )
+
+            response = self.client.get(path=self.product_has_been_created_url)
+
+        image_variants = response.data["image_variants"]
+        self.assertEqual(set(image_variants), {"thumbnail", "card", "full"})
+        self.assertTrue(image_variants["thumbnail"].endswith(".webp"))
+        self.assertNotEqual(image_variants["thumbnail"], response.data["image_url"])
+
+    @override_settings(BACKGROUND_TASKS_EAGER=True, FILE_UPLOAD_MAX_MEMORY_SIZE=0)
+    def test_can_upload_image_spooled_to_disk_after_request_ends(self):
+        with open(self.image_path, "rb") as f:
+            content = f.read()
+        image = SimpleUploadedFile("test_image.png", content, "image/png")
+
+        with tempfile.TemporaryDirectory() as media_root, override_settings(
+            MEDIA_ROOT=media_root,
+            IMAGE_STORAGE={"BACKEND": "utils.image_storage.LocalImageStorage"},
+        ):
+            # The callbacks run once the response has closed the upload.
+            with self.captureOnCommitCallbacks(execute=True):
+                self.client.patch(
+                    path=self.product_has_been_created_url,
+                    data={"image": image},
+                    format="multipart",
+                    headers={"Authorization": "Bearer " + self.admin_token},
+                )
+
+            image_product = ImageProduct.objects.filter(
+                product=self.products[0]
+            ).first()
+            with open(
+                os.path.join(media_root, "products", image_product.storage_key), "rb"
+            ) as stored:
+                self.assertEqual(stored.read(), content)
+
+    @override_settings(BACKGROUND_TASKS_EAGER=True)
+    def test_can_create_product_with_image_gallery(self):
+        with open(self.image_path, "rb") as f:
+            content = f.read()
+        images = [
+            SimpleUploadedFile(f"gallery_{index}.png", content, "image/png")
+            for index in range(3)
+        ]
+        stored_images = [
+            StoredImage(f"gallery_{index}", f"https://example.com/gallery_{index}.png")
+            for index in range(3)
+        ]
+
+        with patch(
+            "products.tasks.upload_image", side_effect=stored_images
+        ), patch("products.tasks.generate_variants", return_value={}):
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.client.post(
+                    path=self.product_create_url,
+                    data={**self.product_data_static, "images": images},
+                    format="multipart",
+                    headers={"Authorization": "Bearer " + self.admin_token},
+                )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(
+            [
+                (image["position"], image["is_primary"])
+                for image in response.data["images"]
+            ],
+            [(0, True), (1, False), (2, False)],
+        )
+
+        response = self.client.get(
+            path=reverse("product_details", kwargs={"slug": response.data["slug"]})
+        )
+
+        self.assertEqual(response.data["image_url"], stored_images[0].url)
+        self.assertEqual(
+            [image["image_url"] for image in response.data["images"]],
+            [stored_image.url for stored_image in stored_images],
+        )
+
+    def test_can_create_product_with_categories(self):
+        Category.objects.bulk_create(
+            [
+                Category(name="Corrida"),
+                Category(name="Calçados"),
+                Category(name="Promo"),
+            ]
+        )
+        # Keeps the periodic revocation sync out of the counted request.
+        revocation_list.sync(force=True)
+
+        with self.assertNumQueries(14):
+            response = self.client.post(
+                path=self.product_create_url,
+                data={
+                    **self.product_data_static,
+                    "category_1": "corrida",
+                    "category_2": "CALÇADOS",
+                    "category_3": "Inexistente",
+                },
+                format="multipart",
+                headers={"Authorization": "Bearer " + self.admin_token},
+            )
+
+        product = Product.objects.get(slug=response.data["slug"])
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(
+            sorted(product.products.values_list("name", flat=True)),
+            ["Calçados", "Corrida"],
+        )
+
+    def test_product_detail_reflects_stock_patch(self):
+        self.assertEqual(
+            self.client.get(self.product_has_been_created_url).data["stock"],
+            self.products[0].stock,
+        )
+
+        self.client.patch(
+            path=self.product_has_been_created_url,
+            data={"stock": 0},
+            format="multipart",
+            headers={"Authorization": "Bearer " + self.admin_token},
+        )
+        response = self.client.get(self.product_has_been_created_url)
+
+        self.assertEqual(response.json()["stock"], 0)
+
+    def test_catalog_reflects_categories_assigned_on_update(self):
+        Category.objects.create(name="Esporte")
+        filtered = {"category": "esporte"}
+        self.assertEqual(
+            self.client.get(self.catalog_products_url, filtered).data["results"], []
+        )
+
+        self.client.patch(
+            path=self.product_has_been_created_url,
+            data={"category_1": "Esporte"},
+            format="multipart",
+            headers={"Authorization": "Bearer " + self.admin_token},
+        )
+        response = self.client.get(self.catalog_products_url, filtered)
+
+        self.assertEqual(
+            [product["slug"] for product in response.data["results"]],
+            [self.products[0].slug],
+        )
+
     def test_can_see_catalog_products(self):
         response = self.client.get(path=self.catalog_products_url)
 
         self.assertEqual(response.status_code, 200)
-        self.assertIsInstance(response.data, list)
+        self.assertIsInstance(response.data["results"], list)
+        self.assertIsNone(response.data["next"])
+        self.assertIsNone(response.data["previous"])
+
+    def test_can_paginate_catalog_products_with_cursor(self):
+        Product.objects.filter(slug=self.products[0].slug).update(price="99.90")
 
+        response = self.client.get(
+            path=self.catalog_products_url, data={"page_size": 2}
+        )
+        first_page = [product["slug"] for product in response.data["results"]]
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(first_page, ["product_test_1", "product_test_2"])
+        self.assertIsNone(response.data["previous"])
+
+        Product.objects.create(
+            name="Product inserted while paging",
+            description="Cheaper than the current cursor",
+            price=9.90,
+            slug="product_inserted",
+            stock=1,
+        )
+
+        response = self.client.get(path=response.data["next"])
+        second_page = [product["slug"] for product in response.data["results"]]
+
+        self.assertEqual(second_page, ["product_test_3"])
+        self.assertIsNone(response.data["next"])
+
+        response = self.client.get(path=response.data["previous"])
+        previous_page = [product["slug"] for product in response.data["results"]]
+
+        self.assertEqual(previous_page, ["product_test_1", "product_test_2"])
+
+    def test_cant_paginate_catalog_with_invalid_cursor(self):
+        response = self.client.get(
+            path=self.catalog_products_url, data={"cursor": "invalid"}
+        )
+
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.data, {"detail": "Invalid cursor"})
+
+    def test_cant_paginate_catalog_with_non_numeric_cursor_value(self):
+        for value in ("abc", "NaN"):
+            cursor = b64encode(f"v={value}&i=1".encode("ascii")).decode("ascii")
+            response = self.client.get(
+                path=self.catalog_products_url, data={"cursor": cursor}
+            )
+
+            self.assertEqual(response.status_code, 404)
+            self.assertEqual(response.data, {"detail": "Invalid cursor"})
+
+    def test_catalog_query_count_does_not_grow_with_products(self):
+        with self.assertNumQueries(5):
+            self.client.get(path=self.catalog_products_url)
+
+        for product_id in range(4, 14):
+            product = Product.objects.create(
+                name=f"Product Test {product_id}",
+                description=f"This is a test product id {product_id}",
+                price=199.90,
+                slug=f"product_test_{product_id}",
+                stock=99,
+                discount=0,
+            )
+            ImageProduct.objects.create(product=product)
+
+        with self.assertNumQueries(5):
+            response = self.client.get(path=self.catalog_products_url)
+
+        self.assertEqual(len(response.data["results"]), 13)
+
+
+    def test_catalog_returns_not_modified_if_etag_matches(self):
+        response = self.client.get(path=self.catalog_products_url)
+
+        with self.assertNumQueries(1):
+            not_modified = self.client.get(
+                path=self.catalog_products_url,
+                headers={"If-None-Match": response.headers["ETag"]},
+            )
+
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified.content, b"")
+
+    def test_catalog_etag_changes_after_product_update(self):
+        response = self.client.get(path=self.catalog_products_url)
+
+        self.client.patch(
+            path=self.product_has_been_created_url,
+            data={"stock": 1},
+            format="multipart",
+            headers={"Authorization": "Bearer " + self.admin_token},
+        )
+        modified = self.client.get(
+            path=self.catalog_products_url,
+            headers={"If-None-Match": response.headers["ETag"]},
+        )
+
+        self.assertEqual(modified.status_code, 200)
+        self.assertNotEqual(modified.headers["ETag"], response.headers["ETag"])
+
+    def test_catalog_etag_changes_after_category_rename(self):
+        category = Category.objects.create(name="Futbol")
+        category.products.add(self.products[0])
+        response = self.client.get(path=self.catalog_products_url)
+
+        category.name = "Futebol"
+        category.save()
+        modified = self.client.get(
+            path=self.catalog_products_url,
+            headers={"If-None-Match": response.headers["ETag"]},
+        )
+
+        self.assertEqual(modified.status_code, 200)
+        self.assertNotEqual(modified.headers["ETag"], response.headers["ETag"])
+        self.assertEqual(
+            [facet["name"] for facet in modified.json()["facets"]["categories"]],
+            ["Futebol"],
+        )
+
+    def test_product_detail_returns_not_modified_if_unchanged(self):
+        response = self.client.get(path=self.product_has_been_created_url)
+
+        with self.assertNumQueries(1):
+            by_etag = self.client.get(
+                path=self.product_has_been_created_url,
+                headers={"If-None-Match": response.headers["ETag"]},
+            )
+        by_date = self.client.get(
+            path=self.product_has_been_created_url,
+            headers={"If-Modified-Since": response.headers["Last-Modified"]},
+        )
+
+        self.assertEqual(by_etag.status_code, 304)
+        self.assertEqual(by_date.status_code, 304)
+
+    def test_product_detail_etag_changes_after_image_update(self):
+        response = self.client.get(path=self.product_has_been_created_url)
+
+        image_product = ImageProduct.objects.get(product=self.products[0])
+        image_product.image_url = "https://example.com/new-image.png"
+        image_product.save()
+
+        modified = self.client.get(
+            path=self.product_has_been_created_url,
+            headers={"If-None-Match": response.headers["ETag"]},
+        )
+
+        self.assertEqual(modified.status_code, 200)
+        self.assertEqual(modified.json()["image_url"], image_product.image_url)
 
     def test_cant_see_product_detail_if_not_found(self):
         response = self.client.get(path=self.product_not_found_url)
@@ -398,6 +767,27 @@ class TestProductViews(APITestCase):
         self.assertContains(response, expected_response, status_code=403)
         
 
+    @override_settings(BACKGROUND_TASKS_EAGER=True)
+    def test_delete_product_keeps_images_shared_with_other_products(self):
+        ImageProduct.objects.filter(product__in=self.products[1:]).update(
+            storage_key="shared"
+        )
+
+        with patch("products.tasks.destroy_image") as destroy_image:
+            with self.captureOnCommitCallbacks(execute=True):
+                self.client.delete(
+                    path=self.product_has_been_created_url_03,
+                    headers={"Authorization": "Bearer " + self.admin_token},
+                )
+            destroy_image.assert_not_called()
+
+            with self.captureOnCommitCallbacks(execute=True):
+                self.client.delete(
+                    path=reverse("product_details", kwargs={"slug": "product_test_2"}),
+                    headers={"Authorization": "Bearer " + self.admin_token},
+                )
+            destroy_image.assert_called_once_with("shared")
+
     # def test_cant_delete_product_if_existing_orders(self):
     #     response = self.client.delete(
     #         path=self.product_has_been_created_url,
@@ -418,3 +808,48 @@ class TestProductViews(APITestCase):
 
         self.assertEqual(response.status_code, 204)
 
+
+class TestConcurrentImageRelease(TransactionTestCase):
+    def test_release_waits_for_upload_of_the_same_image(self):
+        product = Product.objects.create(
+            name="Bola", description="Bola oficial", price=99.90, slug="bola", stock=1
+        )
+        image_product = ImageProduct.objects.create(product=product)
+        uploading, resume = threading.Event(), threading.Event()
+
+        def upload_image(image):
+            # The stored file already exists, as for a deduplicated upload.
+            uploading.set()
+            resume.wait(5)
+            return StoredImage("shared", "https://images.test/shared.png")
+
+        def run(task, *args):
+            try:
+                task(*args)
+            finally:
+                connection.close()
+
+        with patch("products.tasks.upload_image", side_effect=upload_image), patch(
+            "products.tasks.generate_variants", return_value={}
+        ), patch("products.tasks.destroy_image") as destroy_image:
+            uploader = threading.Thread(
+                target=run,
+                args=(upload_product_image, image_product.pk, ContentFile(b"png")),
+            )
+            uploader.start()
+            uploading.wait(5)
+
+            releaser = threading.Thread(
+                target=run, args=(release_images, [("shared", {})])
+            )
+            releaser.start()
+            releaser.join(0.5)
+            self.assertTrue(releaser.is_alive())
+
+            resume.set()
+            uploader.join()
+            releaser.join()
+
+        destroy_image.assert_not_called()
+        image_product.refresh_from_db()
+        self.assertEqual(image_product.storage_key, "shared")
@@ -0,0 +1,111 @@
+from django.db import connection
+from django.http import QueryDict
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from login.revocation import revocation_list
+from users.filters import filter_users
+from users.models import User
+
+
+class TestListUsers(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.users_url = reverse("users")
+
+        cls.admin = User.objects.create_superuser(
+            username="Admin01", email="admin01@example.com", password="admin"
+        )
+        users_data = [
+            ("Maria", "maria.silva@example.com"),
+            ("mariana", "mariana@example.org"),
+            ("joao", "Joao.Souza@example.com"),
+            ("pedro", "pedro@maria.com"),
+        ]
+        for username, email in users_data:
+            User.objects.create_user(username=username, email=email, password="1234")
+
+        response = cls.client_class().post(
+            reverse("auth"),
+            {"username": "Admin01", "password": "admin"},
+            format="json",
+        )
+        cls.token_admin = response.data["access"]
+
+    def setUp(self) -> None:
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.token_admin}")
+
+    def usernames(self, response) -> list:
+        return [user["username"] for user in response.data["results"]]
+
+    def test_lists_users_with_lean_fields(self):
+        response = self.client.get(self.users_url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            set(response.data["results"][0]),
+            {"id", "first_name", "last_name", "username", "email", "is_superuser"},
+        )
+
+    @override_settings(USERS_PAGE_SIZE=2)
+    def test_paginates_users_by_cursor(self):
+        response = self.client.get(self.users_url)
+
+        self.assertEqual(self.usernames(response), ["Admin01", "Maria"])
+        self.assertIsNone(response.data["previous"])
+
+        response = self.client.get(response.data["next"])
+        self.assertEqual(self.usernames(response), ["mariana", "joao"])
+
+        response = self.client.get(response.data["next"])
+        self.assertEqual(self.usernames(response), ["pedro"])
+        self.assertIsNone(response.data["next"])
+
+    def test_filters_users_by_username_prefix_ignoring_case(self):
+        response = self.client.get(self.users_url, {"username": "MARI"})
+
+        self.assertEqual(self.usernames(response), ["Maria", "mariana"])
+
+    def test_filters_users_by_email_prefix_ignoring_case(self):
+        response = self.client.get(self.users_url, {"email": "joao."})
+
+        self.assertEqual(self.usernames(response), ["joao"])
+
+    def test_searches_username_or_email(self):
+        response = self.client.get(self.users_url, {"search": "Pedro"})
+        self.assertEqual(self.usernames(response), ["pedro"])
+
+        response = self.client.get(self.users_url, {"search": "maria"})
+        self.assertEqual(self.usernames(response), ["Maria", "mariana"])
+
+    def test_filters_users_by_is_superuser(self):
+        response = self.client.get(self.users_url, {"is_superuser": "true"})
+        self.assertEqual(self.usernames(response), ["Admin01"])
+
+        response = self.client.get(self.users_url, {"is_superuser": "false"})
+        self.assertNotIn("Admin01", self.usernames(response))
+
+    def test_rejects_invalid_boolean(self):
+        response = self.client.get(self.users_url, {"is_superuser": "maybe"})
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_lists_users_in_one_query_selecting_only_listed_columns(self):
+        revocation_list.sync(force=True)
+
+        with self.assertNumQueries(1) as context:
+            self.client.get(self.users_url, {"search": "maria"})
+
+        sql = context.captured_queries[0]["sql"]
+        self.assertNotIn('"password"', sql)
+        self.assertNotIn('"last_login"', sql)
+
+    def test_prefix_filters_use_lower_indexes(self):
+        queryset = filter_users(User.objects.all(), QueryDict("search=maria"))
+
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+            plan = queryset.explain()
+
+        self.assertIn("user_username_lower_idx", plan)
+        self.assertIn("user_email_lower_idx", plan)
@@ -0,0 +1,99 @@
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from address.models import Address
+from login.revocation import revocation_list
+from users.models import User
+
+
+class TestProfileView(APITestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.profile_url = reverse("profile")
+        cls.address_details_url = reverse("address_details")
+
+        cls.user = User.objects.create_user(
+            username="user01", email="user01@example.com", password="12345"
+        )
+        cls.address = Address.objects.create(
+            user=cls.user,
+            state="SP",
+            city="São Paulo",
+            street="Rua A",
+            zip_code="01000000",
+            complement="Apto 1",
+            neighbourhood="Centro",
+            number=10,
+        )
+        User.objects.create_user(
+            username="user02", email="user02@example.com", password="12345"
+        )
+
+    def setUp(self) -> None:
+        cache.clear()
+        revocation_list.sync(force=True)
+        self.login("user01")
+
+    def login(self, username: str) -> None:
+        response = self.client.post(
+            reverse("auth"), {"username": username, "password": "12345"}, format="json"
+        )
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {response.data['access']}")
+
+    def test_profile_embeds_address_in_one_query(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(self.profile_url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["username"], "user01")
+        self.assertEqual(response.data["address"]["id"], self.address.id)
+        self.assertEqual(response.data["address"]["city"], "São Paulo")
+
+    def test_profile_without_address(self):
+        self.login("user02")
+
+        response = self.client.get(self.profile_url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(response.data["address"])
+
+    def test_update_reuses_authenticated_user(self):
+        with self.assertNumQueries(3):
+            # Load the user, save it and read its address for the response.
+            response = self.client.patch(
+                self.profile_url, {"first_name": "Maria"}, format="json"
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["first_name"], "Maria")
+
+    @override_settings(PROFILE_CACHE_TTL=60)
+    def test_cached_profile_skips_the_database(self):
+        self.client.get(self.profile_url)
+
+        with self.assertNumQueries(0):
+            response = self.client.get(self.profile_url)
+
+        self.assertEqual(response.data["address"]["id"], self.address.id)
+
+    @override_settings(PROFILE_CACHE_TTL=60)
+    def test_profile_write_evicts_cached_profile(self):
+        self.client.get(self.profile_url)
+
+        self.client.patch(self.profile_url, {"first_name": "Maria"}, format="json")
+        response = self.client.get(self.profile_url)
+
+        self.assertEqual(response.data["first_name"], "Maria")
+
+    @override_settings(PROFILE_CACHE_TTL=60)
+    def test_address_write_evicts_cached_profile(self):
+        self.client.get(self.profile_url)
+
+        self.client.patch(self.address_details_url, {"number": 99}, format="json")
+        response = self.client.get(self.profile_url)
+        self.assertEqual(response.data["address"]["number"], 99)
+
+        self.client.delete(self.address_details_url)
+        response = self.client.get(self.profile_url)
+        self.assertIsNone(response.data["address"])
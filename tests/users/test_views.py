@@ -300,7 +300,7 @@ class TestUserViews(TestCase):
             path=self.users_url, headers={"Authorization": f"Bearer {self.token_admin}"}
         )
 
-        self.assertIsInstance(response.data, list)
+        self.assertIsInstance(response.data["results"], list)
         self.assertEqual(response.status_code, 200)
 
     def test_cant_see_profile_if_not_authenticated(self):
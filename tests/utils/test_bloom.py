@@ -0,0 +1,25 @@
+from django.test import SimpleTestCase
+from utils.bloom import BloomFilter
+
+
+class TestBloomFilter(SimpleTestCase):
+    def test_added_items_are_always_found(self):
+        bloom = BloomFilter(capacity=1000)
+        items = [f"token-{i}" for i in range(1000)]
+        for item in items:
+            bloom.add(item)
+
+        self.assertTrue(all(item in bloom for item in items))
+        self.assertEqual(bloom.count, 1000)
+
+    def test_false_positive_rate_stays_near_the_target(self):
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        for i in range(1000):
+            bloom.add(f"token-{i}")
+
+        false_positives = sum(f"other-{i}" in bloom for i in range(10000))
+
+        self.assertLess(false_positives, 300)
+
+    def test_empty_filter_contains_nothing(self):
+        self.assertNotIn("token", BloomFilter(capacity=10))
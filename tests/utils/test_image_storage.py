@@ -0,0 +1,103 @@
+import hashlib
+import os
+import tempfile
+from unittest.mock import patch
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import SimpleTestCase, override_settings
+from utils.image_storage import CloudinaryImageStorage, LocalImageStorage
+from utils.upload_images import destroy_image, upload_image
+
+
+class TestImageStorage(SimpleTestCase):
+    def setUp(self) -> None:
+        self.image_path = os.path.join(
+            os.path.dirname(__file__), "..", "images", "test_image.png"
+        )
+        with open(self.image_path, "rb") as f:
+            self.content = f.read()
+
+        self.digest = hashlib.sha256(self.content).hexdigest()
+        self.image = SimpleUploadedFile("test_image.png", self.content, "image/png")
+
+    def test_cloudinary_storage_streams_uploaded_file(self):
+        cloudinary_response = {
+            "public_id": self.digest,
+            "secure_url": f"https://example.com/{self.digest}.png",
+        }
+        with tempfile.TemporaryDirectory() as media_root:
+            with override_settings(MEDIA_ROOT=media_root), patch(
+                "utils.image_storage.uploader.upload", return_value=cloudinary_response
+            ) as upload:
+                stored_image = CloudinaryImageStorage().save(self.image)
+
+            files_written = sum(len(files) for _, _, files in os.walk(media_root))
+
+        upload.assert_called_once_with(
+            self.image, public_id=self.digest, overwrite=False, unique_filename=False
+        )
+        self.assertEqual(stored_image.key, self.digest)
+        self.assertEqual(stored_image.url, cloudinary_response["secure_url"])
+        self.assertEqual(files_written, 0)
+
+    def test_cloudinary_storage_deletes_by_stored_key(self):
+        with patch(
+            "utils.image_storage.uploader.destroy", return_value={"result": "ok"}
+        ) as destroy:
+            deleted = CloudinaryImageStorage().delete(self.digest)
+
+        self.assertTrue(deleted)
+        destroy.assert_called_once_with(self.digest)
+
+    def test_destroy_image_keeps_placeholder_image(self):
+        with patch("utils.image_storage.uploader.destroy") as destroy:
+            deleted = destroy_image("")
+
+        self.assertTrue(deleted)
+        destroy.assert_not_called()
+
+    def test_local_storage_writes_upload_once(self):
+        with tempfile.TemporaryDirectory() as location:
+            storage = LocalImageStorage(location=location, base_url="/media/test/")
+            stored_image = storage.save(self.image)
+
+            bytes_written = sum(
+                os.path.getsize(os.path.join(root, name))
+                for root, _, files in os.walk(location)
+                for name in files
+            )
+
+            self.assertEqual(stored_image.key, f"{self.digest[:2]}/{self.digest}.png")
+            self.assertEqual(stored_image.url, f"/media/test/{stored_image.key}")
+            self.assertEqual(bytes_written, len(self.content))
+
+            self.assertTrue(storage.delete(stored_image.key))
+            self.assertFalse(storage.storage.exists(stored_image.key))
+
+    def test_local_storage_deduplicates_identical_uploads(self):
+        duplicate = SimpleUploadedFile("copy.PNG", self.content, "image/png")
+
+        with tempfile.TemporaryDirectory() as location:
+            storage = LocalImageStorage(location=location)
+            first = storage.save(self.image)
+
+            with patch.object(storage.storage, "save") as save:
+                second = storage.save(duplicate)
+
+            save.assert_not_called()
+
+        self.assertEqual(first, second)
+
+    def test_upload_image_uses_configured_backend(self):
+        with tempfile.TemporaryDirectory() as media_root:
+            storage_settings = {"BACKEND": "utils.image_storage.LocalImageStorage"}
+            with override_settings(
+                MEDIA_ROOT=media_root, IMAGE_STORAGE=storage_settings
+            ):
+                stored_image = upload_image(self.image)
+
+            stored = os.path.exists(
+                os.path.join(media_root, "products", stored_image.key)
+            )
+
+        self.assertEqual(stored_image.url, f"/media/products/{stored_image.key}")
+        self.assertTrue(stored)
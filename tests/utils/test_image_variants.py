@@ -0,0 +1,37 @@
+import os
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import SimpleTestCase, override_settings
+from PIL import Image
+from utils.image_variants import generate_variants
+
+
+@override_settings(IMAGE_VARIANTS={"thumbnail": 160, "card": 480, "full": 1200})
+class TestImageVariants(SimpleTestCase):
+    def setUp(self) -> None:
+        image_path = os.path.join(
+            os.path.dirname(__file__), "..", "images", "test_image.png"
+        )
+        with open(image_path, "rb") as f:
+            self.image = SimpleUploadedFile("test_image.png", f.read(), "image/png")
+
+    def test_generates_every_configured_variant(self):
+        variants = generate_variants(self.image)
+
+        self.assertEqual(set(variants), {"thumbnail", "card", "full"})
+        self.assertEqual(variants["thumbnail"].name, "test_image-thumbnail.webp")
+
+        for name, max_size in (("thumbnail", 160), ("card", 480), ("full", 1200)):
+            with Image.open(variants[name]) as variant:
+                self.assertEqual(variant.format, "WEBP")
+                self.assertEqual(max(variant.size), max_size)
+
+    def test_variants_are_smaller_than_original(self):
+        variants = generate_variants(self.image)
+
+        self.assertLess(variants["thumbnail"].size, variants["card"].size)
+        self.assertLess(variants["full"].size, self.image.size)
+
+    def test_ignores_files_that_are_not_images(self):
+        not_an_image = SimpleUploadedFile("notes.png", b"not an image", "image/png")
+
+        self.assertEqual(generate_variants(not_an_image), {})
@@ -0,0 +1,54 @@
+from django.db.models import Q
+from django.db.models.functions import Lower
+from rest_framework import serializers
+
+from products.filters import FALSE_VALUES, TRUE_VALUES
+
+
+def _text_param(params, name: str):
+    value = params.get(name, "").strip()
+    return value.lower() or None
+
+
+def _boolean_param(params, name: str):
+    value = params.get(name)
+    if value in (None, ""):
+        return None
+    if value.lower() in TRUE_VALUES:
+        return True
+    if value.lower() in FALSE_VALUES:
+        return False
+    raise serializers.ValidationError({name: ["Must be a valid boolean."]})
+
+
+def filter_users(queryset, params):
+    """
+    Narrow the users by the ``username``, ``email``, ``search`` and
+    ``is_superuser`` query parameters.
+
+    Text parameters are case-insensitive prefix matches on ``LOWER(column)``,
+    which the functional ``text_pattern_ops`` indexes on ``User`` serve.
+    """
+    queryset = queryset.annotate(
+        lower_username=Lower("username"), lower_email=Lower("email")
+    )
+
+    username = _text_param(params, "username")
+    if username is not None:
+        queryset = queryset.filter(lower_username__startswith=username)
+
+    email = _text_param(params, "email")
+    if email is not None:
+        queryset = queryset.filter(lower_email__startswith=email)
+
+    search = _text_param(params, "search")
+    if search is not None:
+        queryset = queryset.filter(
+            Q(lower_username__startswith=search) | Q(lower_email__startswith=search)
+        )
+
+    is_superuser = _boolean_param(params, "is_superuser")
+    if is_superuser is not None:
+        queryset = queryset.filter(is_superuser=is_superuser)
+
+    return queryset
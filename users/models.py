@@ -1,9 +1,24 @@
 from django.contrib.auth.models import AbstractUser
+from django.contrib.postgres.indexes import OpClass
 from django.db import models
+from django.db.models.functions import Lower
 
 
 class User(AbstractUser):
     email = models.CharField(max_length=180, unique=True)
 
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            # Back the case-insensitive prefix filters of the admin listing.
+            models.Index(
+                OpClass(Lower("username"), name="text_pattern_ops"),
+                name="user_username_lower_idx",
+            ),
+            models.Index(
+                OpClass(Lower("email"), name="text_pattern_ops"),
+                name="user_email_lower_idx",
+            ),
+        ]
+
     def get_full_name(self):
         return f"{self.first_name} {self.last_name}"
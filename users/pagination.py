@@ -0,0 +1,23 @@
+from django.conf import settings
+from rest_framework.pagination import CursorPagination, _positive_int
+
+
+class UserCursorPagination(CursorPagination):
+    """
+    Keyset pagination over the primary key, so every page of the admin user
+    listing is a single index range scan however deep the client pages.
+    """
+
+    ordering = "id"
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+    def get_page_size(self, request):
+        try:
+            return _positive_int(
+                request.query_params[self.page_size_query_param],
+                strict=True,
+                cutoff=self.max_page_size,
+            )
+        except (KeyError, ValueError):
+            return settings.USERS_PAGE_SIZE
@@ -5,13 +5,20 @@ from users.models import User
 
 
 class IsAdmin(permissions.BasePermission):
+    # Endpoints that expose admin-only data on GET turn this off.
+    allow_safe_methods = True
+
     def has_permission(self, request, view: View):
-        if request.method in permissions.SAFE_METHODS:
+        if self.allow_safe_methods and request.method in permissions.SAFE_METHODS:
             return True
 
         return request.user.is_authenticated and request.user.is_superuser
 
 
+class IsAdminForAllMethods(IsAdmin):
+    allow_safe_methods = False
+
+
 class OnwerOrAdmin(permissions.BasePermission):
     def has_object_permission(self, request: Request, view: View, obj: User):
         return (
@@ -0,0 +1,34 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.shortcuts import get_object_or_404
+
+from users.models import User
+from users.serializers import ProfileSerializer
+
+
+def profile_cache_key(user_id) -> str:
+    return f"users:profile:{user_id}"
+
+
+def load_profile(user_id) -> User:
+    # The address comes in through the same query as the user.
+    return get_object_or_404(User.objects.select_related("address"), id=user_id)
+
+
+def cached_profile(user_id) -> dict:
+    """
+    Serialized profile of ``user_id`` with its address embedded.
+
+    With ``PROFILE_CACHE_TTL`` set the result is cached for that many
+    seconds; saving or deleting the user or its address evicts it.
+    """
+    timeout = settings.PROFILE_CACHE_TTL
+    if not timeout:
+        return ProfileSerializer(load_profile(user_id)).data
+
+    key = profile_cache_key(user_id)
+    profile = cache.get(key)
+    if profile is None:
+        profile = ProfileSerializer(load_profile(user_id)).data
+        cache.set(key, profile, timeout)
+    return profile
@@ -1,4 +1,5 @@
 from rest_framework import serializers
+from address.serializires import AddressSerializer
 from users.models import User
 
 
@@ -20,3 +21,24 @@ class UserSerializer(serializers.ModelSerializer):
             "is_superuser": {"read_only": True},
             "email": {"required": True},
         }
+
+
+class UserListSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = User
+        fields = [
+            "id",
+            "first_name",
+            "last_name",
+            "username",
+            "email",
+            "is_superuser",
+        ]
+        read_only_fields = fields
+
+
+class ProfileSerializer(UserSerializer):
+    address = AddressSerializer(read_only=True, allow_null=True)
+
+    class Meta(UserSerializer.Meta):
+        fields = UserSerializer.Meta.fields + ["address"]
@@ -0,0 +1,17 @@
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from address.models import Address
+from users.models import User
+from users.profile import profile_cache_key
+
+
+@receiver([post_save, post_delete], sender=User)
+def evict_cached_profile(sender, instance: User, **kwargs):
+    cache.delete(profile_cache_key(instance.id))
+
+
+@receiver([post_save, post_delete], sender=Address)
+def evict_cached_profile_address(sender, instance: Address, **kwargs):
+    cache.delete(profile_cache_key(instance.user_id))
@@ -1,12 +1,18 @@
 from rest_framework.views import APIView, Response, Request, status
 from rest_framework.generics import RetrieveUpdateDestroyAPIView, ListAPIView
 from rest_framework.permissions import IsAuthenticated, IsAdminUser
+from login.throttling import RegisterIPThrottle
+from users.filters import filter_users
+from users.pagination import UserCursorPagination
+from users.profile import cached_profile, load_profile
 from users.permissions import OnwerOrAdmin
 from users.models import User
-from users.serializers import UserSerializer
+from users.serializers import ProfileSerializer, UserListSerializer, UserSerializer
 
 
 class UserCreateView(APIView):
+    throttle_classes = [RegisterIPThrottle]
+
     def post(self, request: Request) -> Response:
         serializer = UserSerializer(data=request.data)
         if serializer.is_valid():
@@ -28,15 +34,25 @@ class UserDetailView(RetrieveUpdateDestroyAPIView):
 class ListUsersView(ListAPIView):
     permission_classes = [IsAuthenticated, IsAdminUser]
 
-    queryset = User.objects.all().order_by("id")
-    serializer_class = UserSerializer
+    serializer_class = UserListSerializer
+    pagination_class = UserCursorPagination
+
+    def get_queryset(self):
+        queryset = User.objects.only(*UserListSerializer.Meta.fields)
+        return filter_users(queryset, self.request.query_params)
 
 
 class ProfileView(RetrieveUpdateDestroyAPIView):
     permission_classes = [IsAuthenticated]
     queryset = User.objects.all()
-    serializer_class = UserSerializer
+    serializer_class = ProfileSerializer
 
     def get_object(self):
-        user = User.objects.get(id=self.request.user.id)
-        return user
+        # Writes are authenticated with the real user already loaded; reads
+        # only carry the token claims.
+        if isinstance(self.request.user, User):
+            return self.request.user
+        return load_profile(self.request.user.id)
+
+    def retrieve(self, request: Request, *args, **kwargs) -> Response:
+        return Response(cached_profile(request.user.id))
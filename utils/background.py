@@ -0,0 +1,45 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import connection
+
+logger = logging.getLogger(__name__)
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.BACKGROUND_TASK_WORKERS,
+                thread_name_prefix="background-task",
+            )
+    return _executor
+
+
+def _run(func, args, kwargs):
+    try:
+        func(*args, **kwargs)
+    except Exception:
+        logger.exception("Background task %s failed.", func.__name__)
+    finally:
+        # Worker threads open their own database connection; release it so
+        # idle workers do not hold connections open.
+        connection.close()
+
+
+def enqueue(func, *args, **kwargs):
+    """
+    Run ``func`` on the in-process worker pool.
+
+    With ``BACKGROUND_TASKS_EAGER`` enabled the task runs inline instead, which
+    keeps tests deterministic and lets errors propagate to the caller.
+    """
+    if settings.BACKGROUND_TASKS_EAGER:
+        return func(*args, **kwargs)
+    return _get_executor().submit(_run, func, args, kwargs)
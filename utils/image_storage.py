@@ -0,0 +1,95 @@
+import hashlib
+import os
+from typing import NamedTuple
+
+from cloudinary import uploader
+from django.conf import settings
+from django.core.files.storage import FileSystemStorage
+from django.utils.module_loading import import_string
+
+
+class StoredImage(NamedTuple):
+    key: str
+    url: str
+
+
+def content_digest(image) -> str:
+    digest = hashlib.sha256()
+    image.seek(0)
+    for chunk in image.chunks():
+        digest.update(chunk)
+    image.seek(0)
+    return digest.hexdigest()
+
+
+class ImageStorage:
+    """
+    Backend interface for product images.
+
+    ``save`` receives a Django ``File`` (an upload handed over by the request,
+    or a ``ContentFile``) and must stream it to its destination without
+    staging a copy on disk. The returned key is what ``delete`` expects, so
+    callers never have to derive it from the public URL.
+    """
+
+    def save(self, image) -> StoredImage:
+        raise NotImplementedError
+
+    def delete(self, key: str) -> bool:
+        raise NotImplementedError
+
+
+class CloudinaryImageStorage(ImageStorage):
+    def save(self, image) -> StoredImage:
+        # Using the content hash as public id makes Cloudinary keep a single
+        # asset for identical uploads instead of storing a new copy each time.
+        cloudinary_response = uploader.upload(
+            image,
+            public_id=content_digest(image),
+            overwrite=False,
+            unique_filename=False,
+        )
+        return StoredImage(
+            cloudinary_response["public_id"], cloudinary_response["secure_url"]
+        )
+
+    def delete(self, key: str) -> bool:
+        response = uploader.destroy(key)
+        return response["result"] in ("ok", "not found")
+
+
+class LocalImageStorage(ImageStorage):
+    """
+    Content-addressed store on the local filesystem.
+
+    Files are named after the SHA-256 of their content, so uploading an
+    asset that is already stored writes nothing.
+    """
+
+    def __init__(self, location=None, base_url=None):
+        self.storage = FileSystemStorage(
+            location=location or os.path.join(settings.MEDIA_ROOT, "products"),
+            base_url=base_url or f"{settings.MEDIA_URL}products/",
+        )
+
+    def save(self, image) -> StoredImage:
+        digest = content_digest(image)
+        extension = os.path.splitext(image.name)[1].lower()
+        key = f"{digest[:2]}/{digest}{extension}"
+
+        if not self.storage.exists(key):
+            name = self.storage.save(key, image)
+            if name != key:
+                # A concurrent upload of the same content won the race.
+                self.storage.delete(name)
+
+        return StoredImage(key, self.storage.url(key))
+
+    def delete(self, key: str) -> bool:
+        self.storage.delete(key)
+        return True
+
+
+def get_image_storage() -> ImageStorage:
+    backend = import_string(settings.IMAGE_STORAGE["BACKEND"])
+    return backend(**settings.IMAGE_STORAGE.get("OPTIONS", {}))
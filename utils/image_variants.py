@@ -0,0 +1,60 @@
+import io
+import os
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from PIL import Image, UnidentifiedImageError, features
+
+
+def _output_format(image: Image.Image) -> tuple:
+    if features.check("webp"):
+        return "WEBP", ".webp"
+    if image.mode == "RGBA":
+        return "PNG", ".png"
+    return "JPEG", ".jpg"
+
+
+def generate_variants(image) -> dict:
+    """
+    Resize ``image`` to every size in ``IMAGE_VARIANTS``.
+
+    Returns a mapping of variant name to ``ContentFile``; variants are never
+    upscaled, and files Pillow cannot decode produce no variants.
+    """
+    image.seek(0)
+    try:
+        source = Image.open(image)
+        source.load()
+    except (UnidentifiedImageError, OSError):
+        return {}
+    finally:
+        image.seek(0)
+
+    if source.mode not in ("RGB", "RGBA"):
+        source = source.convert("RGBA" if "transparency" in source.info else "RGB")
+
+    image_format, extension = _output_format(source)
+    stem = os.path.splitext(os.path.basename(image.name))[0]
+    variants = {}
+
+    # Resizing largest to smallest lets each variant start from the previous,
+    # already reduced, bitmap instead of the full-size original.
+    sizes = sorted(settings.IMAGE_VARIANTS.items(), key=lambda item: -item[1])
+    variant = source
+    for name, max_size in sizes:
+        variant = variant.copy()
+        variant.thumbnail((max_size, max_size), Image.LANCZOS)
+
+        output = variant
+        if image_format == "JPEG" and output.mode != "RGB":
+            output = output.convert("RGB")
+
+        buffer = io.BytesIO()
+        output.save(
+            buffer, format=image_format, quality=settings.IMAGE_VARIANT_QUALITY
+        )
+        variants[name] = ContentFile(
+            buffer.getvalue(), name=f"{stem}-{name}{extension}"
+        )
+
+    return variants